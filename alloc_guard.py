@@ -0,0 +1,133 @@
+"""
+Debug guard against per-frame Surface allocations.
+
+Once a game state has been steady for a while (same state for WARMUP_FRAMES
+frames), a frame should not need to create new Surfaces. While installed,
+the guard counts every pygame.Surface(...) construction and pygame.transform
+call together with its call site. Steady frames over the budget are reported
+with their allocating call sites, and report() lists the totals per site.
+
+Surfaces created inside pygame (Surface.copy/convert, font rendering,
+image loading) are not seen; only the Python-visible constructor and
+pygame.transform functions are wrapped.
+
+Opt-in (settings.ALLOC_GUARD or game.py --alloc-guard): install() replaces
+pygame.Surface and the pygame.transform functions module-wide.
+"""
+import os
+import sys
+from collections import Counter
+import pygame
+from settings import DEBUG_MODE
+
+_Surface = pygame.Surface
+TRANSFORMS = ('scale', 'scale_by', 'smoothscale', 'smoothscale_by', 'rotate', 'rotozoom',
+              'flip', 'chop', 'laplacian', 'average_surfaces')
+
+
+class AllocationGuard:
+    WARMUP_FRAMES = 120  # Frames in one state before its frames count as steady
+    MAX_PRINTED_FRAMES = 5  # Over-budget frames printed in full; later ones are only counted
+    TOP_SITES = 15
+
+    def __init__(self, budget=0, warmup_frames=None):
+        self.budget = budget
+        self.warmup_frames = self.WARMUP_FRAMES if warmup_frames is None else warmup_frames
+        self.installed = False
+        self.frame = Counter()  # (kind, site) -> calls this frame
+        self.totals = Counter()  # (kind, site) -> calls over all steady frames
+        self.steady_frames = 0
+        self.flagged_frames = 0
+        self._state = None
+        self._state_frames = 0
+        self._originals = {}
+
+    def _hit(self, kind):
+        code_frame = sys._getframe(2)
+        code = code_frame.f_code
+        site = f"{os.path.basename(code.co_filename)}:{code_frame.f_lineno} {code.co_name}"
+        self.frame[(kind, site)] += 1
+
+    def install(self):
+        """Wrap pygame.Surface and the pygame.transform functions with counting versions"""
+        if self.installed:
+            return
+        guard = self
+
+        class _SurfaceType(type):
+            # Surfaces made inside pygame are plain Surfaces; keep isinstance checks working
+            def __instancecheck__(cls, obj):
+                return isinstance(obj, _Surface)
+
+            def __subclasscheck__(cls, sub):
+                return issubclass(sub, _Surface)
+
+        class Surface(_Surface, metaclass=_SurfaceType):
+            def __init__(self, *args, **kwargs):
+                guard._hit('Surface')
+                super().__init__(*args, **kwargs)
+
+        def counting(name, func):
+            kind = f'transform.{name}'
+
+            def wrapper(*args, **kwargs):
+                guard._hit(kind)
+                return func(*args, **kwargs)
+            wrapper.__name__ = name
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+
+        self._originals = {'Surface': _Surface}
+        pygame.Surface = Surface
+        for name in TRANSFORMS:
+            func = getattr(pygame.transform, name, None)
+            if func is not None:
+                self._originals[name] = func
+                setattr(pygame.transform, name, counting(name, func))
+        self.installed = True
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        pygame.Surface = self._originals.pop('Surface')
+        for name, func in self._originals.items():
+            setattr(pygame.transform, name, func)
+        self._originals = {}
+        self.installed = False
+
+    def begin_frame(self):
+        self.frame.clear()
+
+    def end_frame(self, state, frame_index):
+        """Check the frame just finished; state is the game state it ran in"""
+        if not self.installed:
+            return
+        if state != self._state:
+            self._state = state
+            self._state_frames = 0
+        self._state_frames += 1
+        if self._state_frames <= self.warmup_frames:
+            return
+
+        self.steady_frames += 1
+        self.totals.update(self.frame)
+        count = sum(self.frame.values())
+        if count <= self.budget:
+            return
+        self.flagged_frames += 1
+        if DEBUG_MODE and self.flagged_frames <= self.MAX_PRINTED_FRAMES:
+            print(f"Allocation guard: frame {frame_index} ({state}) made {count} allocations "
+                  f"(budget {self.budget})")
+            for (kind, site), calls in self.frame.most_common(self.TOP_SITES):
+                print(f"  {calls:>6}  {kind:<22}{site}")
+            if self.flagged_frames == self.MAX_PRINTED_FRAMES:
+                print("Allocation guard: further over-budget frames are only counted (see report)")
+
+    def report(self):
+        """Print allocations per steady frame by call site"""
+        if not self.steady_frames:
+            return
+        print(f"Allocation guard: {self.flagged_frames} of {self.steady_frames} steady frames "
+              f"over budget ({self.budget})")
+        for (kind, site), calls in self.totals.most_common(self.TOP_SITES):
+            print(f"  {calls / self.steady_frames:8.2f}/frame  {kind:<22}{site}")
@@ -0,0 +1,85 @@
+"""
+Concurrent image decoding at start-up.
+
+game.main() calls preload() once per process, just before creating the
+Game, to queue every image in MANIFEST on a thread pool. pygame.image.load
+releases the GIL while decoding, so files are decoded in parallel with each
+other and with display, font and menu set-up on the main thread. Loaders call load_image() where they used to
+call pygame.image.load. It hands over the decoded surface (waiting for it
+if it is still being decoded), or decodes the file itself if it was never
+queued. Conversion to the display format (convert/convert_alpha,
+normalize_surface) stays with the caller on the main thread.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from settings import ASSETS_DIR, ASSET_LOADER_THREADS
+from tracing import span
+
+# Images loaded during start-up, largest first so the long decodes start earliest
+MANIFEST = (
+    'game.png',
+    'goblin_idle__walk_death.png',
+    'goblin_run.png',
+    'fireball.png',
+    'iceball.png',
+    'fireball_explosion.png',
+    'iceball_explosion.png',
+    'cloud.png',
+    'sun.png',
+    'moon.png',
+    'base_sheet_character.png',
+    'wizard_staff.png',
+    'ice_staff.png',
+    'tree.png',
+    'pine_tree.png',
+    'bush.png',
+    'flower.png',
+    'yellow_flower.png',
+    'grass.png',
+    'dirt.png',
+    'stone.png',
+)
+
+# Normalised path -> Future of the decoded Surface, until load_image() takes it
+_pending = {}
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+def _decode(path):
+    with span(f'decode {os.path.basename(path)}', 'assets'):
+        return pygame.image.load(path)
+
+
+def preload(filenames=MANIFEST, workers=None):
+    """
+    Start decoding files from the assets directory on a thread pool.
+
+    Args:
+        filenames: File names relative to ASSETS_DIR
+        workers: Decoding threads (default: settings.ASSET_LOADER_THREADS, or one per CPU core)
+    """
+    if workers is None:
+        workers = ASSET_LOADER_THREADS or os.cpu_count() or 1
+    paths = [os.path.join(ASSETS_DIR, name) for name in filenames]
+    paths = [path for path in paths if _key(path) not in _pending and os.path.exists(path)]
+    if not paths:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(paths)), thread_name_prefix='asset-decode')
+    for path in paths:
+        _pending[_key(path)] = executor.submit(_decode, path)
+    executor.shutdown(wait=False)  # Workers exit once the queue is drained
+
+
+def load_image(path):
+    """pygame.image.load(path), using the preloaded decode when there is one"""
+    future = _pending.pop(_key(path), None)
+    if future is not None:
+        try:
+            return future.result()
+        except Exception:
+            pass  # Decode again here so the error is raised at the caller
+    return pygame.image.load(path)
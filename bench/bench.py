@@ -0,0 +1,282 @@
+"""
+Headless benchmark suite.
+
+Runs scripted scenarios with SDL's dummy video and audio drivers, a fixed
+seed and a fixed timestep, and writes mean / p95 / p99 frame times for each
+scenario as JSON so performance changes can be compared run to run.
+
+    python bench/bench.py                         # every scenario
+    python bench/bench.py goblins_1000 night      # scenarios by name (prefix match)
+    python bench/bench.py -o before.json
+    python bench/bench.py -o after.json --compare before.json
+"""
+import os
+import sys
+
+# Headless: must be set before pygame is imported
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import argparse
+import json
+import math
+import platform
+import random
+import time
+import numpy as np
+import pygame
+
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, FPS, SIMULATION_HZ
+from terrain import Terrain, load_terrain_assets
+from projectile_batch import KIND_FIRE, KIND_ICE
+import game as game_module
+
+SEED = 1234
+WARMUP_FRAMES = 30
+FRAMES = 300
+TERRAIN_REPEATS = 5
+STEPS_PER_FRAME = max(1, round(SIMULATION_HZ / FPS))  # Fixed steps per rendered frame, as in Game.run
+SIM_DT = 1.0 / SIMULATION_HZ
+
+
+def new_game(max_goblins=None):
+    """A seeded game in the playing state with spawning under the scenario's control"""
+    random.seed(SEED)
+    game = game_module.Game(seed=SEED, music=False)
+    game.state = game_module.GAME_STATE_PLAYING
+    preset = dict(game.spawn_director.preset, despawn_after=None)
+    if max_goblins is not None:
+        preset['max_goblins'] = max_goblins
+    game.spawn_director.preset = preset
+    return game
+
+
+def place_goblins(game, count):
+    """Replace the population with count goblins spread over the first screens around the hero"""
+    goblins = game.goblins
+    goblins.clear()
+    rng = np.random.default_rng(SEED)
+    xs = rng.uniform(0, WINDOW_WIDTH * 3, size=count)
+    ys = game.terrain.get_ground_heights(xs + goblins.WIDTH / 2) - goblins.HEIGHT
+    goblins.spawn_many(xs, ys)
+
+
+def run_frames(game, frames, before_frame=None):
+    """Time frames of fixed-step updates plus a full draw; returns milliseconds per frame"""
+    samples = []
+    for i in range(WARMUP_FRAMES + frames):
+        pygame.event.pump()
+        if before_frame is not None:
+            before_frame(game, i)
+        # The benchmark measures cost, not gameplay: keep the hero alive
+        game.hero.health = 100
+        start = time.perf_counter()
+        for _ in range(STEPS_PER_FRAME):
+            game.update(SIM_DT)
+        game.draw(True, 1.0)
+        if i >= WARMUP_FRAMES:
+            samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+# Scenarios: name -> function returning a list of sample times in milliseconds
+
+def terrain_generation(screens):
+    def scenario(frames):
+        assets = load_terrain_assets()
+        samples = []
+        for i in range(TERRAIN_REPEATS):
+            random.seed(SEED + i)
+            start = time.perf_counter()
+            Terrain(*assets, terrain_width=WINDOW_WIDTH * screens)
+            samples.append((time.perf_counter() - start) * 1000.0)
+        return samples
+    return scenario
+
+
+def terrain_draw(where):
+    """Terrain.draw alone, with the camera parked in one biome"""
+    def scenario(frames):
+        game = new_game()
+        terrain = game.terrain
+        width = terrain.terrain_width
+        camera_x = {
+            'grass': width * 0.3,
+            'transition': width * 0.77,
+            'stone': width * 0.9,
+            'cave': (terrain.cave_entrance or width * 0.8) - WINDOW_WIDTH / 4,
+        }[where]
+        camera_x = max(0, min(camera_x, width - WINDOW_WIDTH))
+        screen = game.screen
+        samples = []
+        try:
+            for i in range(WARMUP_FRAMES + frames):
+                start = time.perf_counter()
+                terrain.draw(screen, camera_x)
+                if i >= WARMUP_FRAMES:
+                    samples.append((time.perf_counter() - start) * 1000.0)
+        finally:
+            game.close()
+        return samples
+    return scenario
+
+
+def idle(frames):
+    game = new_game()
+    try:
+        return run_frames(game, frames)
+    finally:
+        game.close()
+
+
+def goblins(count):
+    def scenario(frames):
+        game = new_game(max_goblins=count)
+        try:
+            place_goblins(game, count)
+            return run_frames(game, frames)
+        finally:
+            game.close()
+    return scenario
+
+
+def projectile_storm(frames):
+    """A fan of fire and ice projectiles launched from the hero every frame, into a crowd"""
+    game = new_game(max_goblins=200)
+    place_goblins(game, 200)
+    batch = game.projectiles
+
+    def fire(game, i):
+        hero = game.hero
+        x = hero.x + hero.width // 2
+        y = hero.y + hero.height // 2
+        for k in range(16):
+            angle = -math.pi * (k + 0.5) / 16
+            kind = KIND_ICE if (i + k) % 2 else KIND_FIRE
+            batch.spawn(kind, x, y, math.cos(angle) * 8, math.sin(angle) * 8)
+
+    try:
+        return run_frames(game, frames, fire)
+    finally:
+        game.close()
+
+
+def night(frames):
+    """Full frames held at midnight, with the darkest night overlay"""
+    def hold_midnight(game, i):
+        game.day_night_cycle.time_of_day = 0.5
+    game = new_game()
+    try:
+        return run_frames(game, frames, hold_midnight)
+    finally:
+        game.close()
+
+
+SCENARIOS = {
+    'terrain_gen_5': terrain_generation(5),
+    'terrain_gen_20': terrain_generation(20),
+    'terrain_gen_60': terrain_generation(60),
+    'terrain_draw_grass': terrain_draw('grass'),
+    'terrain_draw_transition': terrain_draw('transition'),
+    'terrain_draw_stone': terrain_draw('stone'),
+    'terrain_draw_cave': terrain_draw('cave'),
+    'idle': idle,
+    'goblins_100': goblins(100),
+    'goblins_1000': goblins(1000),
+    'projectile_storm': projectile_storm,
+    'night': night,
+}
+
+
+def summarize(samples):
+    samples = np.asarray(samples, dtype=np.float64)
+    return {
+        'samples': int(samples.size),
+        'mean_ms': round(float(samples.mean()), 3),
+        'p50_ms': round(float(np.percentile(samples, 50)), 3),
+        'p95_ms': round(float(np.percentile(samples, 95)), 3),
+        'p99_ms': round(float(np.percentile(samples, 99)), 3),
+        'max_ms': round(float(samples.max()), 3),
+    }
+
+
+def compare(results, baseline_path):
+    """Print mean / p99 change against an earlier results file"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['scenarios']
+    print(f"\n{'scenario':<26}{'mean':>10}{'change':>9}{'p99':>10}{'change':>9}")
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        mean_change = (stats['mean_ms'] / old['mean_ms'] - 1) * 100 if old['mean_ms'] else 0.0
+        p99_change = (stats['p99_ms'] / old['p99_ms'] - 1) * 100 if old['p99_ms'] else 0.0
+        print(f"{name:<26}{stats['mean_ms']:>10.2f}{mean_change:>+8.1f}%"
+              f"{stats['p99_ms']:>10.2f}{p99_change:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmark scenarios")
+    parser.add_argument('scenarios', nargs='*', help="Scenario names or prefixes (default: all)")
+    parser.add_argument('-o', '--output', default=os.path.join('bench', 'results.json'),
+                        help="JSON results file ('-' for stdout)")
+    parser.add_argument('-n', '--frames', type=int, default=FRAMES, help="Measured frames per scenario")
+    parser.add_argument('--compare', help="Earlier results file to compare against")
+    parser.add_argument('--list', action='store_true', help="List scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(SCENARIOS))
+        return
+
+    names = [name for name in SCENARIOS
+             if not args.scenarios or any(name.startswith(p) for p in args.scenarios)]
+    if not names:
+        parser.error(f"no scenario matches {args.scenarios}")
+
+    # Sprites are converted for the display, so one must exist before any asset loads
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    results = {}
+    for name in names:
+        stats = summarize(SCENARIOS[name](args.frames))
+        results[name] = stats
+        print(f"{name:<26} mean {stats['mean_ms']:8.2f}  p95 {stats['p95_ms']:8.2f}  "
+              f"p99 {stats['p99_ms']:8.2f} ms", file=sys.stderr)
+
+    report = {
+        'meta': {
+            'seed': SEED,
+            'sim_dt': SIM_DT,
+            'steps_per_frame': STEPS_PER_FRAME,
+            'frames': args.frames,
+            'warmup_frames': WARMUP_FRAMES,
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'scenarios': results,
+    }
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+    if args.compare:
+        compare(results, args.compare)
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
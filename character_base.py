@@ -2,6 +2,14 @@ import pygame
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, DEBUG_MODE
 
 class Character:
+    # Fixed attribute layout: no per-instance __dict__, every field set in __init__
+    __slots__ = (
+        'x', 'y', 'prev_x', 'prev_y', 'width', 'height', 'color', 'health',
+        'attacking', 'attack_cooldown', 'attack_range', 'attack_damage', 'speed',
+        'is_jumping', 'jump_count', 'y_velocity', 'GRAVITY', 'rect',
+        'sprite_images', 'current_frame', 'frame_timer', 'frame_delay',
+    )
+
     def __init__(self, x, y, width, height, color, health, sprite_images=None):
         self.x = x
         self.y = y
@@ -12,11 +20,16 @@ class Character:
         self.attacking = False
         self.attack_cooldown = 0
         self.attack_range = 50
+        self.attack_damage = 0  # Set by subclasses
         self.speed = 3  # Reduced speed for better control
         self.is_jumping = False
         self.jump_count = 0
         self.y_velocity = 0
+        self.GRAVITY = 0.5
         self.rect = pygame.Rect(x, y, width, height)
+        # Position at the previous simulation step (for render interpolation)
+        self.prev_x = x
+        self.prev_y = y
         # Animation support
         self.sprite_images = sprite_images if sprite_images else []
         self.current_frame = 0
@@ -6,13 +6,32 @@ from settings import (
     WINDOW_WIDTH, WINDOW_HEIGHT, GOBLIN_WIDTH, GOBLIN_HEIGHT,
     DEBUG_MODE, ASSETS_DIR
 )
-from utils import load_sprite, load_spritesheet
+from utils import load_sprite, load_spritesheet, normalize_surface
 from character_base import Character
+from tracing import traced
+from memory_stats import track_surface
+from asset_loader import load_image
 
 # Get the directory containing this file
 thisdir = Path(__file__).parent.resolve()
 
 class Goblin(Character):
+    # Class-level animation clips shared across all instances
+    SPRITE_WIDTH = 32
+    SPRITE_HEIGHT = 38  # Slightly taller to prevent floating
+    _animations_loaded = False
+    _animations_right = {}
+    _animations_left = {}
+    
+    __slots__ = (
+        'current_state', 'facing_right', 'is_attacking', 'attack_animation_timer',
+        'attack_frame', 'on_ground', 'state', 'wander_timer', 'wander_dir',
+        'animation_phase', 'animation_progress', 'last_direction', 'walk_frame',
+        'walk_frame_time', 'despawn_timer', 'sprite_width', 'sprite_height',
+        'animations', 'animations_left', 'current_animation_name', 'current_animation',
+        'animation_frame', 'animation_time', 'animation_speed', 'walk_phase', 'walk_progress',
+    )
+    
     def __init__(self):
         # Initialize with default values first
         # Position will be adjusted after loading the sprite
@@ -54,108 +73,134 @@ class Goblin(Character):
         self.walk_frame = 0  # Current frame in walk animation
         self.walk_frame_time = 0  # Time since last frame change
         self.attack_frame = 0  # Current frame in attack animation
+        self.despawn_timer = 0  # Frames spent off screen
 
-    def setup_animations(self):
-        """Load and set up all animations from the sprite sheets"""
-        try:
-            # Load the run sprite sheet (goblin_run.png)
-            run_sprite_path = thisdir / 'assets' / 'goblin_run.png'
-            if not run_sprite_path.exists():
-                run_sprite_path = ASSETS_DIR / 'goblin_run.png'
-                
-            if not run_sprite_path.exists():
-                raise FileNotFoundError(f"Could not find goblin run sprite at {run_sprite_path}")
-                
-            # Load the main sprite sheet for idle and death
-            sprite_path = thisdir / 'assets' / 'goblin_idle__walk_death.png'
-            if not sprite_path.exists():
-                sprite_path = ASSETS_DIR / 'goblin_idle__walk_death.png'
-                
-            if not sprite_path.exists():
-                raise FileNotFoundError(f"Could not find goblin sprite sheet at {sprite_path}")
-                
-            # Load and process run sprite sheet
-            run_sprite_sheet = pygame.image.load(str(run_sprite_path)).convert_alpha()
-            sprite_sheet = pygame.image.load(str(sprite_path)).convert_alpha()
-            
-            # Frame dimensions - adjusted to match actual sprite sheet
-            original_frame_width, original_frame_height = 256, 341  # For idle/death
-            run_frame_width, run_frame_height = 253, 282  # Updated run animation frame size
-            
-            # Target size for all sprites
-            target_width = 32
-            target_height = 38  # Slightly taller to prevent floating
-            
-            # Calculate scale factors for each sprite sheet
-            idle_scale = target_width / original_frame_width
-            run_scale = target_width / run_frame_width
-            
-            # Set sprite dimensions to target size
-            self.sprite_width = target_width
-            self.sprite_height = target_height
+    @classmethod
+    @traced('Goblin.load_animations', 'assets')
+    def load_animations(cls):
+        """Load, slice and scale the goblin sprite sheets once for all instances.
+
+        Right-facing clips are stored in ``_animations_right`` and mirrored copies
+        in ``_animations_left`` so drawing never has to flip a frame.
+        """
+        if cls._animations_loaded:
+            return
+
+        # Load the run sprite sheet (goblin_run.png)
+        run_sprite_path = thisdir / 'assets' / 'goblin_run.png'
+        if not run_sprite_path.exists():
+            run_sprite_path = ASSETS_DIR / 'goblin_run.png'
             
-            # Update the hitbox to match the sprite size (slightly smaller for better gameplay)
-            self.width = int(self.sprite_width * 0.7)
-            self.height = self.sprite_height
+        if not run_sprite_path.exists():
+            raise FileNotFoundError(f"Could not find goblin run sprite at {run_sprite_path}")
             
-            # Helper function to extract and scale a single frame
-            def get_frame(sheet, row, col, frame_width, frame_height, scale, is_run_sheet=False):
-                # Add 1 pixel padding to prevent edge artifacts
-                x = col * frame_width + (1 if is_run_sheet and col > 0 else 0)
-                y = row * frame_height
-                
-                # Adjust width to prevent overlap with next frame
-                width = frame_width - (1 if is_run_sheet and col < 3 else 0)
-                
-                # Create a clean surface with the exact frame size
-                frame = pygame.Surface((width, frame_height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), (x, y, width, frame_height))
-                
-                # Scale to target size while maintaining aspect ratio
-                return pygame.transform.scale(frame, (target_width, target_height))
+        # Load the main sprite sheet for idle and death
+        sprite_path = thisdir / 'assets' / 'goblin_idle__walk_death.png'
+        if not sprite_path.exists():
+            sprite_path = ASSETS_DIR / 'goblin_idle__walk_death.png'
             
-            # Create animation sequences
-            # Idle animation (from main sprite sheet)
-            idle_frames = [get_frame(sprite_sheet, 0, i % 8, original_frame_width, original_frame_height, idle_scale) 
-                          for i in range(2)]
+        if not sprite_path.exists():
+            raise FileNotFoundError(f"Could not find goblin sprite sheet at {sprite_path}")
             
-            # Run animation (from goblin_run.png)
-            run_sheet_width = run_sprite_sheet.get_width()
-            run_frame_count = run_sheet_width // run_frame_width
+        # Load and process run sprite sheet
+        run_sprite_sheet = load_image(run_sprite_path).convert_alpha()
+        sprite_sheet = load_image(sprite_path).convert_alpha()
+        
+        # Frame dimensions - adjusted to match actual sprite sheet
+        original_frame_width, original_frame_height = 256, 341  # For idle/death
+        run_frame_width, run_frame_height = 253, 282  # Updated run animation frame size
+        
+        # Target size for all sprites
+        target_width = cls.SPRITE_WIDTH
+        target_height = cls.SPRITE_HEIGHT
+        
+        # Helper function to extract and scale a single frame
+        def get_frame(sheet, row, col, frame_width, frame_height, is_run_sheet=False):
+            # Add 1 pixel padding to prevent edge artifacts
+            x = col * frame_width + (1 if is_run_sheet and col > 0 else 0)
+            y = row * frame_height
             
-            # Get all run frames (1-4) with proper scaling and edge handling
-            run_frames = [get_frame(run_sprite_sheet, 0, i, run_frame_width, run_frame_height, run_scale, is_run_sheet=True) 
-                        for i in range(min(4, run_frame_count))]
+            # Adjust width to prevent overlap with next frame
+            width = frame_width - (1 if is_run_sheet and col < 3 else 0)
             
-            # Create ping-pong sequence: 1-2-3-4-3-2-1-2...
-            walk_frames = run_frames + run_frames[-2:0:-1]
+            # Create a clean surface with the exact frame size
+            frame = pygame.Surface((width, frame_height), pygame.SRCALPHA)
+            frame.blit(sheet, (0, 0), (x, y, width, frame_height))
             
-            # Death animation (from main sprite sheet)
-            death_frames = [get_frame(sprite_sheet, 2, i, original_frame_width, original_frame_height, idle_scale) 
-                          for i in range(8)]
+            # Scale to target size while maintaining aspect ratio
+            return pygame.transform.scale(frame, (target_width, target_height))
+        
+        # Create animation sequences
+        # Idle animation (from main sprite sheet)
+        idle_frames = [get_frame(sprite_sheet, 0, i % 8, original_frame_width, original_frame_height) 
+                      for i in range(2)]
+        
+        # Run animation (from goblin_run.png)
+        run_sheet_width = run_sprite_sheet.get_width()
+        run_frame_count = run_sheet_width // run_frame_width
+        
+        # Get all run frames (1-4) with proper scaling and edge handling
+        run_frames = [get_frame(run_sprite_sheet, 0, i, run_frame_width, run_frame_height, is_run_sheet=True) 
+                    for i in range(min(4, run_frame_count))]
+        
+        # Create ping-pong sequence: 1-2-3-4-3-2-1-2...
+        walk_frames = run_frames + run_frames[-2:0:-1]
+        
+        # Death animation (from main sprite sheet)
+        death_frames = [get_frame(sprite_sheet, 2, i, original_frame_width, original_frame_height) 
+                      for i in range(8)]
+        
+        # Attack animation (from main sprite sheet)
+        attack_frames = [get_frame(sprite_sheet, 1, i, original_frame_width, original_frame_height) 
+                      for i in range(4)]
+        
+        # Store animations (sheets face right; left-facing clips are mirrored once here)
+        cls._animations_right = {
+            'idle': idle_frames,
+            'walk': walk_frames,
+            'death': death_frames,
+            'attack': attack_frames
+        }
+        cls._animations_left = {
+            name: [track_surface(normalize_surface(pygame.transform.flip(frame, True, False),
+                                                   f'goblin_{name}_left_{i}'), 'goblins')
+                   for i, frame in enumerate(frames)]
+            for name, frames in cls._animations_right.items()
+        }
+        for name, frames in cls._animations_right.items():
+            frames[:] = [track_surface(normalize_surface(frame, f'goblin_{name}_right_{i}'), 'goblins')
+                         for i, frame in enumerate(frames)]
+        cls._animations_loaded = True
+
+    def setup_animations(self):
+        """Attach the shared animation clips and set up per-instance animation state"""
+        # Defaults first, so the fallback path leaves every field set
+        self.sprite_width = Goblin.SPRITE_WIDTH
+        self.sprite_height = Goblin.SPRITE_HEIGHT
+        self.animations = {}
+        self.animations_left = {}
+        self.current_animation_name = 'idle'
+        self.current_animation = None
+        self.animation_frame = 0
+        self.animation_time = 0
+        self.animation_speed = 0.2  # Seconds per frame
+        
+        # Custom walk animation state
+        self.walk_phase = 'idle'  # 'start', 'run', 'stop', 'idle'
+        self.walk_progress = 0
+        
+        try:
+            Goblin.load_animations()
             
-            # Attack animation (from main sprite sheet)
-            attack_frames = [get_frame(sprite_sheet, 1, i, original_frame_width, original_frame_height, idle_scale) 
-                          for i in range(4)]
+            # Update the hitbox to match the sprite size (slightly smaller for better gameplay)
+            self.width = int(self.sprite_width * 0.7)
+            self.height = self.sprite_height
             
-            # Store animations
-            self.animations = {
-                'idle': idle_frames,
-                'walk': walk_frames,
-                'death': death_frames,
-                'attack': attack_frames
-            }
+            # Shared clips - never modified per instance
+            self.animations = Goblin._animations_right
+            self.animations_left = Goblin._animations_left
             
-            # Animation state
-            self.current_animation_name = 'idle'
             self.current_animation = self.animations['idle']
-            self.animation_frame = 0
-            self.animation_time = 0
-            self.animation_speed = 0.2  # Seconds per frame
-            
-            # Custom walk animation state
-            self.walk_phase = 'idle'  # 'start', 'run', 'stop', 'idle'
-            self.walk_progress = 0
             
             # Position the goblin on the ground - moved down further
             ground_height = WINDOW_HEIGHT - self.sprite_height - 15 + 30  # 15 pixels above bottom, plus 30 pixel shift down
@@ -167,6 +212,7 @@ class Goblin(Character):
                 print(f"Error loading goblin animations: {e}")
             # Fallback to a simple rectangle if loading fails
             self.animations = {}
+            self.animations_left = {}
     
     def update_animation(self, dt):
         """Update the current animation frame with custom run sequence"""
@@ -174,11 +220,7 @@ class Goblin(Character):
             return
             
         # Store previous animation state
-        prev_animation = self.current_animation_name if hasattr(self, 'current_animation_name') else 'idle'
-        
-        # Initialize animation time if not exists
-        if not hasattr(self, 'animation_time'):
-            self.animation_time = 0
+        prev_animation = self.current_animation_name
         
         # Update animation timer
         self.animation_time += dt
@@ -186,9 +228,9 @@ class Goblin(Character):
         # Determine animation state based on movement, attacking, and health
         if self.health <= 0:
             self.current_animation_name = 'death'
-        elif hasattr(self, 'is_attacking') and self.is_attacking:
+        elif self.is_attacking:
             self.current_animation_name = 'attack'
-        elif hasattr(self, 'wander_dir') and abs(self.wander_dir) > 0:  # Moving
+        elif abs(self.wander_dir) > 0:  # Moving
             if prev_animation not in ['walk', 'attack']:  # Don't reset if coming from attack
                 # Starting to move - begin walk sequence
                 self.walk_phase = 'start'
@@ -196,18 +238,14 @@ class Goblin(Character):
                 self.walk_frame = 0
             self.current_animation_name = 'walk'
         else:  # Not moving
-            if prev_animation == 'walk' and hasattr(self, 'walk_phase') and self.walk_phase != 'idle':
+            if prev_animation == 'walk' and self.walk_phase != 'idle':
                 # Was moving, now stopping
                 self.walk_phase = 'stop'
                 self.animation_time = 0
             self.current_animation_name = 'idle'
         
-        # Initialize animation frame if not exists
-        if not hasattr(self, 'animation_frame'):
-            self.animation_frame = 0
-        
         # Update current animation
-        if hasattr(self, 'current_animation_name') and self.current_animation_name in self.animations:
+        if self.current_animation_name in self.animations:
             self.current_animation = self.animations[self.current_animation_name]
             
             if self.current_animation_name == 'idle':
@@ -216,12 +254,6 @@ class Goblin(Character):
                 self.animation_frame = int((self.animation_time / frame_duration) % 2)
                 
             elif self.current_animation_name == 'walk':
-                # Initialize walk frame time if not exists
-                if not hasattr(self, 'walk_frame_time'):
-                    self.walk_frame_time = 0
-                if not hasattr(self, 'walk_frame'):
-                    self.walk_frame = 0
-                    
                 frame_duration = 0.1  # seconds per frame during walk
                 
                 # Update walk frame with ping-pong effect
@@ -272,23 +304,19 @@ class Goblin(Character):
     
     def draw(self, screen, camera_x):
         """Draw the goblin on the screen with camera offset"""
-        if not hasattr(self, 'current_animation') or not self.current_animation:
+        if not self.current_animation:
             # Fallback: draw a rectangle if no animation is available
             pygame.draw.rect(screen, self.color, 
                           (self.x - camera_x, self.y + 10, self.width, self.height))  # +10px down
             return
             
         # Get the current frame
-        if hasattr(self, 'animation_frame') and 0 <= self.animation_frame < len(self.current_animation):
-            frame = self.current_animation[self.animation_frame]
-            
-            # Ensure facing_right is properly initialized
-            if not hasattr(self, 'facing_right'):
-                self.facing_right = False
-                
-            # Flip the frame based on facing direction
-            if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
+        if 0 <= self.animation_frame < len(self.current_animation):
+            # Pick the pre-flipped clip based on facing direction
+            if self.facing_right:
+                frame = self.current_animation[self.animation_frame]
+            else:
+                frame = self.animations_left[self.current_animation_name][self.animation_frame]
                 
             # Calculate position to keep feet planted, adjusted 10px down
             draw_x = self.x - camera_x - (frame.get_width() - self.width) // 2
@@ -300,6 +328,7 @@ class Goblin(Character):
             # Draw health bar
             self.draw_health_bar(screen, camera_x, y_offset=10)  # Offset health bar down with the goblin
 
+    @traced('Goblin.update', 'goblins')
     def update(self, hero_x, terrain, dt=1.0/60.0, camera_x=0, hero=None):
         """Update the goblin's state"""
         try:
@@ -355,9 +384,9 @@ class Goblin(Character):
                         if new_dir != self.wander_dir:
                             self.wander_dir = new_dir
                             self.facing_right = self.wander_dir > 0
-                        self.wander_timer = random.randint(40, 120)  # frames
+                        self.wander_timer = random.randint(40, 120) / 60.0  # seconds
                     else:
-                        self.wander_timer -= 1 * dt * 60  # Scale by FPS
+                        self.wander_timer -= dt
                         self.x += self.wander_dir * move_speed
                 elif self.state == 'chase':
                     if distance > 0:
@@ -391,20 +420,14 @@ class Goblin(Character):
                 
                 # Calculate actual distance to hero for attack check
                 if hero is not None:  # Make sure we have a hero to attack
-                    # Debug distance info
                     x_dist = abs(self.x - hero.x)
                     y_dist = abs(self.y - hero.y)
-                    # if DEBUG_MODE:
-                    #     print(f"Goblin at ({self.x:.1f}, {self.y:.1f}) | Hero at ({hero.x:.1f}, {hero.y:.1f}) | X dist: {x_dist:.1f} | Y dist: {y_dist:.1f} | Attack range: {self.attack_range}")
                     
                     # Check if we should start an attack
                     if (not self.is_attacking and 
                         self.attack_cooldown <= 0 and
                         x_dist <= self.attack_range and 
                         y_dist < 100):  # Increased from 50 to 100 to allow attacks when closer vertically
-                        # if DEBUG_MODE:
-                        #     print("Goblin is in attack range and starting attack!")
-                        
                         self.is_attacking = True
                         self.attack_animation_timer = 0.6  # Increased from 0.3 to 0.6 seconds for longer attack animation
                         self.attack_frame = 0  # Reset attack frame counter
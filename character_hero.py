@@ -1,8 +1,11 @@
 import pygame
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, PLAYER_WIDTH, PLAYER_HEIGHT, DEBUG_MODE
-from utils import load_sprite
+from utils import load_sprite, normalize_surface
 from character_base import Character
 from projectile import Projectile, IceProjectile
+from projectile_batch import KIND_BY_STAFF, KIND_FIRE
+from tracing import traced
+from memory_stats import track_surface
 
 
 class Hero(Character):
@@ -14,6 +17,93 @@ class Hero(Character):
     _idle_left = None
     _jump_right = None
     _jump_left = None
+    _staff_img = None
+    _ice_staff_img = None
+    _staff_poses = {}  # (staff_type, facing_right) -> (rotated surface, (dx, dy) offset from hero)
+    
+    __slots__ = (
+        'holding_staff', 'staff_type', 'staff_img', 'ice_staff_img', 'visual_y_offset',
+        'projectile_cooldown', 'JUMP_FORCE', 'facing_right', 'walk_anim_timer',
+        'walk_anim_speed', 'walk_anim_index', 'is_moving', 'on_ground',
+    )
+    
+    @classmethod
+    @traced('Hero.load_sprites', 'assets')
+    def load_sprites(cls):
+        """Slice the hero sheet and pre-scale every frame to the on-screen size"""
+        if cls._sprites_loaded:
+            return
+        try:
+            # Load the sprite sheet
+            sprite_sheet = load_sprite('base_sheet_character.png')
+            if sprite_sheet:
+                # Assuming each frame is 32x32 pixels in the sprite sheet
+                frame_width, frame_height = 32, 32
+                
+                # Extract walking right frames, scaled once with nearest neighbour for crisp pixel art
+                for i in range(4):  # 4 frames for walking
+                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+                    frame.blit(sprite_sheet, (0, 0), (i * frame_width, 0, frame_width, frame_height))
+                    cls._anim_frames_right.append(pygame.transform.scale(frame, (PLAYER_WIDTH, PLAYER_HEIGHT)))
+                
+                # Create left-facing frames by flipping right-facing ones
+                for frame in cls._anim_frames_right:
+                    cls._anim_frames_left.append(pygame.transform.flip(frame, True, False))
+                
+                # Store every frame in the cheapest display format
+                cls._anim_frames_right[:] = [track_surface(normalize_surface(f, f'hero_walk_right_{i}'), 'hero')
+                                             for i, f in enumerate(cls._anim_frames_right)]
+                cls._anim_frames_left[:] = [track_surface(normalize_surface(f, f'hero_walk_left_{i}'), 'hero')
+                                            for i, f in enumerate(cls._anim_frames_left)]
+                
+                # Set up idle and jump frames
+                if cls._anim_frames_right:
+                    cls._idle_right = cls._anim_frames_right[0]
+                    cls._idle_left = cls._anim_frames_left[0]
+                    cls._jump_right = cls._anim_frames_right[0]
+                    cls._jump_left = cls._anim_frames_left[0]
+                
+                cls._sprites_loaded = True
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Error loading hero sprites: {e}")
+    
+    @classmethod
+    @traced('Hero.load_staff_poses', 'assets')
+    def load_staff_poses(cls):
+        """Load both staffs and pre-render the four held poses (fire/ice x left/right)"""
+        if cls._staff_poses:
+            return
+        cls._staff_img = track_surface(load_sprite('wizard_staff.png'), 'hero')
+        cls._ice_staff_img = track_surface(load_sprite('ice_staff.png'), 'hero')
+        
+        for staff_type, staff_img in (('fire', cls._staff_img), ('ice', cls._ice_staff_img)):
+            # Get original staff size and scale it up slightly (1.5x)
+            original_width, original_height = staff_img.get_size()
+            scale_factor = 1.5
+            staff_width = int(original_width * scale_factor)
+            staff_height = int(original_height * scale_factor)
+            staff_scaled = pygame.transform.scale(staff_img, (staff_width, staff_height))
+            
+            # Vertical position - hands are about 70% down the character,
+            # align bottom of staff with hands
+            dy = PLAYER_HEIGHT * 0.7 - staff_height
+            
+            for facing_right in (True, False):
+                # Rotate staff based on facing direction
+                angle = -45 if facing_right else 45  # 45 degrees right, -45 degrees left
+                staff_rotated = normalize_surface(pygame.transform.rotate(staff_scaled, angle),
+                                                  f"{staff_type}_staff_{'right' if facing_right else 'left'}")
+                
+                # Horizontal position - adjust based on facing direction
+                if facing_right:
+                    # Position on right side but closer to body when facing right
+                    dx = PLAYER_WIDTH - (staff_width * 1.1)
+                else:
+                    # Position on left side but closer to body when facing left
+                    dx = -PLAYER_WIDTH + (staff_width * 1.7)
+                
+                cls._staff_poses[(staff_type, facing_right)] = (track_surface(staff_rotated, 'hero'), (dx, dy))
     
     def __init__(self):
         # Initialize the parent Character class with default values
@@ -30,39 +120,12 @@ class Hero(Character):
         # Hero-specific attributes
         self.holding_staff = False  # Start without staff equipped
         self.staff_type = 'fire'  # 'fire' or 'ice'
-        self.staff_img = load_sprite('wizard_staff.png')
-        self.ice_staff_img = load_sprite('ice_staff.png')
         
-        # Load sprites only once (class-level)
-        if not Hero._sprites_loaded:
-            try:
-                # Load the sprite sheet
-                sprite_sheet = load_sprite('base_sheet_character.png')
-                if sprite_sheet:
-                    # Assuming each frame is 32x32 pixels in the sprite sheet
-                    frame_width, frame_height = 32, 32
-                    
-                    # Extract walking right frames
-                    for i in range(4):  # 4 frames for walking
-                        frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                        frame.blit(sprite_sheet, (0, 0), (i * frame_width, 0, frame_width, frame_height))
-                        Hero._anim_frames_right.append(frame)
-                    
-                    # Create left-facing frames by flipping right-facing ones
-                    for frame in Hero._anim_frames_right:
-                        Hero._anim_frames_left.append(pygame.transform.flip(frame, True, False))
-                    
-                    # Set up idle and jump frames
-                    if Hero._anim_frames_right:
-                        Hero._idle_right = Hero._anim_frames_right[0]
-                        Hero._idle_left = Hero._anim_frames_left[0]
-                        Hero._jump_right = Hero._anim_frames_right[0]
-                        Hero._jump_left = Hero._anim_frames_left[0]
-                    
-                    Hero._sprites_loaded = True
-            except Exception as e:
-                if DEBUG_MODE:
-                    print(f"Error loading hero sprites: {e}")
+        # Load sprites and staff poses only once (class-level)
+        Hero.load_sprites()
+        Hero.load_staff_poses()
+        self.staff_img = Hero._staff_img
+        self.ice_staff_img = Hero._ice_staff_img
         
         # Set up the sprite list
         self.sprite_images = [Hero._idle_right] if Hero._idle_right else None
@@ -101,13 +164,14 @@ class Hero(Character):
             self.is_moving = False
             dx = 0
             dy = 0
+            step = dt * 60  # Speeds and gravity are tuned in pixels per 60 FPS frame
 
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                dx = -self.speed
+                dx = -self.speed * step
                 self.facing_right = False
                 self.is_moving = True
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                dx = self.speed
+                dx = self.speed * step
                 self.facing_right = True
                 self.is_moving = True
 
@@ -117,8 +181,8 @@ class Hero(Character):
                 self.on_ground = False
 
             # Apply gravity
-            self.y_velocity = min(self.y_velocity + self.GRAVITY, 15)
-            dy += self.y_velocity
+            self.y_velocity = min(self.y_velocity + self.GRAVITY * step, 15)
+            dy += self.y_velocity * step
 
             new_x = self.x + dx
             new_y = self.y + dy
@@ -167,56 +231,31 @@ class Hero(Character):
             
         # Draw the character
         if sprite and hasattr(sprite, 'get_rect'):
-            # Apply visual offset for drawing
-            draw_y = self.y + self.visual_y_offset
-                
-            # Use nearest neighbor scaling for crisp pixel art
-            scaled = pygame.transform.scale(sprite, (self.width, self.height))
-            
-            # Draw the sprite directly without color modifications
-            screen.blit(scaled, (self.x - camera_x, draw_y))
-            # --- DRAW STAFF ---
+            # Frames are pre-scaled to the hero size; apply visual offset for drawing
+            screen.blit(sprite, (self.x - camera_x, self.y + self.visual_y_offset))
         else:
             # Fallback to a colored rectangle if sprite loading failed
             pygame.draw.rect(screen, (255, 255, 255), (self.x - camera_x, self.y, self.width, self.height))
         if self.holding_staff:
-            # Get the appropriate staff image based on staff type
-            staff_img = self.get_active_staff_image()
-            if not staff_img:
+            # Draw the pre-rendered staff pose for the current staff and direction
+            staff_pose = Hero._staff_poses.get((self.staff_type, self.facing_right))
+            if not staff_pose:
                 return
-                
-            # Get original staff size and scale it up slightly (1.5x)
-            original_width, original_height = staff_img.get_size()
-            scale_factor = 1.5
-            staff_width = int(original_width * scale_factor)
-            staff_height = int(original_height * scale_factor)
-            staff_scaled = pygame.transform.scale(staff_img, (staff_width, staff_height))
-            
-            # Rotate staff based on facing direction
-            angle = -45 if self.facing_right else 45  # 45 degrees right, -45 degrees left
-            staff_rotated = pygame.transform.rotate(staff_scaled, angle)
-            
-            # Vertical position - hands are about 70% down the character
-            hand_offset_y = self.height * 0.7
-            
-            # Horizontal position - adjust based on facing direction
-            if self.facing_right:
-                # Position on right side but closer to body when facing right
-                staff_x = self.x - camera_x + self.width - (staff_width * 1.1)  # Increased from 0.7 to 0.9 to move left
-            else:
-                # Position on left side but closer to body when facing left
-                staff_x = self.x - camera_x - self.width + (staff_width * 1.7)  # Increased from 0.3 to 0.5 to move right
-            
-            # Vertical position - align bottom of staff with hands
-            staff_y = self.y + hand_offset_y - staff_height
-            
-            # Draw the staff
-            screen.blit(staff_rotated, (staff_x, staff_y))
+            staff_rotated, (dx, dy) = staff_pose
+            screen.blit(staff_rotated, (self.x - camera_x + dx, self.y + dy))
+
     def get_active_staff_image(self):
         """Return the appropriate staff image based on current staff type"""
         return self.ice_staff_img if self.staff_type == 'ice' else self.staff_img
 
-    def shoot_projectile(self, vx, vy):
+    def shoot_projectile(self, vx, vy, batch=None):
+        """
+        Fire a projectile of the current staff's type.
+        
+        Args:
+            batch: Optional ProjectileBatch to launch into instead of constructing
+                   a Projectile; the new row index is returned in that case
+        """
         if not self.holding_staff:
             return None  # Can't shoot without the staff
             
@@ -224,15 +263,15 @@ class Hero(Character):
             pass
             
         if self.projectile_cooldown <= 0:
+            x = self.x + self.width // 2
+            y = self.y + self.height // 2
+            if batch is not None:
+                projectile = batch.spawn(KIND_BY_STAFF.get(self.staff_type, KIND_FIRE), x, y, vx, vy)
             # Create the appropriate projectile type based on staff
-            if self.staff_type == 'ice':
-                projectile = IceProjectile(self.x + self.width // 2, 
-                                        self.y + self.height // 2,
-                                        vx, vy)
+            elif self.staff_type == 'ice':
+                projectile = IceProjectile(x, y, vx, vy)
             else:  # fire staff (default)
-                projectile = Projectile(self.x + self.width // 2, 
-                                     self.y + self.height // 2,
-                                     vx, vy)
+                projectile = Projectile(x, y, vx, vy)
             
             self.projectile_cooldown = 30  # Cooldown in frames
             if not self.is_jumping:
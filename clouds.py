@@ -3,25 +3,37 @@ import random
 import math
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT
 from utils import load_sprite
+from memory_stats import track_surface
 
 class Cloud:
+    # Source sprite, loaded once and shared; each cloud keeps only its scaled copy
+    _source = None
+
+    __slots__ = ('x', 'y', 'scale', 'speed', 'image', 'width', 'height')
+
+    @classmethod
+    def get_source(cls):
+        if cls._source is None:
+            cls._source = track_surface(load_sprite('cloud.png'), 'clouds')
+        return cls._source
+
     def __init__(self, x, y, scale=1.0):
         self.x = x
         self.y = y
         self.scale = scale
         self.speed = random.uniform(0.2, 0.5) * (0.5 + scale * 0.5)  # Bigger clouds move faster
-        self.image = load_sprite('cloud.png')
+        self.image = self.get_source()
         if self.image:
             # Scale the cloud image
             width = int(self.image.get_width() * scale)
             height = int(self.image.get_height() * scale)
-            self.image = pygame.transform.scale(self.image, (width, height))
+            self.image = track_surface(pygame.transform.scale(self.image, (width, height)), 'clouds')
         self.width = self.image.get_width() if self.image else 100 * scale
         self.height = self.image.get_height() if self.image else 50 * scale
         
-    def update(self):
-        # Move cloud from right to left
-        self.x -= self.speed
+    def update(self, dt=1.0/60.0):
+        # Move cloud from right to left (speed is in pixels per 60 FPS frame)
+        self.x -= self.speed * dt * 60
         
     def draw(self, screen, camera_x):
         if self.image:
@@ -35,7 +47,7 @@ class CloudManager:
     def __init__(self, num_clouds=12):
         self.clouds = []
         self.num_clouds = num_clouds
-        self.cloud_img = load_sprite('cloud.png')
+        self.cloud_img = Cloud.get_source()
         self.generate_clouds()
     
     def generate_clouds(self):
@@ -58,7 +70,7 @@ class CloudManager:
         i = 0
         while i < len(self.clouds):
             cloud = self.clouds[i]
-            cloud.update()
+            cloud.update(dt)
             
             # Remove clouds that are off-screen to the left
             if cloud.x + cloud.width * 1.5 < 0:  # Add 50% buffer before removing
@@ -4,6 +4,8 @@ import time
 import colorsys
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, SKY_BLUE
 from utils import load_sprite
+from tracing import traced
+from memory_stats import track_surface
 
 class DayNightCycle:
     def __init__(self, screen):
@@ -11,7 +13,7 @@ class DayNightCycle:
         self.time_of_day = 0.0  # Start at midnight (0 = midnight, 0.25 = sunset, 0.5 = midnight, 0.75 = sunrise, 1.0 = next midnight)
         self.screen = screen
         self.day_duration = 30.0  # seconds for a full day/night cycle (reduced for testing)
-        self.night_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.night_surface = track_surface(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA), 'sky')
         self.last_debug = time.time()
         self.last_transition_time = time.time()  # Initialize with current time
         self.twilight_duration = 0.15  # 15% of day/night cycle for twilight (4.5 seconds with 30s cycle)
@@ -45,9 +47,9 @@ class DayNightCycle:
         
         # Load sun and moon with larger default size
         self.sun = load_sprite("sun.png")
-        self.sun = pygame.transform.scale(self.sun, (120, 120))
+        self.sun = track_surface(pygame.transform.scale(self.sun, (120, 120)), 'sky')
         self.moon = load_sprite("moon.png")
-        self.moon = pygame.transform.scale(self.moon, (120, 120))
+        self.moon = track_surface(pygame.transform.scale(self.moon, (120, 120)), 'sky')
         # self.sun = load_image(['assets/sun.png', 'sun.png'], 
         #                     'sun', (255, 255, 0), (120, 120))
         # self.moon = load_image(['assets/moon.png', 'moon.png'], 
@@ -221,6 +223,7 @@ class DayNightCycle:
         
         return (r, g, b)
     
+    @traced('DayNightCycle.draw', 'sky')
     def draw(self, screen):
         if not hasattr(self, 'sun') or not hasattr(self, 'moon'):
             print("ERROR: Sun or moon surface not initialized!")
@@ -2,121 +2,171 @@ import pygame
 import math
 import random
 from utils import load_sprite
+from memory_stats import track_surface
 
 class ExplosionEffect:
+    # Sprite and its precomputed scaled/faded frames, shared by all explosions
+    _sprite = None
+    _frames = None
+    MAX_FRAMES = 10  # 10 frames at 60 FPS = ~0.17 seconds
+    width = 0  # Drawn centred on x; Game.is_visible padding covers the sprite
+
+    __slots__ = ('x', 'y', 'frame', 'max_frames', 'frames', 'active')
+
+    @classmethod
+    def load_frames(cls):
+        """Load the explosion sprite once and bake one scaled, faded surface per frame"""
+        if cls._frames is None:
+            cls._sprite = track_surface(load_sprite('fireball_explosion.png'), 'effects')
+            cls._frames = []
+            if cls._sprite:
+                orig_rect = cls._sprite.get_rect()
+                for frame in range(cls.MAX_FRAMES):
+                    # Scale factor for the explosion (starts at 0.5, grows to 1.0)
+                    scale = 0.5 + (frame / cls.MAX_FRAMES) * 0.5
+                    # Fade out effect
+                    alpha = 255 * (1 - (frame / cls.MAX_FRAMES))
+
+                    new_size = (int(orig_rect.width * scale), int(orig_rect.height * scale))
+                    scaled = pygame.transform.scale(cls._sprite, new_size).convert_alpha()
+                    scaled.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
+                    cls._frames.append(track_surface(scaled, 'effects'))
+        return cls._frames
+
     def __init__(self, x, y):
+        self.max_frames = self.MAX_FRAMES
+        self.frames = self.load_frames()
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Restart the explosion at (x, y); used by the effect pool"""
         self.x = x
         self.y = y
         self.frame = 0
-        self.max_frames = 10  # 10 frames at 60 FPS = ~0.17 seconds
-        self.sprite = load_sprite('fireball_explosion.png')
         self.active = True
-        
+
     def update(self, dt=1.0/60.0):
         self.frame += 1 * dt * 60  # Scale by 60 to match original behavior at 60 FPS
         if self.frame >= self.max_frames:
             self.active = False
-    
+
     def draw(self, screen, camera_x):
-        if not self.active:
+        if not self.active or not self.frames:
             return
-            
+
         # Calculate screen position with camera offset
         screen_x = self.x - camera_x
-        
-        # Scale factor for the explosion (starts at 0.5, grows to 1.0)
-        scale = 0.5 + (self.frame / self.max_frames) * 0.5
-        
-        # Fade out effect
-        alpha = 255 * (1 - (self.frame / self.max_frames))
-        
-        # Create a scaled and faded version of the sprite
-        if hasattr(self, 'sprite') and self.sprite:
-            # Scale the sprite
-            orig_rect = self.sprite.get_rect()
-            new_size = (int(orig_rect.width * scale), int(orig_rect.height * scale))
-            scaled = pygame.transform.scale(self.sprite, new_size)
-            
-            # Create a surface with per-pixel alpha for the fade effect
-            scaled = scaled.convert_alpha()
-            scaled_alpha = scaled.copy()
-            scaled_alpha.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
-            
-            # Draw the explosion centered at (x, y)
-            screen.blit(scaled_alpha, 
-                       (screen_x - new_size[0]//2, 
-                        self.y - new_size[1]//2))
+
+        # Draw the explosion centered at (x, y)
+        img = self.frames[min(int(self.frame), self.max_frames - 1)]
+        screen.blit(img, (screen_x - img.get_width()//2, self.y - img.get_height()//2))
+
+
+class IceShard:
+    """One ice particle of an IceExplosionEffect, relative to the explosion center"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'size', 'alpha')
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.vx = 0.0
+        self.vy = 0.0
+        self.size = 3
+        self.alpha = 0
 
 
 class IceExplosionEffect:
+    # Sprite, its precomputed faded frames and the shard squares, shared by all explosions
+    _sprite = None
+    _frames = None
+    _shards = None
+    MAX_FRAMES = 15  # Slightly longer duration than fire explosion
+    NUM_PARTICLES = 12
+    width = 0  # Drawn centred on x; Game.is_visible padding covers the sprite
+
+    __slots__ = ('x', 'y', 'frame', 'max_frames', 'frames', 'active', 'particles')
+
+    @classmethod
+    def load_frames(cls):
+        """Load the explosion sprite once and bake one faded surface per frame"""
+        if cls._frames is None:
+            cls._sprite = track_surface(load_sprite('iceball_explosion.png'), 'effects')
+            cls._frames = []
+            if cls._sprite:
+                for frame in range(cls.MAX_FRAMES):
+                    # Fade out effect
+                    alpha = 200 * (1 - (frame / cls.MAX_FRAMES))
+                    faded = cls._sprite.convert_alpha()
+                    faded.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
+                    cls._frames.append(track_surface(faded, 'effects'))
+
+            # Small solid ice shards, one per size, faded with surface alpha at draw time
+            cls._shards = {}
+            for size in range(3, 9):
+                shard = pygame.Surface((size, size))
+                shard.fill((180, 220, 255))
+                cls._shards[size] = track_surface(shard, 'effects')
+        return cls._frames
+
     def __init__(self, x, y):
+        self.max_frames = self.MAX_FRAMES
+        self.frames = self.load_frames()
+        self.particles = [IceShard() for _ in range(self.NUM_PARTICLES)]
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Restart the explosion at (x, y); used by the effect pool"""
         self.x = x
         self.y = y
         self.frame = 0
-        self.max_frames = 15  # Slightly longer duration than fire explosion
-        self.sprite = load_sprite('iceball_explosion.png')
         self.active = True
-        self.particles = []
         self._init_particles()
-        
+
     def _init_particles(self):
-        """Create ice shard particles for the explosion"""
-        for _ in range(12):  # Create 12 ice shards
+        """Scatter the ice shard particles for the explosion (reuses the shard objects)"""
+        for p in self.particles:
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(1, 3)
-            size = random.randint(3, 8)
-            self.particles.append({
-                'x': 0,  # Relative to explosion center
-                'y': 0,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': size,
-                'alpha': 255
-            })
-        
+            p.x = 0  # Relative to explosion center
+            p.y = 0
+            p.vx = math.cos(angle) * speed
+            p.vy = math.sin(angle) * speed
+            p.size = random.randint(3, 8)
+            p.alpha = 255
+
     def update(self, dt=1.0/60.0):
-        self.frame += 1
-        
+        self.frame += 1 * dt * 60  # Scale by 60 to match original behavior at 60 FPS
+
         # Update particles with delta time
         for p in self.particles:
-            p['x'] += p['vx'] * dt * 60  # Scale by 60 to match original behavior at 60 FPS
-            p['y'] += p['vy'] * dt * 60  # Scale by 60 to match original behavior at 60 FPS
-            p['vy'] += 0.1 * dt * 60  # Gravity, scaled by delta time
-            p['alpha'] = max(0, 255 * (1 - (self.frame / self.max_frames)))
-            
+            p.x += p.vx * dt * 60  # Scale by 60 to match original behavior at 60 FPS
+            p.y += p.vy * dt * 60  # Scale by 60 to match original behavior at 60 FPS
+            p.vy += 0.1 * dt * 60  # Gravity, scaled by delta time
+            p.alpha = max(0, 255 * (1 - (self.frame / self.max_frames)))
+
         if self.frame >= self.max_frames:
             self.active = False
-            
+
     def draw(self, screen, camera_x):
         if not self.active:
             return
-            
+
         # Calculate screen position with camera offset
         screen_x = self.x - camera_x
-        
-        # Draw main explosion sprite
-        if hasattr(self, 'sprite') and self.sprite:
-            # Fade out effect
-            alpha = 200 * (1 - (self.frame / self.max_frames))
-            
-            # Create a surface with per-pixel alpha for the fade effect
-            scaled = self.sprite.copy()
-            scaled_alpha = scaled.convert_alpha()
-            scaled_alpha.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
-            
-            # Draw the explosion centered at (x, y)
-            rect = scaled_alpha.get_rect(center=(int(screen_x), int(self.y)))
-            screen.blit(scaled_alpha, rect)
-        
+
+        # Draw main explosion sprite centered at (x, y)
+        if self.frames:
+            img = self.frames[min(int(self.frame), self.max_frames - 1)]
+            screen.blit(img, (int(screen_x) - img.get_width()//2, int(self.y) - img.get_height()//2))
+
         # Draw ice shard particles
+        shards = self._shards
         for p in self.particles:
-            if p['alpha'] > 0:
-                # Create a small ice shard surface
-                shard = pygame.Surface((p['size'], p['size']), pygame.SRCALPHA)
-                color = (180, 220, 255, int(p['alpha']))
-                pygame.draw.rect(shard, color, (0, 0, p['size'], p['size']))
-                
+            if p.alpha > 0:
+                shard = shards[p.size]
+                shard.set_alpha(int(p.alpha))
+
                 # Draw the shard at its position relative to the explosion
-                screen.blit(shard, 
-                          (int(screen_x + p['x'] - p['size']//2), 
-                           int(self.y + p['y'] - p['size']//2)))
+                screen.blit(shard,
+                          (int(screen_x + p.x - p.size//2),
+                           int(self.y + p.y - p.size//2)))
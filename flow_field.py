@@ -0,0 +1,126 @@
+import numpy as np
+from settings import DEBUG_MODE
+
+
+class FlowField:
+    """
+    Shared navigation field that tells every goblin which way leads to the hero.
+
+    Walkable ground in this world is a single line of terrain columns (inside
+    the cave span the cave floor replaces the surface), so the field is 1D:
+    one path cost and one step direction per COLUMN_WIDTH column. Steps that
+    climb more than MAX_CLIMB (stone-biome cliffs) are impassable, dropping
+    down is always allowed, and cave columns are only walkable where a goblin
+    fits under the ceiling (Terrain.is_point_in_cave). The field is rebuilt
+    only when the hero changes column or the terrain changes; goblins read it
+    with one array lookup each.
+    """
+    COLUMN_WIDTH = 32  # Same spacing as the terrain points
+    MAX_CLIMB = 48  # Highest step (pixels) a goblin can walk up between columns
+    CLIMB_COST = 2.0  # Extra path cost per pixel climbed
+
+    def __init__(self, agent_height):
+        self.agent_height = agent_height
+        self._terrain_xs = None
+        self.hero_col = -1
+
+        # Per column / per edge (column c to c + 1) data, filled by rebuild()
+        self.heights = np.zeros(0, dtype=np.float64)
+        self.walkable = np.zeros(0, dtype=np.bool_)
+        self.right_ok = np.zeros(0, dtype=np.bool_)  # c -> c + 1 passable
+        self.left_ok = np.zeros(0, dtype=np.bool_)  # c + 1 -> c passable
+        self.right_cost = np.zeros(0, dtype=np.float64)
+        self.left_cost = np.zeros(0, dtype=np.float64)
+
+        # The field itself: path cost to the hero (inf where a cliff cuts the
+        # way) and step direction (-1, 0, +1). Cut-off columns still point at
+        # the hero so goblins close in as far as the cliff and wait there
+        self.distance = np.zeros(0, dtype=np.float64)
+        self.direction = np.zeros(0, dtype=np.int8)
+
+    def rebuild(self, terrain):
+        """Sample the terrain into columns and work out which steps are passable"""
+        self._terrain_xs = terrain.height_xs
+        self.hero_col = -1
+        width = self.COLUMN_WIDTH
+        count = max(1, int(np.ceil(terrain.terrain_width / width)))
+        centres = np.arange(count) * width + width / 2
+        heights = terrain.get_ground_heights(centres)
+        self.heights = heights
+
+        # Inside the cave span goblins walk the cave floor; they need headroom
+        walkable = np.ones(count, dtype=np.bool_)
+        if terrain.cave_floor_xs is not None:
+            in_span = np.flatnonzero((centres >= terrain.cave_entrance) & (centres <= terrain.cave_exit))
+            for c in in_span.tolist():
+                walkable[c] = terrain.is_point_in_cave(centres[c], heights[c] - self.agent_height)
+        self.walkable = walkable
+
+        # Screen y grows downwards, so moving right climbs by h[c] - h[c + 1]
+        climb_right = heights[:-1] - heights[1:]
+        climb_left = -climb_right
+        self.right_ok = walkable[1:] & (climb_right <= self.MAX_CLIMB)
+        self.left_ok = walkable[:-1] & (climb_left <= self.MAX_CLIMB)
+        self.right_cost = width + self.CLIMB_COST * np.maximum(climb_right, 0)
+        self.left_cost = width + self.CLIMB_COST * np.maximum(climb_left, 0)
+
+        if DEBUG_MODE:
+            print(f"Flow field: {count} columns, {int(np.count_nonzero(~self.right_ok))} blocked "
+                  f"right steps, {int(np.count_nonzero(~self.left_ok))} blocked left steps")
+
+    def columns(self, xs):
+        """Column index for each world x"""
+        return np.clip((np.asarray(xs) // self.COLUMN_WIDTH).astype(np.int64), 0, len(self.heights) - 1)
+
+    def update(self, terrain, hero_x):
+        """Recompute the field if the hero changed column or the terrain changed.
+
+        Each side of the hero is one reversed cumulative sum of step costs, with
+        a running OR of blocked steps marking columns the hero can't be reached from.
+        """
+        if terrain.height_xs is not self._terrain_xs:
+            self.rebuild(terrain)
+        hero_col = int(self.columns(hero_x))
+        if hero_col == self.hero_col:
+            return
+        self.hero_col = hero_col
+
+        count = len(self.heights)
+        distance = np.full(count, np.inf)
+        direction = np.zeros(count, dtype=np.int8)
+        distance[hero_col] = 0.0
+
+        # Left of the hero: walk right through edges c .. hero_col - 1
+        if hero_col > 0:
+            cost = np.cumsum(self.right_cost[:hero_col][::-1])[::-1]
+            cut = np.logical_or.accumulate(~self.right_ok[:hero_col][::-1])[::-1]
+            distance[:hero_col] = np.where(cut, np.inf, cost)
+            direction[:hero_col] = 1
+
+        # Right of the hero: walk left through edges hero_col .. c - 1
+        if hero_col < count - 1:
+            cost = np.cumsum(self.left_cost[hero_col:])
+            cut = np.logical_or.accumulate(~self.left_ok[hero_col:])
+            distance[hero_col + 1:] = np.where(cut, np.inf, cost)
+            direction[hero_col + 1:] = -1
+
+        self.distance = distance
+        self.direction = direction
+
+    def lookup(self, xs):
+        """(direction, path cost) towards the hero for each world x"""
+        cols = self.columns(xs)
+        return self.direction[cols], self.distance[cols]
+
+    def passable(self, from_xs, to_xs):
+        """Whether walking from each from_x to the matching to_x is allowed (one column at most)"""
+        a = self.columns(from_xs)
+        b = self.columns(to_xs)
+        right = b == a + 1
+        left = b == a - 1
+        ok = b == a
+        ok[right] = self.right_ok[a[right]]
+        ok[left] = self.left_ok[b[left]]
+        # Steps spanning several columns (coarse near-tier updates) are not checked
+        ok[~(ok | right | left)] = True
+        return ok
@@ -0,0 +1,182 @@
+import csv
+import json
+import os
+import time
+import numpy as np
+from settings import FPS, DEBUG_MODE
+
+
+class FrameRecorder:
+    """
+    Opt-in per-frame timing log for diagnosing stutter in real sessions.
+
+    Every frame records the real interval since the previous frame, the time
+    spent in fixed-step updates and in drawing (time.perf_counter), time spent
+    in garbage collection (gc_monitor), the number of goblins, projectiles and
+    effects, and the game state. Frames go into
+    preallocated NumPy arrays used as a ring buffer, so recording allocates
+    nothing and keeps the most recent `capacity` frames. dump() writes them
+    as JSON (with a summary) or CSV (with the summary alongside as JSON).
+    """
+    # Per-frame columns: name -> dtype
+    FIELDS = {
+        'time': np.float64,  # Seconds since recording started
+        'frame_ms': np.float32,  # Real time since the previous frame (includes the frame-rate sleep)
+        'update_ms': np.float32,
+        'draw_ms': np.float32,
+        'steps': np.int16,  # Fixed simulation steps run this frame
+        'goblins': np.int32,
+        'projectiles': np.int32,
+        'effects': np.int32,
+        'gc_ms': np.float32,  # Garbage collection pauses this frame (included in the times above)
+        'gc_gen': np.int8,  # Oldest generation collected this frame, -1 for none
+        'state': np.int8,  # Index into STATES
+    }
+    STATES = ('menu', 'playing', 'game_over')
+    BUDGET_MS = 1000.0 / FPS
+    HITCH_FACTORS = (2, 4, 8)  # Hitch thresholds as multiples of the frame budget
+    MAX_LISTED_HITCHES = 50  # Worst hitches listed individually in the summary
+
+    def __init__(self, capacity, directory, fmt='json'):
+        self.capacity = max(1, capacity)
+        self.directory = directory
+        self.format = fmt
+        self.enabled = False
+        self.count = 0  # Frames recorded in total (the buffer keeps the last capacity)
+        self._start = 0.0
+        self._state_index = {state: i for i, state in enumerate(self.STATES)}
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def start(self):
+        """Start (or restart) recording with an empty buffer"""
+        self.enabled = True
+        self.count = 0
+        self._start = time.perf_counter()
+
+    def record(self, frame_ms, update_ms, draw_ms, steps, goblins, projectiles, effects, state,
+               gc_ms=0.0, gc_gen=-1):
+        """Store one frame (no-op while disabled)"""
+        if not self.enabled:
+            return
+        i = self.count % self.capacity
+        self.time[i] = time.perf_counter() - self._start
+        self.frame_ms[i] = frame_ms
+        self.update_ms[i] = update_ms
+        self.draw_ms[i] = draw_ms
+        self.steps[i] = steps
+        self.goblins[i] = goblins
+        self.projectiles[i] = projectiles
+        self.effects[i] = effects
+        self.gc_ms[i] = gc_ms
+        self.gc_gen[i] = gc_gen
+        self.state[i] = self._state_index.get(state, -1)
+        self.count += 1
+
+    def frames(self):
+        """The recorded columns in chronological order: name -> array"""
+        n = min(self.count, self.capacity)
+        if self.count <= self.capacity:
+            return {name: getattr(self, name)[:n] for name in self.FIELDS}
+        # Buffer has wrapped: oldest frame is the next one to be overwritten
+        split = self.count % self.capacity
+        return {name: np.concatenate((getattr(self, name)[split:], getattr(self, name)[:split]))
+                for name in self.FIELDS}
+
+    def summary(self, columns=None):
+        """Percentiles per timing column and hitch counts / worst hitches"""
+        if columns is None:
+            columns = self.frames()
+        n = len(columns['frame_ms'])
+        result = {
+            'frames': n,
+            'frames_dropped': max(0, self.count - self.capacity),
+            'duration_s': round(float(columns['time'][-1] - columns['time'][0]), 3) if n else 0.0,
+            'budget_ms': round(self.BUDGET_MS, 3),
+        }
+        if not n:
+            return result
+
+        for name in ('frame_ms', 'update_ms', 'draw_ms', 'gc_ms'):
+            values = columns[name].astype(np.float64)
+            p50, p95, p99, p999 = np.percentile(values, (50, 95, 99, 99.9))
+            result[name] = {
+                'mean': round(float(values.mean()), 3),
+                'p50': round(float(p50), 3),
+                'p95': round(float(p95), 3),
+                'p99': round(float(p99), 3),
+                'p99.9': round(float(p999), 3),
+                'max': round(float(values.max()), 3),
+            }
+
+        # A hitch is a frame interval several budgets long
+        frame_ms = columns['frame_ms']
+        result['hitches'] = {f'over_{factor}x': int(np.count_nonzero(frame_ms > self.BUDGET_MS * factor))
+                             for factor in self.HITCH_FACTORS}
+        # Frames in which the collector ran, by oldest generation collected
+        result['gc_frames'] = {f'gen_{gen}': int(np.count_nonzero(columns['gc_gen'] == gen)) for gen in range(3)}
+        hitch_rows = np.flatnonzero(frame_ms > self.BUDGET_MS * self.HITCH_FACTORS[0])
+        worst = hitch_rows[np.argsort(frame_ms[hitch_rows])[::-1][:self.MAX_LISTED_HITCHES]]
+        result['worst_hitches'] = [
+            {
+                'time': round(float(columns['time'][i]), 3),
+                'frame_ms': round(float(frame_ms[i]), 3),
+                'update_ms': round(float(columns['update_ms'][i]), 3),
+                'draw_ms': round(float(columns['draw_ms'][i]), 3),
+                'steps': int(columns['steps'][i]),
+                'goblins': int(columns['goblins'][i]),
+                'projectiles': int(columns['projectiles'][i]),
+                'effects': int(columns['effects'][i]),
+                'gc_ms': round(float(columns['gc_ms'][i]), 3),
+                'gc_gen': int(columns['gc_gen'][i]),
+                'state': self.STATES[columns['state'][i]] if columns['state'][i] >= 0 else 'unknown',
+            }
+            for i in sorted(worst.tolist())
+        ]
+        return result
+
+    def dump(self, path=None):
+        """
+        Write the recorded frames to disk.
+
+        Args:
+            path: Output file; defaults to a timestamped file in the recorder's
+                  directory. A .csv extension (or format 'csv') writes CSV plus
+                  a .summary.json next to it, anything else JSON.
+
+        Returns:
+            The path written, or None if nothing has been recorded
+        """
+        if not self.count:
+            return None
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, time.strftime(f'frames_%Y%m%d_%H%M%S.{self.format}'))
+
+        columns = self.frames()
+        summary = self.summary(columns)
+        # Microsecond precision is plenty and keeps the files small
+        values = {name: (np.round(col.astype(np.float64), 6 if name == 'time' else 3)
+                         if col.dtype.kind == 'f' else col).tolist()
+                  for name, col in columns.items()}
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(self.FIELDS)
+                rows = [values[name] for name in self.FIELDS]
+                rows[-1] = [self.STATES[s] if s >= 0 else 'unknown' for s in values['state']]
+                writer.writerows(zip(*rows))
+            with open(os.path.splitext(path)[0] + '.summary.json', 'w') as f:
+                json.dump(summary, f, indent=2)
+        else:
+            report = {'summary': summary, 'states': list(self.STATES),
+                      'frames': values}
+            with open(path, 'w') as f:
+                json.dump(report, f)
+
+        if DEBUG_MODE:
+            frame = summary['frame_ms']
+            print(f"Frame log written to {path}: {summary['frames']} frames, "
+                  f"p50 {frame['p50']:.2f} p99 {frame['p99']:.2f} max {frame['max']:.2f} ms, "
+                  f"{summary['hitches']['over_2x']} hitches over {2 * self.BUDGET_MS:.1f} ms")
+        return path
@@ -1,34 +1,78 @@
-import pygame
+# Imported first so the start-up timeline covers every other import
+from startup import timeline
+
+import gc
 import random
 import math
+import os
 import sys
+import threading
+import time
+
+# pygame.pkgdata imports pkg_resources (over 100 ms) only to locate pygame's
+# bundled default font, and finds it by path without it; skip it while
+# pygame is imported
+if 'pkg_resources' not in sys.modules:
+    sys.modules['pkg_resources'] = None
+    import pygame
+    del sys.modules['pkg_resources']
+else:
+    import pygame
 
 from settings import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, DEBUG_MODE,
-    GOBLIN_WIDTH, GOBLIN_HEIGHT,
-    SKY_BLUE, PROJECTILE_SPEED, WHITE, BLACK, FONT_NAME
+    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, DEBUG_MODE, SIMULATION_HZ, MAX_FRAME_TIME,
+    SKY_BLUE, PROJECTILE_SPEED, WHITE, BLACK, PALETTE_SURFACES,
+    PROJECTILE_POOL_SIZE, EFFECT_POOL_SIZE, SPAWN_PRESETS, SPAWN_PRESET,
+    FRAME_RECORDER, FRAME_RECORDER_FRAMES, FRAME_RECORDER_FORMAT, FRAME_LOG_DIR,
+    TRACE_SPANS, TRACE_DIR, PROFILE_DIR, MEMORY_TRACEMALLOC, MEMORY_DIR, ALLOC_GUARD, ALLOC_GUARD_BUDGET,
+    GC_SCHEDULED, MUSIC_THREAD
 )
-from utils import load_sprite
+from utils import load_sprite, print_palette_report
 from character_hero import Hero
-from character_goblin import Goblin
+from goblin_horde import GoblinHorde
+from spawn_director import SpawnDirector
+from flow_field import FlowField
 from terrain import Terrain
-from projectile import Projectile
+from projectile_batch import ProjectileBatch, KIND_ICE
 from clouds import CloudManager
 from effects import ExplosionEffect, IceExplosionEffect
+from pool import Pool
+from profiler import FrameProfiler
+from frame_recorder import FrameRecorder
+from tracing import tracer, traced, instant
+from session_profiler import FrameRangeProfiler, SamplingProfiler, profile_paths
+from memory_stats import MemoryReport, start_tracemalloc
+from alloc_guard import AllocationGuard
+from gc_monitor import GCMonitor
+from asset_loader import preload
 from day_night_cycle import DayNightCycle
 from menu import StartMenu
 
+timeline.lap('import')
+
 # Game states
 GAME_STATE_MENU = "menu"
 GAME_STATE_PLAYING = "playing"
 GAME_STATE_GAME_OVER = "game_over"
 
 class Game:
-    def __init__(self):
-        # Initialize pygame and create window
-        pygame.init()
+    def __init__(self, seed=None, spawn_preset=None, music=True):
+        # Optional fixed seed for reproducible worlds and spawns (benchmarks, profiling)
+        if seed is not None:
+            random.seed(seed)
+        
+        # Trace start-up too when tracing from launch
+        if TRACE_SPANS:
+            self.start_trace()
+        
+        # Trace Python allocations from start-up so asset loading is included
+        if MEMORY_TRACEMALLOC:
+            start_tracemalloc()
+        
+        # Initialize only the pygame modules the game uses (pygame.init() would also
+        # start joystick and other subsystems); the mixer starts with the music
+        pygame.display.init()
         pygame.font.init()
-        pygame.mixer.init()  # Initialize the mixer module
         
         # Set up display with double buffering
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.DOUBLEBUF)
@@ -37,40 +81,41 @@ class Game:
         # Create a clock for frame rate control
         self.clock = pygame.time.Clock()
         self.fps = 60
-        self.show_fps = True  # Toggle FPS display with F3
+        self.show_fps = True  # F3 cycles: FPS -> FPS + profiler -> off
         self.last_fps_update = 0
         self.fps_text = ""
+        self.force_redraw = False  # Set when an overlay is toggled
         
-        # For dirty rectangle updates
-        self.last_screen = None
+        # Per-subsystem frame profiler (overlay shown with F3)
+        self.profiler = FrameProfiler()
         
-        # Load the icon image
-        try:
-            icon = load_sprite("game.png")
-            icon = pygame.transform.scale(icon, (32, 32))
-            pygame.display.set_icon(icon)
-        except Exception as e:
-            print(f"Warning: Could not load game icon: {e}")
+        # Opt-in frame-time log (F9 starts recording / writes the log)
+        self.frame_recorder = FrameRecorder(FRAME_RECORDER_FRAMES, FRAME_LOG_DIR, FRAME_RECORDER_FORMAT)
+        if FRAME_RECORDER:
+            self.frame_recorder.start()
         
-        # Initialize fonts
-        from settings import init_fonts
-        init_fonts()
+        # Memory reports (F8): surfaces by owner and top Python allocation sites
+        self.memory_report = MemoryReport(MEMORY_DIR)
+        
+        # Debug check that steady-state frames don't create Surfaces
+        self.alloc_guard = AllocationGuard(ALLOC_GUARD_BUDGET)
+        if ALLOC_GUARD:
+            self.alloc_guard.install()
+        
+        # Collection pause timing (and, when scheduled, collection between frames)
+        self.gc_monitor = GCMonitor(GC_SCHEDULED)
+        self.gc_monitor.install()
+        
+        # Command-line run options (see main): cProfile frame window and frame limit
+        self.cprofile = None
+        self.max_frames = None
+        self.frame_index = 0
         
         # Game state
         self.state = GAME_STATE_MENU
         self.clock = pygame.time.Clock()
         self.running = True
         
-        # Game objects (initialized in reset_game)
-        self.hero = None
-        self.goblins = []
-        self.terrain = None
-        self.cloud_manager = None
-        self.day_night_cycle = None
-        self.projectiles = []
-        self.explosion_effects = []
-        self.camera_x = 0
-        
         # UI - Initialize fonts after pygame is ready
         try:
             self.font = pygame.font.SysFont('Arial', 36)
@@ -81,25 +126,76 @@ class Game:
             self.font = pygame.font.Font(None, 36)
             self.small_font = pygame.font.Font(None, 24)
         
-        # Menu
+        # Menu (drawn over a plain black background)
         self.menu = StartMenu(self.screen)
+        self.menu_background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        timeline.lap('init')
+        
+        # Show the menu straight away; the world is built while it is on screen
+        self.menu.draw(self.menu_background)
+        pygame.event.pump()
+        timeline.shown()
+        timeline.lap('first menu frame')
+        
+        # Load the icon image
+        try:
+            icon = load_sprite("game.png")
+            icon = pygame.transform.scale(icon, (32, 32))
+            pygame.display.set_icon(icon)
+        except Exception as e:
+            print(f"Warning: Could not load game icon: {e}")
+        
+        # Game objects (initialized in reset_game)
+        self.hero = None
+        self.goblins = GoblinHorde(seed=seed)
+        self.spawn_director = SpawnDirector(self.goblins, SPAWN_PRESETS[spawn_preset or SPAWN_PRESET], seed)
+        self.flow_field = FlowField(GoblinHorde.HEIGHT)
+        self.terrain = None
+        self.cloud_manager = None
+        self.day_night_cycle = None
+        self.camera_x = 0
+        self.prev_camera_x = 0
+        
+        # Fixed-timestep simulation
+        self.sim_dt = 1.0 / SIMULATION_HZ
+        
+        # Projectiles are simulated as one batch; explosions are recycled from
+        # fixed-size pools so combat does not construct (or load sprites for) new objects
+        self.projectiles = ProjectileBatch(PROJECTILE_POOL_SIZE)
+        self.explosion_effects = Pool(lambda: ExplosionEffect(0, 0), EFFECT_POOL_SIZE)
+        self.ice_explosion_effects = Pool(lambda: IceExplosionEffect(0, 0), EFFECT_POOL_SIZE)
+        self.effect_pools = (self.explosion_effects, self.ice_explosion_effects)
+        Hero.load_sprites()
+        Hero.load_staff_poses()
+        timeline.lap('assets')
         
         # Initialize game objects
         self.reset_game()
-        
-        # Load and play background music
-        self.load_background_music()
+        timeline.lap('world')
+        
+        # Open the audio device and start the music (on a worker thread where supported)
+        self.music_thread = None
+        if music:
+            if MUSIC_THREAD:
+                self.music_thread = threading.Thread(target=self.load_background_music, name='music', daemon=True)
+                self.music_thread.start()
+            else:
+                self.load_background_music()
     
     def load_background_music(self):
-        """Load and play the background music in a loop"""
+        """Start the mixer, then load and play the background music in a loop"""
+        start = time.perf_counter()
         try:
+            pygame.mixer.init()
             music_path = "assets/sound/hero_vs_goblin_mystical_forest_theme_loopable.wav"
             pygame.mixer.music.load(music_path)
             pygame.mixer.music.set_volume(0.5)  # Set volume to 50%
             pygame.mixer.music.play(-1)  # -1 means loop indefinitely
         except Exception as e:
             print(f"Could not load background music: {e}")
+        timeline.add('audio (thread)' if MUSIC_THREAD else 'audio', start, time.perf_counter())
     
+    @traced('Game.reset_game')
     def reset_game(self):
         """Reset all game objects to their initial state"""
         # Load all terrain sprites
@@ -129,13 +225,9 @@ class Game:
         self.hero.x = WINDOW_WIDTH // 4  # Start 1/4 from the left
         self.hero.y = WINDOW_HEIGHT - 200  # Start above ground
         
-        # Create goblins
-        self.goblins = []
-        for i in range(3):  # Start with 3 goblins
-            goblin = Goblin()
-            goblin.x = WINDOW_WIDTH * 2 + i * 300  # Spread them out
-            goblin.y = WINDOW_HEIGHT - 200
-            self.goblins.append(goblin)
+        # Create goblins (initial placement and respawning come from the spawn preset)
+        self.goblins.clear()
+        self.spawn_director.reset(self.terrain)
         
         # Create cloud manager
         self.cloud_manager = CloudManager()
@@ -144,11 +236,86 @@ class Game:
         self.day_night_cycle = DayNightCycle(self.screen)
         
         # Clear projectiles and effects
-        self.projectiles = []
-        self.explosion_effects = []
+        self.clear_projectiles_and_effects()
         
         # Reset camera
         self.camera_x = 0
+        
+        # Nothing to interpolate from yet
+        self.store_previous_positions()
+        
+        # Keep the new world out of later collections
+        self.gc_monitor.world_loaded()
+    
+    def store_previous_positions(self):
+        """Remember where everything is before a simulation step, for render interpolation"""
+        self.prev_camera_x = self.camera_x
+        self.goblins.store_previous_positions()
+        self.hero.prev_x = self.hero.x
+        self.hero.prev_y = self.hero.y
+        self.projectiles.store_previous_positions()
+    
+    def apply_render_positions(self, alpha):
+        """
+        Move entities and the camera to their interpolated render positions.
+        
+        Args:
+            alpha: Fraction (0-1) of a simulation step elapsed since the last update
+            
+        Returns:
+            List of (obj, x, y) simulation positions to hand to restore_positions()
+        """
+        saved = []
+        # Goblins and projectiles interpolate inside their own draw
+        for obj in (self.hero,):
+            saved.append((obj, obj.x, obj.y))
+            obj.x = obj.prev_x + (obj.x - obj.prev_x) * alpha
+            obj.y = obj.prev_y + (obj.y - obj.prev_y) * alpha
+        saved.append((self, self.camera_x, None))
+        self.camera_x = self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha
+        return saved
+    
+    def restore_positions(self, saved):
+        """Put entities back at their simulation positions after drawing"""
+        for obj, x, y in saved:
+            if obj is self:
+                self.camera_x = x
+            else:
+                obj.x = x
+                obj.y = y
+    
+    def clear_projectiles_and_effects(self):
+        """Remove every projectile and return every explosion to its pool"""
+        self.projectiles.clear()
+        for pool in self.effect_pools:
+            pool.clear()
+    
+    def spawn_explosion(self, is_ice, x, y):
+        """Start a pooled explosion at (x, y); skipped if the pool is exhausted"""
+        pool = self.ice_explosion_effects if is_ice else self.explosion_effects
+        return pool.acquire(x, y)
+    
+    def start_trace(self):
+        """Start a Chrome trace of the session (written by stop_trace or on exit)"""
+        tracer.start(os.path.join(TRACE_DIR, time.strftime('trace_%Y%m%d_%H%M%S.json')))
+    
+    def stop_trace(self):
+        return tracer.stop()
+    
+    def spawn_explosions(self, xs, ys, kinds, ts, dt=0.0):
+        """
+        Start an explosion for each impact event from the projectile batch.
+        
+        Args:
+            ts: Fraction of the step at which each impact happened; the effect is
+                advanced by the rest of the step (dt seconds long) so it is in sync
+        """
+        if tracer.enabled and len(xs):
+            instant('explosions', count=len(xs))
+        for x, y, kind, t in zip(xs.tolist(), ys.tolist(), kinds.tolist(), ts.tolist()):
+            effect = self.spawn_explosion(kind == KIND_ICE, x, y)
+            if effect is not None and t < 1.0:
+                effect.update((1.0 - t) * dt)
     
     def handle_events(self):
         """Handle all pygame events"""
@@ -164,9 +331,27 @@ class Game:
                     else:
                         self.running = False
                 
-                # Toggle FPS display with F3
+                # Cycle FPS counter / profiler overlay with F3
                 elif event.key == pygame.K_F3:
-                    self.show_fps = not self.show_fps
+                    self.cycle_debug_overlay()
+                
+                # Start a span trace, or stop and write it, with F10
+                elif event.key == pygame.K_F10:
+                    if tracer.enabled:
+                        self.stop_trace()
+                    else:
+                        self.start_trace()
+                
+                # Start recording frame times, or write what's been recorded, with F9
+                elif event.key == pygame.K_F9:
+                    if self.frame_recorder.enabled:
+                        self.frame_recorder.dump()
+                    else:
+                        self.frame_recorder.start()
+                
+                # Write a memory report with F8
+                elif event.key == pygame.K_F8:
+                    self.memory_report.dump()
                 
                 # Space bar is used for jumping, not shooting
                 # Projectiles are now only fired with left mouse button
@@ -199,6 +384,17 @@ class Game:
                         elif hasattr(self, 'quit_button') and self.quit_button.collidepoint(mouse_pos):
                             self.state = GAME_STATE_MENU
     
+    def cycle_debug_overlay(self):
+        """F3: FPS counter -> FPS counter and profiler -> nothing -> FPS counter"""
+        if self.profiler.enabled:
+            self.profiler.toggle()
+            self.show_fps = False
+        elif self.show_fps:
+            self.profiler.toggle()
+        else:
+            self.show_fps = True
+        self.force_redraw = True
+    
     def shoot_projectile(self):
         """Shoot a projectile from the hero towards the mouse position"""
         try:
@@ -227,122 +423,91 @@ class Game:
             vy = (dy / dist) * PROJECTILE_SPEED
             
             # Use hero's shoot_projectile method which checks for staff
-            projectile = self.hero.shoot_projectile(vx, vy)
-            if projectile:  # Only add if hero is holding staff and cooldown allows
-                self.projectiles.append(projectile)
-                if DEBUG_MODE:
-                    staff_type = self.hero.staff_type if hasattr(self.hero, 'staff_type') else 'unknown'
-                    # Debug: Projectile firing
-                    # print(f"Fired {staff_type} projectile: {projectile.__class__.__name__}")
-                    
+            # Only fires if the hero is holding the staff and the cooldown allows
+            self.hero.shoot_projectile(vx, vy, self.projectiles)
         except Exception as e:
             if DEBUG_MODE:
-                # Debug: Projectile error
-                # print(f"Error shooting projectile: {e}")
-                pass
+                print(f"Error shooting projectile: {e}")
     
+    @traced('Game.update')
     def update(self, dt):
-        """Update game state"""
+        """Advance the game by one fixed simulation step of dt seconds"""
         if self.state != GAME_STATE_PLAYING:
             return
-            
-        # Debug info disabled for better performance
-        # if DEBUG_MODE and random.random() < 0.01:
-        #     print(f"Hero position: ({self.hero.x:.1f}, {self.hero.y:.1f}), Health: {self.hero.health}")
-        #     for i, goblin in enumerate(self.goblins):
-        #         print(f"  Goblin {i}: pos=({goblin.x:.1f}, {goblin.y:.1f}), attacking={goblin.is_attacking}, cooldown={goblin.attack_cooldown:.2f}")
+        
+        profiler = self.profiler
+        profiler.start()
+        self.store_previous_positions()
         
         # Update hero
         keys = pygame.key.get_pressed()
         self.hero.update(keys, self.terrain, self.camera_x, dt)
+        profiler.lap('hero')
         
-        # Update goblins
-        for goblin in self.goblins:
-            goblin.update(self.hero.x, self.terrain, dt, self.camera_x, self.hero)
-        
-        # Update projectiles
-        for projectile in self.projectiles[:]:
-            explosion = projectile.update(self.terrain, dt)
-            if explosion:
-                self.explosion_effects.append(explosion)
-                self.projectiles.remove(projectile)
-                continue
-            
-            # Check projectile collision with goblins
-            for goblin in self.goblins[:]:
-                if goblin.rect.colliderect(projectile.rect):
-                    # Calculate damage based on projectile type
-                    damage = getattr(projectile, 'damage', 10)
-                    goblin.health -= damage
-                    
-                    # Debug output
-                    if DEBUG_MODE:
-                        projectile_type = 'ice' if hasattr(projectile, 'is_ice') and projectile.is_ice else 'fire'
-                        # Debug: Projectile hit
-                        # print(f"{projectile_type.capitalize()} projectile hit goblin for {damage} damage!")
-                    
-                    # Create explosion effect
-                    if hasattr(projectile, 'is_ice') and projectile.is_ice:
-                        self.explosion_effects.append(IceExplosionEffect(projectile.x, projectile.y))
-                    else:
-                        self.explosion_effects.append(ExplosionEffect(projectile.x, projectile.y))
-                    
-                    # Remove projectile if it hits something
-                    if projectile in self.projectiles:
-                        self.projectiles.remove(projectile)
-                    
-                    # Remove goblin if health is 0
-                    if goblin.health <= 0:
-                        if DEBUG_MODE:
-                            # Debug: Goblin defeated
-                            # print("Goblin defeated!")
-                            pass
-                        self.goblins.remove(goblin)
-                    break
-            
-            # Remove projectiles that go off-screen
-            if (not projectile.active or 
-                projectile.x < self.camera_x - 100 or 
-                projectile.x > self.camera_x + WINDOW_WIDTH + 100 or
-                projectile.y < -100 or 
-                projectile.y > WINDOW_HEIGHT + 100):
-                if projectile in self.projectiles:
-                    self.projectiles.remove(projectile)
+        # Update goblins (all at once), navigating by the shared flow field
+        self.flow_field.update(self.terrain, self.hero.x + self.hero.width / 2)
+        self.goblins.update_all(dt, self.hero, self.terrain, self.camera_x, self.flow_field)
+        profiler.lap('goblins')
+        
+        # Update projectiles; ground impacts and timeouts explode
+        self.spawn_explosions(*self.projectiles.update_all(dt, self.terrain), dt)
+        
+        # Projectile vs goblin: x-sorted broad-phase rebuilt once per tick,
+        # goblin removals deferred and compacted in a single pass afterwards
+        self.goblins.build_broadphase()
+        self.spawn_explosions(*self.projectiles.hit_goblins(self.goblins))
+        
+        # Drop projectiles that go off-screen
+        self.projectiles.cull(self.camera_x - 100, self.camera_x + WINDOW_WIDTH + 100,
+                              -100, WINDOW_HEIGHT + 100)
+        profiler.lap('projectiles')
+        
+        self.goblins.remove_dead()
+        
+        # Spawn new goblins and despawn ones that wandered off
+        self.spawn_director.update(dt, self.hero, self.camera_x)
+        profiler.lap('goblins')
         
         # Update explosion effects
-        for effect in self.explosion_effects[:]:
-            effect.update(dt)
-            if not effect.active:
-                self.explosion_effects.remove(effect)
+        for pool in self.effect_pools:
+            items = pool.items
+            for i in range(len(pool) - 1, -1, -1):
+                effect = items[i]
+                effect.update(dt)
+                if not effect.active:
+                    pool.release(i)
+        profiler.lap('effects')
         
         # Update day/night cycle
         self.day_night_cycle.update(dt)
+        profiler.lap('day/night')
         
         # Update clouds
         self.cloud_manager.update(dt)
+        profiler.lap('clouds')
         
         # Update camera to follow hero
-        self.update_camera()
+        self.update_camera(dt)
+        profiler.lap('camera')
         
         # Check for game over
         if self.hero.health <= 0 and self.state != GAME_STATE_GAME_OVER:
             self.state = GAME_STATE_GAME_OVER
             # Clear any existing projectiles and effects
-            self.projectiles.clear()
-            self.explosion_effects.clear()
+            self.clear_projectiles_and_effects()
     
     def is_visible(self, obj, camera_x):
         """Check if an object is within the visible screen area"""
         # Add some padding to the visibility check to account for objects that are
         # partially off-screen but still need to be rendered
         padding = 100
-        obj_right = getattr(obj, 'x', 0) + getattr(obj, 'width', 0)
+        obj_right = obj.x + obj.width
         screen_right = camera_x + WINDOW_WIDTH + padding
         
         return (obj_right > camera_x - padding and 
-                getattr(obj, 'x', 0) < screen_right)
+                obj.x < screen_right)
     
-    def update_camera(self):
+    def update_camera(self, dt=1.0/60.0):
         """Update camera position to follow the hero"""
         if not hasattr(self.terrain, 'terrain_width'):
             return  # Can't update camera until terrain is initialized
@@ -350,8 +515,8 @@ class Game:
         # Center camera on hero with some lookahead
         target_x = self.hero.x - WINDOW_WIDTH // 3
         
-        # Smooth camera movement with damping
-        camera_speed = 0.1
+        # Smooth camera movement with damping (10% of the gap per 60 FPS frame)
+        camera_speed = 1 - (1 - 0.1) ** (dt * 60)
         dx = target_x - self.camera_x
         self.camera_x += dx * camera_speed
         
@@ -362,8 +527,18 @@ class Game:
         # Apply bounds checking
         self.camera_x = max(min_x, min(self.camera_x, max_x))
     
-    def draw(self, full_redraw=False):
-        """Draw everything to the screen with optimized updates"""
+    @traced('Game.draw')
+    def draw(self, full_redraw=False, alpha=1.0):
+        """Draw everything to the screen with optimized updates
+        
+        alpha is how far (0-1) we are between the last two simulation steps;
+        moving entities and the camera are drawn interpolated by that amount.
+        """
+        profiler = self.profiler
+        profiler.start()
+        saved_positions = self.apply_render_positions(alpha)
+        profiler.lap('entities')
+        
         # Get the current sky color from day/night cycle
         sky_color = self.day_night_cycle.get_sky_color() if hasattr(self.day_night_cycle, 'get_sky_color') else SKY_BLUE
         
@@ -373,34 +548,36 @@ class Game:
         # Draw day/night cycle first (behind everything)
         if hasattr(self.day_night_cycle, 'is_visible') and self.day_night_cycle.is_visible():
             self.day_night_cycle.draw(self.screen)
+        profiler.lap('sky')
         
         # Draw clouds (behind terrain)
         self.cloud_manager.draw(self.screen, self.camera_x)
+        profiler.lap('cloud layer')
         
         # Draw terrain
         self.terrain.draw(self.screen, self.camera_x)
+        profiler.lap('terrain')
         
         # Draw all game objects that are visible
         update_rects = []
         
-        # Draw goblins
-        for goblin in self.goblins:
-            if self.is_visible(goblin, self.camera_x):
-                rect = goblin.draw(self.screen, self.camera_x)
-                if rect:
-                    update_rects.append(rect)
+        # Draw goblins (culled and interpolated by the horde itself)
+        self.goblins.draw(self.screen, self.camera_x, alpha)
         
-        # Draw projectiles and effects
-        for obj in self.projectiles + self.explosion_effects:
-            if hasattr(obj, 'x') and self.is_visible(obj, self.camera_x):
-                rect = obj.draw(self.screen, self.camera_x)
-                if rect:
-                    update_rects.append(rect)
+        # Draw projectiles (culled and interpolated by the batch itself) and effects
+        self.projectiles.draw(self.screen, self.camera_x, alpha)
+        for pool in self.effect_pools:
+            for obj in pool:
+                if self.is_visible(obj, self.camera_x):
+                    rect = obj.draw(self.screen, self.camera_x)
+                    if rect:
+                        update_rects.append(rect)
         
         # Draw hero last (on top of everything else)
         hero_rect = self.hero.draw(self.screen, self.camera_x)
         if hero_rect:
             update_rects.append(hero_rect)
+        profiler.lap('entities')
 
         # Draw HUD
         self.draw_hud()
@@ -409,21 +586,24 @@ class Game:
         if self.state == GAME_STATE_GAME_OVER:
             self.draw_game_over()
 
-        # Update FPS counter if enabled
-        if hasattr(self, 'show_fps') and self.show_fps:
+        # Update FPS counter and profiler overlay if enabled
+        if self.show_fps:
             self.draw_fps()
+        profiler.draw(self.screen)
+        profiler.lap('hud')
 
         # Update only the changed areas of the screen
-        if not full_redraw and hasattr(self, 'show_fps') and not self.show_fps and update_rects:
+        if not full_redraw and not self.show_fps and update_rects:
             pygame.display.update(update_rects)
         else:
             pygame.display.flip()
 
         # Store the last camera position for next frame
         self._last_camera_x = self.camera_x
-
-        # Store the current screen for next frame's dirty rects
-        self.last_screen = self.screen.copy()
+        profiler.lap('flip')
+        
+        self.restore_positions(saved_positions)
+        profiler.lap('entities')
 
         return update_rects
 
@@ -522,36 +702,6 @@ class Game:
                         (WINDOW_WIDTH // 2 - restart.get_width() // 2, 
                          WINDOW_HEIGHT // 2))
 
-    def run(self):
-        """Main game loop with optimized rendering"""
-        last_time = pygame.time.get_ticks()
-        full_redraw = True  # Force full redraw on first frame
-
-        while self.running:
-            # Calculate delta time
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # Convert to seconds
-            last_time = current_time
-            
-            # Handle events
-            self.handle_events()
-            
-            # Update game state
-            self.update(dt)
-            
-            # Draw everything
-            self.draw(full_redraw)
-            full_redraw = False  # After first frame, only update what's necessary
-            
-            # Cap the frame rate
-            self.clock.tick(self.fps)
-            
-            # Toggle FPS display with F3
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_F3]:
-                self.show_fps = not self.show_fps
-                pygame.time.delay(200)  # Small delay to prevent rapid toggling
-    
     def draw_fps(self):
         """Draw FPS counter in the top-right corner"""
         current_time = pygame.time.get_ticks()
@@ -610,31 +760,49 @@ class Game:
         self.restart_button = restart_rect
         self.quit_button = quit_rect
     
+    def close(self):
+        """Undo the process-wide hooks this game installed (GC callback, allocation guard, frozen objects)"""
+        self.gc_monitor.uninstall()
+        self.alloc_guard.uninstall()
+        gc.unfreeze()
+    
     def run(self):
-        """Main game loop with optimized rendering"""
-        last_time = pygame.time.get_ticks()
+        """Main game loop: fixed-timestep simulation with interpolated rendering"""
+        last_time = time.perf_counter()
+        accumulator = 0.0
         full_redraw = True  # Force full redraw on first frame
         
         while self.running:
-            # Calculate delta time
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # Convert to seconds
+            # Measure real elapsed time with a high-resolution clock
+            current_time = time.perf_counter()
+            frame_ms = (current_time - last_time) * 1000.0
+            frame_time = min(current_time - last_time, MAX_FRAME_TIME)
             last_time = current_time
             
             # Cap the frame rate
             self.clock.tick(self.fps)
+            self.profiler.begin_frame()
+            self.alloc_guard.begin_frame()
+            self.gc_monitor.begin_frame()
+            frame_start = time.perf_counter()
+            if self.cprofile is not None:
+                self.cprofile.on_frame(self.frame_index)
+            if self.max_frames is not None and self.frame_index >= self.max_frames:
+                self.running = False
+                break
             
-            # Handle events
+            # Handle events (F3 is handled there, once per key press)
             self.handle_events()
-            
-            # Toggle FPS display with F3
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_F3] and not getattr(self, '_f3_pressed', False):
-                self.show_fps = not self.show_fps
+            if self.force_redraw:
                 full_redraw = True
-            self._f3_pressed = keys[pygame.K_F3]
+                self.force_redraw = False
+            keys = pygame.key.get_pressed()
             
             # Update game state
+            update_ms = 0.0
+            steps = 0
+            state = self.state
+            branch_start = time.perf_counter()
             if self.state == GAME_STATE_MENU:
                 # Draw the world in the background (but don't update it)
                 if full_redraw:
@@ -649,11 +817,17 @@ class Game:
                     full_redraw = True
                 
                 # Always redraw menu to handle animations
-                self.menu.draw(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+                self.menu.draw(self.menu_background)
                 
             elif self.state == GAME_STATE_PLAYING:
-                self.update(dt)
-                self.draw(full_redraw)
+                # Run as many fixed steps as real time demands, then draw in between
+                accumulator += frame_time
+                while accumulator >= self.sim_dt and self.state == GAME_STATE_PLAYING:
+                    self.update(self.sim_dt)
+                    accumulator -= self.sim_dt
+                    steps += 1
+                update_ms = (time.perf_counter() - branch_start) * 1000.0
+                self.draw(full_redraw, accumulator / self.sim_dt)
                 full_redraw = False
                 
             elif self.state == GAME_STATE_GAME_OVER:
@@ -665,354 +839,122 @@ class Game:
                     self.reset_game()
                     self.state = GAME_STATE_PLAYING
                     full_redraw = True
+            
+            draw_ms = (time.perf_counter() - branch_start) * 1000.0 - update_ms
+            
+            # Collect garbage in what is left of the frame budget (scheduled GC only)
+            self.profiler.start()
+            self.gc_monitor.idle_collect(frame_start, 1.0 / self.fps)
+            self.profiler.lap('gc')
+            
+            self.profiler.end_frame()
+            self.alloc_guard.end_frame(state, self.frame_index)
+            self.frame_recorder.record(
+                frame_ms, update_ms, draw_ms, steps,
+                len(self.goblins), len(self.projectiles), sum(len(pool) for pool in self.effect_pools),
+                state, self.gc_monitor.frame_ms, self.gc_monitor.frame_gen)
+            if tracer.enabled:
+                tracer.counter('entities', goblins=len(self.goblins), projectiles=len(self.projectiles),
+                               effects=sum(len(pool) for pool in self.effect_pools))
+                tracer.complete('frame', 'game', current_time, time.perf_counter())
+            if self.frame_index == 0:
+                timeline.lap('first loop frame')
+                if DEBUG_MODE:
+                    timeline.report()
+            self.frame_index += 1
+        
+        # Write the frame-time log, trace and profile of this session
+        if self.frame_recorder.enabled:
+            self.frame_recorder.dump()
+        self.stop_trace()
+        if self.cprofile is not None:
+            self.cprofile.finish()
+        self.alloc_guard.report()
+        if self.music_thread is not None:
+            self.music_thread.join()
+        if DEBUG_MODE:
+            self.gc_monitor.report()
+        
+        # Report palette savings so we can decide which assets stay true colour
+        if PALETTE_SURFACES and DEBUG_MODE:
+            print_palette_report()
         
         # Clean up
+        self.close()
         pygame.quit()
         sys.exit()
 
-def main():
-    """Main entry point"""
-    game = Game()
-    game.run()
+def parse_args(argv=None):
+    """Command-line options for scripted and profiled runs"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Mystic Realm")
+    parser.add_argument('--seed', type=int, help="Fixed seed for the world and spawns")
+    parser.add_argument('--preset', choices=sorted(SPAWN_PRESETS), help="Goblin spawn preset")
+    parser.add_argument('--play', action='store_true', help="Skip the start menu")
+    parser.add_argument('--quit-after', type=int, metavar='FRAMES', help="Exit after this many frames")
     
-
-    # Load sprites for the game
-    stone_img = load_sprite('stone.png')
-    tree_img = load_sprite('tree.png')
-    hero_img = load_sprite('hero.png')
-    goblin_img = load_sprite('goblin.png')
-    grass_img = load_sprite('grass.png')
-    dirt_img = load_sprite('dirt.png')
-    bush_img = load_sprite('bush.png')
-    flower_img = load_sprite('flower.png')
-    pine_tree_img = load_sprite('pine_tree.png')
-    yellow_flower_img = load_sprite('yellow_flower.png')
+    profiling = parser.add_argument_group('profiling')
+    profiling.add_argument('--profile-frames', type=int, metavar='N',
+                           help="cProfile N frames (written as .prof, top entries printed)")
+    profiling.add_argument('--profile-start', type=int, default=120, metavar='M',
+                           help="First frame to profile (default: %(default)s, after start-up)")
+    profiling.add_argument('--profile-top', type=int, default=25, metavar='N',
+                           help="Entries in the printed summaries (default: %(default)s)")
+    profiling.add_argument('--profile-sort', default='cumulative',
+                           choices=('cumulative', 'tottime', 'ncalls'), help="Summary order for cProfile")
+    profiling.add_argument('--sample', action='store_true',
+                           help="Sample the main thread's stack for the whole session (low overhead)")
+    profiling.add_argument('--sample-interval', type=float, default=5.0, metavar='MS',
+                           help="Sampling interval in milliseconds (default: %(default)s)")
+    profiling.add_argument('--profile-out', metavar='STEM',
+                           help=f"Output file name stem in {PROFILE_DIR} (default: timestamped)")
+    profiling.add_argument('--trace', action='store_true', help="Record a Chrome trace of the session")
+    profiling.add_argument('--record-frames', action='store_true', help="Record frame times (frame_recorder)")
+    profiling.add_argument('--tracemalloc', action='store_true',
+                           help="Trace Python allocations (shown with F3, reported with F8)")
+    profiling.add_argument('--gc-scheduled', action='store_true',
+                           help="Freeze the loaded world and collect garbage between frames only")
+    profiling.add_argument('--alloc-guard', type=int, nargs='?', const=ALLOC_GUARD_BUDGET, metavar='BUDGET',
+                           help="Report steady-state frames creating more than BUDGET Surfaces / transforms")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main entry point"""
+    args = parse_args(argv)
+    prof_path, folded_path = profile_paths(PROFILE_DIR, args.profile_out)
     
-    # Set up the display
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-    pygame.display.set_caption("Hero vs Goblin")
-    clock = pygame.time.Clock()
+    if args.tracemalloc:
+        start_tracemalloc()
+    # Start decoding every start-up image on worker threads, once per process;
+    # Game() converts them as it loads its sprites
+    preload()
+    game = Game(seed=args.seed, spawn_preset=args.preset)
+    if args.play:
+        game.state = GAME_STATE_PLAYING
+    game.max_frames = args.quit_after
+    if args.trace and not tracer.enabled:
+        game.start_trace()
+    if args.record_frames:
+        game.frame_recorder.start()
+    if args.gc_scheduled:
+        game.gc_monitor.schedule()
+    if args.alloc_guard is not None:
+        game.alloc_guard.budget = args.alloc_guard
+        game.alloc_guard.install()
+    if args.profile_frames:
+        game.cprofile = FrameRangeProfiler(args.profile_start, args.profile_frames, prof_path,
+                                           args.profile_top, args.profile_sort)
     
-    # Load fonts
+    sampler = None
+    if args.sample:
+        sampler = SamplingProfiler(args.sample_interval / 1000.0, folded_path, args.profile_top)
+        sampler.start()
     try:
-        font = pygame.font.SysFont("Arial", 18, bold=True)
-        font_big = pygame.font.SysFont("Arial", 64, bold=True)
-        font_small = pygame.font.SysFont("Arial", 32)
-    except Exception as e:
-        # print(f"Warning: Could not load system fonts: {e}")
-        # Fallback to default font
-        font = pygame.font.Font(None, 24)
-        font_big = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 32)
-    
-    # Create terrain and clouds
-    terrain = Terrain(grass_img, dirt_img, stone_img, tree_img, pine_tree_img, 
-                     bush_img, flower_img, yellow_flower_img)
-    clouds = CloudManager(num_clouds=15)  # Add cloud system
-    
-    # Initialize day/night cycle
-    day_night_cycle = DayNightCycle()
-
-    # Create character with default colors from sprite sheet
-    hero = Hero()
-    goblins = []  # List of goblins
-    GOBLIN_RESPAWN_INTERVAL = 180  # Try to spawn every 3 seconds
-    goblin_spawn_timer = 0
-    MAX_GOBLINS = 5
-    
-    # Position hero so their feet are at ground level, accounting for visual offset
-    hero.y = terrain.get_ground_height(hero.x + hero.width//2) - hero.height + hero.visual_y_offset
-    hero.update_rect()
-
-    projectiles = []
-    explosion_effects = []  # List to store active explosion effects
-    camera_x = 0
-    
-    
-    # Game loop
-    running = True
-    last_time = pygame.time.get_ticks()
-    # print("Entering main game loop...")
-    while running:
-        # Calculate delta time in seconds
-        current_time = pygame.time.get_ticks()
-        dt = (current_time - last_time) / 1000.0  # Convert to seconds
-        dt = min(dt, 0.1)  # Cap delta time to prevent large jumps
-        last_time = current_time
-        
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Shoot toward mouse position
-                try:
-                    mx, my = pygame.mouse.get_pos()
-                    hero_cx = hero.x + hero.width // 2
-                    hero_cy = hero.y + hero.height // 2
-                    # Adjust mouse x for camera
-                    world_mx = mx + camera_x
-                    dx = world_mx - hero_cx
-                    dy = my - hero_cy
-                    dist = math.hypot(dx, dy)
-                    if dist == 0:
-                        dist = 1
-                    vx = (dx / dist) * PROJECTILE_SPEED
-                    vy = (dy / dist) * PROJECTILE_SPEED
-                    
-                    # Use hero's shoot_projectile method which checks for staff
-                    projectile = hero.shoot_projectile(vx, vy)
-                    if projectile:  # Only add if hero is holding staff and cooldown allows
-                        projectiles.append(projectile)
-                        if DEBUG_MODE:
-                            staff_type = hero.staff_type if hasattr(hero, 'staff_type') else 'unknown'
-                            # Debug: Projectile firing
-                    # print(f"Fired {staff_type} projectile: {projectile.__class__.__name__}")
-                    
-                except Exception as e:
-                    # print(f"Error shooting projectile: {e}")
-                    pass
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:
-                    hero.holding_staff = not hero.holding_staff  # Toggle staff visibility
-                    # Debug: Staff holding state
-                    # print(f"Holding staff: {hero.holding_staff}")
-                elif event.key == pygame.K_2 and hero.holding_staff and hero.projectile_cooldown <= 0:
-                    if hero.switch_staff():
-                        hero.projectile_cooldown = 10  # Small cooldown to prevent rapid switching
-                        # Debug: Staff switching
-                        # print(f"Switched to {hero.staff_type} staff")
-
-        # Get keys
-        keys = pygame.key.get_pressed()
-        
-        # Update hero - handles both movement and animation
-        hero.update(keys, terrain, camera_x, dt)
-        
-        # Update all goblins and pass hero for attack targeting
-        for goblin in goblins:
-            goblin.update(hero.x, terrain, camera_x, dt, hero)  # Pass hero for attack targeting
-        
-        # Update day/night cycle
-        day_night_cycle.update(dt)
-        
-        # Update projectiles and handle explosions
-        for projectile in projectiles[:]:  # Create a copy to safely remove projectiles
-            # Update projectile and check for explosions
-            explosion = projectile.update(terrain, dt)
-            if explosion:
-                explosion_effects.append(explosion)
-                projectiles.remove(projectile)
-                continue
-                
-            # Check projectile collision with goblin
-            for goblin in goblins[:]:  # Create a copy to safely remove goblins
-                if goblin.rect.colliderect(projectile.rect):
-                    # Calculate damage based on projectile type
-                    damage = getattr(projectile, 'damage', 10)  # Default to 10 damage if not specified
-                    goblin.health -= damage
-                    
-                    # Debug output
-                    if DEBUG_MODE:
-                        projectile_type = 'ice' if hasattr(projectile, 'is_ice') and projectile.is_ice else 'fire'
-                        # Debug: Projectile hit
-                        # print(f"{projectile_type.capitalize()} projectile hit goblin for {damage} damage!")
-                    
-                    # Create appropriate explosion effect based on projectile type
-                    if hasattr(projectile, 'is_ice') and projectile.is_ice:
-                        explosion_effects.append(IceExplosionEffect(projectile.x, projectile.y))
-                    else:
-                        explosion_effects.append(ExplosionEffect(projectile.x, projectile.y))
-                        
-                    if projectile in projectiles:  # Check if not already removed
-                        projectiles.remove(projectile)
-                        
-                    if goblin.health <= 0:
-                        if DEBUG_MODE:
-                            # Debug: Goblin defeated
-                            # print("Goblin defeated!")
-                            pass
-                        self.goblins.remove(goblin)
-                    break
-                    
-            # Remove projectile if it's no longer active or goes off screen
-            if (not projectile.active or 
-                projectile.x < 0 or 
-                projectile.x > terrain.terrain_width or
-                projectile.y > WINDOW_HEIGHT):
-                if projectile in projectiles:  # Check if not already removed
-                    projectiles.remove(projectile)
-        
-        # Update explosion effects
-        for effect in explosion_effects[:]:
-            effect.update()
-            if not effect.active:
-                explosion_effects.remove(effect)
-        
-        # Collision detection
-        for goblin in goblins:
-            if goblin.rect.colliderect(hero.rect):
-                if goblin.attack_cooldown <= 0:
-                    hero.health -= goblin.attack_damage
-                    goblin.attack_cooldown = 60
-        # Update camera position
-        camera_x = hero.x - WINDOW_WIDTH // 2
-        # Keep camera within bounds
-        camera_x = max(0, min(camera_x, terrain.terrain_width - WINDOW_WIDTH))
-        
-        # Clear the screen with current sky color
-        screen.fill(day_night_cycle.get_sky_color())
-        
-        # Draw day/night cycle (sun/moon)
-        day_night_cycle.draw(screen)
-        
-        # Update and draw clouds (behind everything else)
-        clouds.update()
-        clouds.draw(screen, camera_x)
-        
-        # Draw terrain first (background)
-        terrain.draw(screen, camera_x)
-        
-        # Draw all game objects in proper order
-        # 1. Draw all projectiles first (behind characters)
-        for projectile in projectiles:
-            projectile.draw(screen, camera_x)
-            
-        # 1.5 Draw all explosion effects (at the same depth as projectiles)
-        for effect in explosion_effects:
-            effect.draw(screen, camera_x)
-            
-        # 2. Draw all goblins with health bars
-        for goblin in goblins:
-            goblin.draw(screen, camera_x)
-            # Draw health bar above goblin
-            bar_width = 40  # Slightly wider for better visibility
-            bar_height = 4
-            health_ratio = max(0, min(1, goblin.health / 30))  # Clamp between 0 and 1
-            bar_x = int(goblin.x - camera_x + (goblin.width - bar_width) // 2)
-            bar_y = int(goblin.y - 10)  # Slightly higher above the goblin
-            # Background (gray)
-            pygame.draw.rect(screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
-            # Health (red)
-            if health_ratio > 0:  # Only draw health if there's some left
-                pygame.draw.rect(screen, (255, 50, 50), (bar_x, bar_y, int(bar_width * health_ratio), bar_height))
-            
-        # 3. Draw the hero (on top of goblins and projectiles)
-        # print("About to draw hero")
-        hero.draw(screen, camera_x)
-        # print("Finished drawing hero")
-        
-        # Draw UI elements (health bar, etc.) on top of everything
-        # --- Draw player health bar ---
-        bar_x, bar_y = 20, 20
-        bar_width, bar_height = 200, 24
-        health_ratio = hero.health / 100
-        pygame.draw.rect(screen, (60, 60, 60), (bar_x-2, bar_y-2, bar_width+4, bar_height+4))  # border
-        pygame.draw.rect(screen, (180, 0, 0), (bar_x, bar_y, bar_width, bar_height))  # background (red)
-        pygame.draw.rect(screen, (0, 200, 0), (bar_x, bar_y, int(bar_width * health_ratio), bar_height))  # green health
-        # Draw health number
-        health_text = font.render(f"HP: {max(0, int(hero.health))}", True, (255,255,255))
-        screen.blit(health_text, (bar_x + 8, bar_y + 2))
-
-        # --- Death screen ---
-        if hero.health <= 0:
-            # Draw a semi-transparent red overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((200, 0, 0, 140))  # RGBA, 140/255 alpha
-            screen.blit(overlay, (0, 0))
-
-            # Draw 'You died' and Respawn button
-            font_big = pygame.font.SysFont("Arial", 64, bold=True)
-            font_small = pygame.font.SysFont("Arial", 32)
-            died_text = font_big.render("You died", True, (255, 255, 255))
-            button_text = font_small.render("Respawn", True, (255,255,255))
-
-            # Button dimensions
-            button_width, button_height = 220, 60
-            button_x = WINDOW_WIDTH//2 - button_width//2
-            button_y = WINDOW_HEIGHT//2 + 10
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-
-            # Draw texts and button
-            screen.blit(died_text, (WINDOW_WIDTH//2 - died_text.get_width()//2, WINDOW_HEIGHT//2 - 100))
-            pygame.draw.rect(screen, (80, 0, 0), button_rect, border_radius=12)
-            pygame.draw.rect(screen, (255, 255, 255), button_rect, 3, border_radius=12)
-            screen.blit(button_text, (button_x + button_width//2 - button_text.get_width()//2, button_y + button_height//2 - button_text.get_height()//2))
-
-            pygame.display.flip()
-            # Pause game updates until button is clicked
-            respawned = False
-            while not respawned:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        exit()
-                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        mx, my = pygame.mouse.get_pos()
-                        if button_rect.collidepoint(mx, my):
-                            # Respawn hero
-                            hero.health = 100
-                            hero.x = 100
-                            hero.y = terrain.get_ground_height(hero.x) - hero.height
-                            hero.update_rect()
-                            respawned = True
-                pygame.time.wait(50)
-            just_respawned = True
-
-        # If we just respawned, skip the rest of the frame and start next loop
-        if 'just_respawned' in locals() and just_respawned:
-            just_respawned = False
-            continue
-
-        # Remove projectiles that go off screen
-        for projectile in projectiles[:]:  # Create a copy to safely remove projectiles
-            if (projectile.x < 0 or projectile.x > terrain.terrain_width or
-                projectile.y < 0 or projectile.y > WINDOW_HEIGHT):
-                projectiles.remove(projectile)
-        
-        
-        # Draw goblin
-        # Removed goblin debug rectangle and health bar
-        # print(f"[DEBUG] Drawing goblin: using sprite? {'yes' if goblin_img is not None else 'no'}")
-        
-        # Draw attack ranges
-        if hero.attacking:
-            pygame.draw.circle(screen, (255, 255, 0), (hero.x + hero.width//2, hero.y + hero.height//2), hero.attack_range, 2)
-        
-        # --- Goblin spawn/despawn logic ---
-        goblin_spawn_timer += 1
-        if goblin_spawn_timer >= GOBLIN_RESPAWN_INTERVAL and len(goblins) < MAX_GOBLINS:
-            # Pick a random x not too close to hero
-            attempts = 0
-            while attempts < 10:
-                spawn_x = random.randint(0, terrain.terrain_width - GOBLIN_WIDTH)
-                if abs(spawn_x - hero.x) > 400:
-                    try:
-                        new_goblin = Goblin()
-                        new_goblin.x = spawn_x
-                        new_goblin.y = terrain.get_ground_height(spawn_x) - GOBLIN_HEIGHT
-                        new_goblin.update_rect()
-                        new_goblin.despawn_timer = 0
-                        goblins.append(new_goblin)
-                        # print(f"Spawned new goblin at ({new_goblin.x}, {new_goblin.y})")
-                        break
-                    except Exception as e:
-                        # print(f"Error spawning goblin: {e}")
-                        pass
-                attempts += 1
-            goblin_spawn_timer = 0
-        # Despawn goblins if off screen too long
-        for goblin in list(goblins):
-            # If goblin is on screen, reset timer
-            if 0 <= goblin.x - camera_x <= WINDOW_WIDTH:
-                goblin.despawn_timer = 0
-            else:
-                goblin.despawn_timer = getattr(goblin, 'despawn_timer', 0) + 1
-                if goblin.despawn_timer > FPS * 10:  # 10 seconds off screen
-                    goblins.remove(goblin)
-
-        pygame.display.flip()
-        clock.tick(FPS)
+        game.run()
+    finally:
+        if sampler is not None:
+            sampler.stop()
 
 if __name__ == "__main__":
     main()
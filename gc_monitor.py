@@ -0,0 +1,139 @@
+"""
+Garbage collector pause monitoring and frame-aware collection scheduling.
+
+GCMonitor hooks gc.callbacks and records how long each collection takes and
+which generation it was. The time is added to the current frame (read by
+the frame recorder as gc_ms / gc_gen) and appears as 'gc' spans in traces.
+
+In scheduled mode (settings.GC_SCHEDULED or game.py --gc-scheduled), the
+collector does not interrupt frames:
+  - world_loaded() collects once and gc.freeze()s the loaded world, so
+    later collections skip the long-lived sprites, terrain and pools
+  - automatic collection is disabled
+  - idle_collect() runs once per frame after the frame's work. It collects
+    the generation CPython would have collected, but only if enough of the
+    frame budget is left, or if collection is overdue.
+"""
+import gc
+import time
+from settings import DEBUG_MODE
+from tracing import tracer
+
+
+class GCMonitor:
+    MIN_IDLE_MS = 2.0  # Frame budget that must be left for an idle collection
+    FULL_IDLE_MS = 6.0  # ... and for an idle full (generation 2) collection
+    OVERDUE_FACTOR = 8  # Collect regardless of the budget at this multiple of the gen 0 threshold
+
+    def __init__(self, scheduled=False):
+        self.scheduled = scheduled
+        self.installed = False
+        # Current frame: collection time and the oldest generation collected (-1: none)
+        self.frame_ms = 0.0
+        self.frame_gen = -1
+        # Per generation: [collections, total ms, max ms, objects collected] for each trigger
+        self.stats = {kind: [[0, 0.0, 0.0, 0] for _ in range(3)] for kind in ('automatic', 'idle', 'load')}
+        self._start = 0.0
+        self._kind = 'automatic'  # What triggered the running collection
+
+    def install(self):
+        """Start timing collections (and take over scheduling in scheduled mode)"""
+        if self.installed:
+            return
+        gc.callbacks.append(self._callback)
+        self.installed = True
+        if self.scheduled:
+            gc.disable()
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        gc.callbacks.remove(self._callback)
+        self.installed = False
+        if self.scheduled:
+            gc.unfreeze()
+            gc.enable()
+
+    def schedule(self):
+        """Switch to scheduled mode once the world is already loaded"""
+        if self.scheduled:
+            return
+        self.scheduled = True
+        if self.installed:
+            gc.disable()
+        self.world_loaded()
+
+    def _callback(self, phase, info):
+        if phase == 'start':
+            self._start = time.perf_counter()
+            return
+        end = time.perf_counter()
+        generation = info['generation']
+        ms = (end - self._start) * 1000.0
+        self.frame_ms += ms
+        self.frame_gen = max(self.frame_gen, generation)
+        stats = self.stats[self._kind][generation]
+        stats[0] += 1
+        stats[1] += ms
+        stats[2] = max(stats[2], ms)
+        stats[3] += info['collected']
+        if tracer.enabled:
+            tracer.complete(f'gc gen {generation}', 'gc', self._start, end,
+                            {'collected': info['collected'], 'trigger': self._kind})
+
+    def begin_frame(self):
+        self.frame_ms = 0.0
+        self.frame_gen = -1
+
+    def world_loaded(self):
+        """Freeze everything loaded so far out of future collections (scheduled mode)"""
+        if not self.scheduled:
+            return
+        gc.unfreeze()  # A previous world is garbage now; let it be collected
+        self._collect(2, 'load')
+        gc.freeze()
+        if DEBUG_MODE:
+            print(f"GC: froze {gc.get_freeze_count()} objects after world load")
+
+    def idle_collect(self, frame_start, budget_s):
+        """
+        Run a due collection in the time left in this frame (scheduled mode).
+
+        Args:
+            frame_start: time.perf_counter() at the start of the frame
+            budget_s: Frame budget in seconds (1 / FPS)
+        """
+        if not self.scheduled:
+            return
+        count0, count1, count2 = gc.get_count()
+        threshold0, threshold1, threshold2 = gc.get_threshold()
+        if count0 < threshold0:
+            return
+        generation = 0
+        if count1 >= threshold1:
+            generation = 1
+            if count2 >= threshold2:
+                generation = 2
+
+        idle_ms = (budget_s - (time.perf_counter() - frame_start)) * 1000.0
+        needed_ms = self.FULL_IDLE_MS if generation == 2 else self.MIN_IDLE_MS
+        if idle_ms < needed_ms and count0 < threshold0 * self.OVERDUE_FACTOR:
+            return  # Wait for a frame with more slack
+        self._collect(generation, 'idle')
+
+    def _collect(self, generation, kind):
+        self._kind = kind
+        try:
+            gc.collect(generation)
+        finally:
+            self._kind = 'automatic'
+
+    def report(self):
+        """Print collection counts and pause times per generation"""
+        if not self.installed:
+            return
+        for kind, generations in self.stats.items():
+            for generation, (count, total_ms, max_ms, collected) in enumerate(generations):
+                if count:
+                    print(f"GC {kind} gen {generation}: {count} collections, "
+                          f"{total_ms / count:.3f} ms avg, {max_ms:.3f} ms max, {collected} objects freed")
@@ -0,0 +1,586 @@
+import numpy as np
+import pygame
+from settings import WINDOW_WIDTH, DEBUG_MODE
+from tracing import traced
+from character_goblin import Goblin
+
+# Animation ids stored per goblin
+ANIM_IDLE = 0
+ANIM_WALK = 1
+ANIM_DEATH = 2
+ANIM_ATTACK = 3
+ANIM_NAMES = ('idle', 'walk', 'death', 'attack')
+
+# AI states stored per goblin
+STATE_WANDER = 0
+STATE_CHASE = 1
+
+# AI level-of-detail tiers (see GoblinHorde.update_all)
+LOD_FULL = 0
+LOD_NEAR = 1
+LOD_DORMANT = 2
+
+
+class NeighbourIndex:
+    """
+    Goblins sorted by x for neighbour queries.
+
+    Built once per tick with one argsort; each query is two binary searches
+    per goblin plus prefix sums, so a whole batch costs O(n log n) instead of
+    comparing every pair. Results come back in the caller's original order.
+    """
+
+    def __init__(self, xs):
+        self.order = np.argsort(xs, kind='stable')
+        self.xs = xs[self.order]
+
+    def _window(self, radius):
+        """Sorted-position range [lo, hi) of the goblins within radius of each goblin"""
+        lo = np.searchsorted(self.xs, self.xs - radius, side='left')
+        hi = np.searchsorted(self.xs, self.xs + radius, side='right')
+        return lo, hi
+
+    def _unsort(self, values):
+        out = np.empty_like(values)
+        out[self.order] = values
+        return out
+
+    def neighbour_sums(self, values, radius):
+        """(count, sum of values) over the other goblins within radius of each goblin"""
+        sorted_values = values[self.order]
+        prefix = np.concatenate(([0], np.cumsum(sorted_values)))
+        lo, hi = self._window(radius)
+        sums = prefix[hi] - prefix[lo] - sorted_values
+        return self._unsort(hi - lo - 1), self._unsort(sums)
+
+    def separation(self, radius):
+        """Net push away from neighbours closer than radius (positive = to the right).
+
+        Each neighbour contributes radius - gap. Goblins at exactly the same x
+        are split apart by their order in the index.
+        """
+        xs = self.xs
+        idx = np.arange(len(xs))
+        prefix = np.concatenate(([0.0], np.cumsum(xs)))
+        lo, hi = self._window(radius)
+        left = (idx - lo) * (radius - xs) + (prefix[idx] - prefix[lo])
+        right = (hi - idx - 1) * (radius + xs) - (prefix[hi] - prefix[idx + 1])
+        return self._unsort(left - right)
+
+
+class GoblinHorde:
+    """
+    Struct-of-arrays store for all goblins in the world.
+
+    Every goblin is a row index into a set of NumPy arrays (position, health,
+    AI state, timers, animation). Rows [0, count) are live; removing a goblin
+    moves the last row into its slot so live rows stay packed. update_all()
+    runs the same wander/chase/attack rules as Goblin.update for every goblin
+    at once.
+    """
+    # Tuning shared by every goblin (matches Goblin / Character defaults)
+    WIDTH = int(Goblin.SPRITE_WIDTH * 0.7)
+    HEIGHT = Goblin.SPRITE_HEIGHT
+    MAX_HEALTH = 50
+    SPEED = 3  # Pixels per 60 FPS frame
+    CHASE_RANGE = 300
+    ATTACK_RANGE = 60
+    ATTACK_DAMAGE = 10
+    ATTACK_DURATION = 0.6  # Seconds
+    ATTACK_COOLDOWN = 1.0  # Seconds
+    COLOR = (34, 139, 34)
+
+    # AI level of detail
+    LOD_MARGIN = 150  # Pixels beyond the screen edge still updated in full (covers the draw padding and projectile cull box)
+    NEAR_RANGE = 1200  # Pixels beyond that which still get coarse updates
+    NEAR_INTERVAL = 4  # Ticks between coarse updates (and ground snaps) of a near goblin
+
+    # Group behaviour (on-screen goblins)
+    SEPARATION_RADIUS = 20  # Goblins closer than this push apart
+    SEPARATION_SPEED = 1.5  # Pixels per 60 FPS frame when fully overlapping
+    PACK_RADIUS = 120  # Neighbours within this share heading and alerts
+    ALERT_RANGE = 600  # Packmates this close to the hero join a chase
+
+    # Per-goblin arrays: name -> dtype
+    FIELDS = {
+        'x': np.float64,
+        'y': np.float64,
+        'prev_x': np.float64,
+        'prev_y': np.float64,
+        'health': np.int32,
+        'state': np.int8,
+        'wander_dir': np.int8,
+        'wander_timer': np.float64,
+        'facing_right': np.bool_,
+        'is_attacking': np.bool_,
+        'attack_cooldown': np.float64,
+        'attack_timer': np.float64,
+        'attack_frame': np.int16,
+        'anim': np.int8,
+        'anim_time': np.float64,
+        'anim_frame': np.int16,
+        'walk_frame': np.int16,
+        'walk_frame_time': np.float64,
+        'lod': np.int8,
+        'lod_time': np.float64,  # Seconds since the last coarse update (near tier)
+        'offscreen_time': np.float64,  # Seconds since last on screen (for despawning)
+    }
+
+    def __init__(self, capacity=64, seed=None):
+        self.count = 0
+        self.capacity = max(1, capacity)
+        self.rng = np.random.default_rng(seed)
+        self.tick = 0
+        self.lod_counts = [0, 0, 0]  # Goblins per LOD tier on the last update
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+        # Broad-phase: live rows sorted by hitbox left edge (see build_broadphase)
+        self._bp_order = np.zeros(0, dtype=np.int64)
+        self._bp_x = np.zeros(0, dtype=np.int64)
+
+        # Shared animation clips (fall back to rectangles if loading fails)
+        try:
+            Goblin.load_animations()
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Error loading goblin animations: {e}")
+        self.animations_right = Goblin._animations_right
+        self.animations_left = Goblin._animations_left
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        """Double the capacity of every array"""
+        self.capacity *= 2
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x, y):
+        """Add a goblin at (x, y) and return its row index"""
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        self.count += 1
+        for name in self.FIELDS:
+            getattr(self, name)[i] = 0
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.health[i] = self.MAX_HEALTH
+        self.state[i] = STATE_WANDER
+        return i
+
+    def remove(self, i):
+        """Remove goblin i by moving the last live goblin into its slot"""
+        last = self.count - 1
+        if i != last:
+            for name in self.FIELDS:
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+        self.count = last
+
+    def clear(self):
+        self.count = 0
+
+    def damage(self, i, amount):
+        """Apply damage to goblin i; returns True if that killed it.
+        
+        Dead goblins stay in place until remove_dead() so row indices stay
+        valid for the rest of the collision pass.
+        """
+        self.health[i] -= amount
+        return self.health[i] <= 0
+
+    @traced('GoblinHorde.spawn_many', 'goblins')
+    def spawn_many(self, xs, ys):
+        """Add a goblin at each (x, y) in one go; returns the first new row index.
+        
+        Rows left behind by removed goblins are reused; the arrays only grow
+        when the population exceeds anything seen before.
+        """
+        count = len(xs)
+        start = self.count
+        while start + count > self.capacity:
+            self._grow()
+        end = start + count
+        for name in self.FIELDS:
+            getattr(self, name)[start:end] = 0
+        self.x[start:end] = self.prev_x[start:end] = xs
+        self.y[start:end] = self.prev_y[start:end] = ys
+        self.health[start:end] = self.MAX_HEALTH
+        self.state[start:end] = STATE_WANDER
+        self.count = end
+        return start
+
+    def _compact(self, keep):
+        """Keep only the rows where keep is True, in one pass; returns how many were dropped"""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return 0
+        for name in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:kept] = arr[:n][keep]
+        self.count = kept
+        return n - kept
+
+    def remove_dead(self):
+        """Compact out every goblin with no health left in one pass; returns how many"""
+        return self._compact(self.health[:self.count] > 0)
+
+    def despawn(self, mask):
+        """Remove every goblin where mask (one entry per live goblin) is True; returns how many"""
+        return self._compact(~mask)
+
+    def store_previous_positions(self):
+        """Remember positions before a simulation step (for render interpolation)"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    @traced('GoblinHorde.build_broadphase', 'goblins')
+    def build_broadphase(self):
+        """Sort live goblins by x once per tick for sweep-and-prune queries.
+        
+        The world is essentially one-dimensional along x, so sorting the hitbox
+        left edges is enough to find overlap candidates with two binary searches.
+        Only goblins in the LOD_FULL tier are indexed: projectiles are culled
+        well inside that band, so nothing further away can be hit.
+        """
+        rows = np.flatnonzero(self.lod[:self.count] == LOD_FULL)
+        gx = self.x[rows].astype(np.int64)
+        order = np.argsort(gx, kind='stable')
+        self._bp_order = rows[order]
+        self._bp_x = gx[order]
+
+    def candidates(self, rect):
+        """Rows of goblins whose hitbox overlaps rect along x (broad-phase)"""
+        # Overlap on x means rect.left - WIDTH < goblin_x < rect.right
+        lo = np.searchsorted(self._bp_x, rect.left - self.WIDTH, side='right')
+        hi = np.searchsorted(self._bp_x, rect.right, side='left')
+        return self._bp_order[lo:hi]
+
+    def first_hit(self, rect):
+        """Lowest row of a live goblin whose hitbox overlaps rect, or -1.
+        
+        Uses the broad-phase from the last build_broadphase() call, then
+        narrows the candidates with a single Rect.collidelistall.
+        """
+        rows = self.candidates(rect)
+        if not rows.size:
+            return -1
+        rows = rows[self.health[rows] > 0]
+        hits = rect.collidelistall([self.get_rect(i) for i in rows])
+        return int(rows[hits].min()) if hits else -1
+
+    def overlapping(self, lefts, tops, widths, heights):
+        """Every (box, row) pair where box i overlaps the hitbox of a live goblin.
+        
+        The batched form of first_hit(): one pair of searchsorted calls finds
+        the broad-phase window of every box, the windows are expanded into
+        candidate pairs and the Rect overlap test runs on the arrays. Boxes
+        are integer pixel rects like pygame.Rect, given as int64 arrays.
+        
+        Returns:
+            (boxes, rows) arrays, sorted by box and then by row
+        """
+        lo = np.searchsorted(self._bp_x, lefts - self.WIDTH, side='right')
+        hi = np.searchsorted(self._bp_x, lefts + widths, side='left')
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        # Expand each window [lo, hi) into its broad-phase slots
+        boxes = np.repeat(np.arange(len(lefts)), counts)
+        slots = np.arange(total) + np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        rows = self._bp_order[slots]
+        # The window already guarantees overlap on x; test y like Rect.colliderect
+        gy = self.y[rows].astype(np.int64)
+        box_tops = tops[boxes]
+        keep = (self.health[rows] > 0) & (box_tops < gy + self.HEIGHT) & (gy < box_tops + heights[boxes])
+        boxes = boxes[keep]
+        rows = rows[keep]
+        order = np.lexsort((rows, boxes))
+        return boxes[order], rows[order]
+
+    def get_rect(self, i):
+        return pygame.Rect(int(self.x[i]), int(self.y[i]), self.WIDTH, self.HEIGHT)
+
+    @traced('GoblinHorde.update_all', 'goblins')
+    def update_all(self, dt, hero, terrain, camera_x=0, flow=None):
+        """
+        Advance the goblins by one step of dt seconds, at a level of detail
+        that depends on where each one is relative to the screen.
+
+        LOD_FULL (on screen): wander/chase, ground snap, animation and attacks
+        every tick. LOD_NEAR (within NEAR_RANGE of the screen): movement and
+        ground snap only, every NEAR_INTERVAL ticks with the time accumulated
+        since their last update. LOD_DORMANT: frozen until they come back in
+        range. Work scales with the goblins near the player rather than the
+        whole population.
+
+        With a FlowField, chasing goblins follow it instead of running straight
+        at the hero and nobody walks up an impassable cliff.
+        """
+        n = self.count
+        if n == 0:
+            return
+        self.tick += 1
+
+        # Classify by distance from the visible area
+        x = self.x[:n]
+        margin = self.LOD_MARGIN
+        left = camera_x - margin
+        right = camera_x + WINDOW_WIDTH + margin
+        off_by = np.maximum(left - (x + self.WIDTH), x - right)
+        lod = self.lod[:n]
+        lod[:] = np.where(off_by <= 0, LOD_FULL,
+                 np.where(off_by <= self.NEAR_RANGE, LOD_NEAR, LOD_DORMANT))
+
+        full = np.flatnonzero(lod == LOD_FULL)
+        near = np.flatnonzero(lod == LOD_NEAR)
+        lod_time = self.lod_time[:n]
+        self.lod_counts[:] = (full.size, near.size, n - full.size - near.size)
+
+        if full.size:
+            lod_time[full] = 0
+            self._think(full, dt, hero, terrain, camera_x, flow, flock=True)
+            self._update_animation(full, dt)
+            self._update_attacks(full, dt, hero)
+
+        if near.size:
+            # Stagger coarse updates across ticks by row so the cost is spread evenly
+            lod_time[near] += dt
+            due = near[(near + self.tick) % self.NEAR_INTERVAL == 0]
+            if due.size:
+                self._think(due, lod_time[due], hero, terrain, camera_x, flow)
+                lod_time[due] = 0
+
+        # Dormant goblins don't bank time, so they wake up without jumping
+        lod_time[lod == LOD_DORMANT] = 0
+
+    def _think(self, rows, dt, hero, terrain, camera_x, flow=None, flock=False):
+        """Wander/chase movement and ground snapping for the given rows.
+
+        dt is seconds since each row was last updated (scalar or per row).
+        With flock, goblins also react to each other through a NeighbourIndex:
+        a wanderer joins the chase when a packmate is chasing, picks its new
+        heading to match the pack, and overlapping goblins push apart.
+        """
+        x = self.x[rows]
+        start_x = x.copy()
+        y = self.y[rows]
+        wander_dir = self.wander_dir[rows]
+        facing = self.facing_right[rows]
+        timer = self.wander_timer[rows]
+        dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), rows.shape)
+
+        # Ground height at each goblin's centre, in one heightmap gather
+        ground = terrain.get_ground_heights(x + self.WIDTH / 2)
+        distance = hero.x - x
+
+        # Chase when the hero is close, always facing the hero
+        chase = np.abs(distance) < self.CHASE_RANGE
+        neighbours = NeighbourIndex(x) if flock and len(rows) > 1 else None
+        if neighbours is not None:
+            # Pack alert: a chasing packmate pulls in wanderers that aren't too far off
+            chasing_mates = neighbours.neighbour_sums(chase.astype(np.int32), self.PACK_RADIUS)[1]
+            chase |= (chasing_mates > 0) & (np.abs(distance) < self.ALERT_RANGE)
+        wander = ~chase
+        self.state[rows] = np.where(chase, STATE_CHASE, STATE_WANDER)
+        if flow is not None:
+            # Step the way the shared field says (cliffs are enforced below)
+            chase_dir, _ = flow.lookup(x[chase] + self.WIDTH / 2)
+        else:
+            chase_dir = np.where(distance[chase] > 0, 1, -1)
+        wander_dir[chase] = chase_dir
+        facing[chase] = distance[chase] > 0
+
+        # Wandering goblins that left the screen turn back towards it
+        screen_left = camera_x
+        screen_right = camera_x + WINDOW_WIDTH
+        off_left = wander & (x < screen_left) & ~facing
+        off_right = wander & ~off_left & (x > screen_right) & facing
+        others = wander & ~off_left & ~off_right & (wander_dir != 0)
+        facing[off_left] = True
+        wander_dir[off_left] = 1
+        facing[off_right] = False
+        wander_dir[off_right] = -1
+        facing[others] = wander_dir[others] > 0
+
+        move_speed = self.SPEED * 60 * dt
+
+        # Wander: pick a new direction when the timer runs out, otherwise keep walking
+        pick = wander & (timer <= 0)
+        picked = int(np.count_nonzero(pick))
+        if picked:
+            new_dir = self.rng.integers(-1, 2, size=picked)
+            if neighbours is not None:
+                # Alignment: follow the way most of the pack is heading
+                mates, heading = neighbours.neighbour_sums(wander_dir.astype(np.int32), self.PACK_RADIUS)
+                mates = mates[pick]
+                heading = heading[pick]
+                follow = (mates > 0) & (np.abs(heading) * 2 > mates)
+                new_dir[follow] = np.sign(heading[follow])
+            changed = new_dir != wander_dir[pick]
+            facing[pick] = np.where(changed, new_dir > 0, facing[pick])
+            wander_dir[pick] = new_dir
+            timer[pick] = self.rng.integers(40, 121, size=picked) / 60.0  # seconds
+        walking = wander & ~pick
+        timer[walking] -= dt[walking]
+        x[walking] += wander_dir[walking] * move_speed[walking]
+
+        # Chase: run at the hero (along the flow field when there is one)
+        x[chase] += chase_dir * move_speed[chase]
+
+        # Separation: overlapping goblins spread out
+        if neighbours is not None:
+            push = neighbours.separation(self.SEPARATION_RADIUS)
+            x += np.clip(push / self.SEPARATION_RADIUS, -1, 1) * self.SEPARATION_SPEED * 60 * dt
+
+        # Cliffs too high to climb stop goblins; wanderers turn around
+        if flow is not None:
+            blocked = ~flow.passable(start_x + self.WIDTH / 2, x + self.WIDTH / 2)
+            x[blocked] = start_x[blocked]
+            turn = blocked & wander
+            wander_dir[turn] = -wander_dir[turn]
+            facing[turn] = wander_dir[turn] > 0
+
+        # Keep goblins on the ground and inside the world
+        target_y = ground - self.HEIGHT
+        snap = np.abs(y - target_y) > 1
+        y[snap] = target_y[snap]
+        np.clip(x, 0, terrain.terrain_width - self.WIDTH, out=x)
+
+        self.x[rows] = x
+        self.y[rows] = y
+        self.wander_dir[rows] = wander_dir
+        self.facing_right[rows] = facing
+        self.wander_timer[rows] = timer
+
+    def _update_animation(self, rows, dt):
+        """Vectorised equivalent of Goblin.update_animation for the given rows"""
+        anim = self.anim[rows]
+        anim_time = self.anim_time[rows]
+        walk_frame = self.walk_frame[rows]
+        walk_frame_time = self.walk_frame_time[rows]
+
+        anim_time += dt
+        new_anim = np.where(self.health[rows] <= 0, ANIM_DEATH,
+                   np.where(self.is_attacking[rows], ANIM_ATTACK,
+                   np.where(self.wander_dir[rows] != 0, ANIM_WALK, ANIM_IDLE)))
+
+        # Starting to move restarts the walk cycle; stopping restarts the idle loop
+        start_walk = (new_anim == ANIM_WALK) & (anim != ANIM_WALK) & (anim != ANIM_ATTACK)
+        stop_walk = (new_anim == ANIM_IDLE) & (anim == ANIM_WALK)
+        anim_time[start_walk | stop_walk] = 0
+        walk_frame[start_walk] = 0
+        anim = new_anim
+
+        # Walk: ping-pong sequence of 6 frames at 0.1s per frame
+        walking = anim == ANIM_WALK
+        walk_frame_time[walking] += dt
+        advance = walking & (walk_frame_time >= 0.1)
+        walk_frame[advance] = (walk_frame[advance] + 1) % 6
+        walk_frame_time[advance] = 0
+
+        # Idle: loop the first 2 frames at 0.2s per frame
+        idle_frame = (anim_time / 0.2).astype(np.int16) % 2
+        self.anim_frame[rows] = np.where(anim == ANIM_WALK, walk_frame,
+                                np.where(anim == ANIM_ATTACK, self.attack_frame[rows],
+                                np.where(anim == ANIM_IDLE, idle_frame, self.anim_frame[rows])))
+        self.anim[rows] = anim
+        self.anim_time[rows] = anim_time
+        self.walk_frame[rows] = walk_frame
+        self.walk_frame_time[rows] = walk_frame_time
+
+    def _update_attacks(self, rows, dt, hero):
+        """Start, advance and finish melee attacks on the hero for the given rows"""
+        cooldown = self.attack_cooldown[rows]
+        attacking = self.is_attacking[rows]
+        attack_timer = self.attack_timer[rows]
+        attack_frame = self.attack_frame[rows]
+
+        cooling = cooldown > 0
+        cooldown[cooling] -= dt
+
+        starters = (~attacking & (cooldown <= 0) &
+                    (np.abs(self.x[rows] - hero.x) <= self.ATTACK_RANGE) &
+                    (np.abs(self.y[rows] - hero.y) < 100))
+        for _ in range(int(np.count_nonzero(starters))):
+            hero.take_damage(self.ATTACK_DAMAGE)
+        attacking[starters] = True
+        attack_timer[starters] = self.ATTACK_DURATION
+        attack_frame[starters] = 0
+        cooldown[starters] = self.ATTACK_COOLDOWN
+
+        attack_timer[attacking] -= dt
+        finished = attacking & (attack_timer <= 0)
+        attacking[finished] = False
+        attack_frame[finished] = 0
+
+        frames = len(self.animations_right.get('attack', ())) or 1
+        active = attacking & ~finished
+        progress = 1.0 - attack_timer[active] / self.ATTACK_DURATION
+        attack_frame[active] = np.minimum(frames - 1, (progress * frames).astype(np.int16))
+
+        self.attack_cooldown[rows] = cooldown
+        self.is_attacking[rows] = attacking
+        self.attack_timer[rows] = attack_timer
+        self.attack_frame[rows] = attack_frame
+
+    @traced('GoblinHorde.draw', 'goblins')
+    def draw(self, screen, camera_x, alpha=1.0):
+        """Draw every on-screen goblin, interpolated alpha of the way into the last step"""
+        n = self.count
+        if n == 0:
+            return
+        xs = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        ys = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+
+        # Same padding as Game.is_visible
+        padding = 100
+        visible = np.flatnonzero((xs + self.WIDTH > camera_x - padding) &
+                                 (xs < camera_x + WINDOW_WIDTH + padding))
+
+        for i in visible:
+            x = xs[i]
+            y = ys[i]
+            clips = self.animations_right if self.facing_right[i] else self.animations_left
+            frames = clips.get(ANIM_NAMES[self.anim[i]]) if clips else None
+            frame_index = self.anim_frame[i]
+            if not frames or not 0 <= frame_index < len(frames):
+                # Fallback: draw a rectangle if no animation is available
+                pygame.draw.rect(screen, self.COLOR,
+                                 (x - camera_x, y + 10, self.WIDTH, self.HEIGHT))  # +10px down
+                continue
+            frame = frames[frame_index]
+
+            # Keep feet planted, adjusted 10px down
+            draw_x = x - camera_x - (frame.get_width() - self.WIDTH) // 2
+            draw_y = y - (frame.get_height() - self.HEIGHT) + 10
+            screen.blit(frame, (draw_x, draw_y))
+
+            self._draw_health_bar(screen, x - camera_x, y + 10, self.health[i])
+
+    def _draw_health_bar(self, screen, screen_x, y, health):
+        """Draw a health bar above a goblin (same layout as Goblin.draw_health_bar)"""
+        if health <= 0:
+            return
+        bar_width = 40
+        bar_height = 5
+        border = 1
+        bar_x = screen_x + (self.WIDTH - bar_width) // 2
+        bar_y = y - 15
+        pygame.draw.rect(screen, (0, 0, 0),
+                         (bar_x - border, bar_y - border,
+                          bar_width + 2 * border, bar_height + 2 * border))
+        pygame.draw.rect(screen, (150, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+        health_width = int((health / self.MAX_HEALTH) * bar_width)
+        if health_width > 0:
+            pygame.draw.rect(screen, (0, 200, 0), (bar_x, bar_y, health_width, bar_height))
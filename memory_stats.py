@@ -0,0 +1,174 @@
+"""
+Memory accounting for pygame Surfaces and Python objects.
+
+Surfaces that live beyond a frame (sprite caches, pre-rendered frames,
+per-entity images) are tagged with an owner when created:
+
+    frames.append(track_surface(surface, 'effects'))
+
+Each tag keeps only a weak reference. Live count and pixel bytes per owner
+update when a surface is tagged and when it is garbage collected. Python
+allocations (including NumPy arrays) are covered by tracemalloc when it
+is enabled (settings.MEMORY_TRACEMALLOC / game.py --tracemalloc). Totals
+are shown in the F3 profiler overlay; F8 writes a full report with the
+top allocation sites and growth since the previous report.
+"""
+import json
+import os
+import time
+import tracemalloc
+import weakref
+from settings import DEBUG_MODE
+
+# id(surface) -> (weak reference, owner, bytes)
+_surfaces = {}
+# owner -> [live count, live bytes, total ever tagged]
+_owners = {}
+
+
+def surface_bytes(surface):
+    """Bytes held by a surface's pixel buffer"""
+    return surface.get_pitch() * surface.get_height()
+
+
+def _forget(key, ref):
+    entry = _surfaces.get(key)
+    if entry is not None and entry[0] is ref:
+        del _surfaces[key]
+        stats = _owners[entry[1]]
+        stats[0] -= 1
+        stats[1] -= entry[2]
+
+
+def _count(owner, size):
+    stats = _owners.get(owner)
+    if stats is None:
+        stats = _owners[owner] = [0, 0, 0]
+    stats[0] += 1
+    stats[1] += size
+    stats[2] += 1
+
+
+def track_surface(surface, owner):
+    """
+    Tag surface as owned by owner (e.g. 'goblins', 'terrain.flowers') and return it.
+
+    Tagging an already tagged surface moves it to the new owner, so a loader
+    can tag everything it returns and callers that keep the result re-tag it.
+    """
+    if surface is None:
+        return None
+    key = id(surface)
+    entry = _surfaces.get(key)
+    if entry is not None and entry[0]() is surface:
+        if entry[1] == owner:
+            return surface
+        ref, old_owner, size = entry
+        stats = _owners[old_owner]
+        stats[0] -= 1
+        stats[1] -= size
+    else:
+        if entry is not None:
+            _forget(key, entry[0])  # Dead surface whose id has been reused
+        size = surface_bytes(surface)
+        ref = weakref.ref(surface, lambda ref, key=key: _forget(key, ref))
+    _surfaces[key] = (ref, owner, size)
+    _count(owner, size)
+    return surface
+
+
+def surface_totals():
+    """(live count, live bytes) over every tagged surface"""
+    count = 0
+    size = 0
+    for live, live_bytes, _ in _owners.values():
+        count += live
+        size += live_bytes
+    return count, size
+
+
+def surfaces_by_owner():
+    """[(owner, live count, live bytes, total ever tagged)] largest first"""
+    return sorted(((owner, live, size, total) for owner, (live, size, total) in _owners.items()),
+                  key=lambda row: row[2], reverse=True)
+
+
+def start_tracemalloc(frames=1):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def python_memory():
+    """(current, peak) bytes of traced Python allocations, or None if tracemalloc is off"""
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()
+
+
+def overlay_lines(owners=3):
+    """Short text lines for the profiler overlay"""
+    count, size = surface_totals()
+    lines = [f"surfaces {count:>5} {size / 1048576:7.2f} MB"]
+    for owner, live, live_bytes, _ in surfaces_by_owner()[:owners]:
+        lines.append(f"  {owner[:14]:<14}{live:>5} {live_bytes / 1048576:6.2f} MB")
+    traced = python_memory()
+    if traced is not None:
+        lines.append(f"python {traced[0] / 1048576:7.2f} MB peak {traced[1] / 1048576:.2f}")
+    return lines
+
+
+class MemoryReport:
+    """Writes memory reports; each report also lists growth since the previous one"""
+    TOP_SITES = 30
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._last_snapshot = None
+        self._last_owners = {}
+
+    def dump(self, path=None):
+        """Write a JSON report of surfaces by owner and top Python allocation sites"""
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, time.strftime('memory_%Y%m%d_%H%M%S.json'))
+
+        count, size = surface_totals()
+        owners = []
+        for owner, live, live_bytes, total in surfaces_by_owner():
+            last = self._last_owners.get(owner, (0, 0))
+            owners.append({'owner': owner, 'live': live, 'bytes': live_bytes, 'tagged_total': total,
+                           'live_change': live - last[0], 'bytes_change': live_bytes - last[1]})
+        self._last_owners = {row['owner']: (row['live'], row['bytes']) for row in owners}
+        report = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'surfaces': {'live': count, 'bytes': size, 'by_owner': owners},
+        }
+
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+            ))
+            current, peak = tracemalloc.get_traced_memory()
+            report['python'] = {
+                'current': current,
+                'peak': peak,
+                'top_sites': [{'site': str(stat.traceback), 'bytes': stat.size, 'blocks': stat.count}
+                              for stat in snapshot.statistics('lineno')[:self.TOP_SITES]],
+            }
+            if self._last_snapshot is not None:
+                report['python']['growth_since_last'] = [
+                    {'site': str(stat.traceback), 'bytes_change': stat.size_diff, 'blocks_change': stat.count_diff}
+                    for stat in snapshot.compare_to(self._last_snapshot, 'lineno')[:self.TOP_SITES]
+                    if stat.size_diff
+                ]
+            self._last_snapshot = snapshot
+
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        if DEBUG_MODE:
+            print(f"Memory report written to {path}: {count} surfaces, {size / 1048576:.2f} MB")
+            for row in owners[:8]:
+                print(f"  {row['owner']:<20}{row['live']:>6} {row['bytes'] / 1048576:8.2f} MB "
+                      f"({row['bytes_change'] / 1048576:+.2f})")
+        return path
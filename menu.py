@@ -1,6 +1,7 @@
 import pygame
 import sys
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, BLACK, FONT_NAME
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, BLACK
+from memory_stats import track_surface
 
 def draw_text(surface, text, size, x, y, color=WHITE):
     try:
@@ -44,7 +45,7 @@ class Button:
 class StartMenu:
     def __init__(self, screen):
         self.screen = screen
-        self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.overlay = track_surface(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA), 'menu')
         self.overlay.fill((0, 0, 0, 180))  # Semi-transparent black
         
         # Create start button
@@ -56,9 +57,9 @@ class StartMenu:
             "START GAME", (50, 150, 50), (70, 200, 70)
         )
         
-        # Title
-        self.title_font = pygame.font.Font(FONT_NAME, 80)
-        self.subtitle_font = pygame.font.Font(FONT_NAME, 30)
+        # Title (pygame's bundled default font)
+        self.title_font = pygame.font.Font(None, 80)
+        self.subtitle_font = pygame.font.Font(None, 30)
     
     def draw(self, world_surface):
         # Draw the world in the background
@@ -0,0 +1,42 @@
+from itertools import islice
+
+
+class Pool:
+    """
+    Fixed-capacity pool of reusable game objects.
+
+    All instances are created up front. The first `active` entries of
+    `items` are in use; acquire() hands out the next free one after calling
+    its reset(*args), and release(i) swaps entry i with the last active
+    one. Iterate backwards by index when releasing inside a loop.
+    """
+
+    def __init__(self, factory, capacity):
+        self.items = [factory() for _ in range(capacity)]
+        self.capacity = capacity
+        self.active = 0
+
+    def __len__(self):
+        return self.active
+
+    def __iter__(self):
+        return islice(self.items, self.active)
+
+    def acquire(self, *args):
+        """Reset and activate a free instance; returns None if the pool is exhausted"""
+        if self.active == self.capacity:
+            return None
+        item = self.items[self.active]
+        item.reset(*args)
+        self.active += 1
+        return item
+
+    def release(self, index):
+        """Return the active instance at index to the pool"""
+        last = self.active - 1
+        items = self.items
+        items[index], items[last] = items[last], items[index]
+        self.active = last
+
+    def clear(self):
+        self.active = 0
@@ -0,0 +1,184 @@
+import time
+import numpy as np
+import pygame
+from settings import FPS
+from memory_stats import track_surface, overlay_lines
+
+
+class FrameProfiler:
+    """
+    Per-subsystem frame timer with an on-screen stacked frame-time graph.
+
+    Game.update and Game.draw call lap(phase) after each phase; the time since
+    the previous lap (or start()) is charged to that phase for the current
+    frame. Fixed simulation steps run several times per frame, so update
+    phases accumulate. end_frame() stores the frame in a ring buffer of the
+    last HISTORY frames, from which rolling averages and p99 values are
+    refreshed every STATS_INTERVAL frames. Time not covered by any lap
+    (events, menu, the loop itself) is charged to 'other'; the clock's
+    frame-rate sleep is excluded. When disabled, lap() returns immediately.
+    The table ends with tagged surface memory and traced Python memory
+    (memory_stats), refreshed along with the timings.
+    """
+    # (phase, colour) in stacking order: update phases, then draw phases
+    PHASES = (
+        ('hero', (255, 255, 255)),
+        ('goblins', (60, 200, 60)),
+        ('projectiles', (255, 140, 0)),
+        ('effects', (255, 220, 80)),
+        ('day/night', (120, 120, 255)),
+        ('clouds', (200, 200, 220)),
+        ('camera', (160, 100, 220)),
+        ('sky', (100, 190, 240)),
+        ('cloud layer', (230, 230, 240)),
+        ('terrain', (150, 100, 50)),
+        ('entities', (220, 60, 60)),
+        ('hud', (255, 100, 200)),
+        ('flip', (150, 150, 150)),
+        ('gc', (255, 255, 0)),
+        ('other', (90, 90, 90)),
+    )
+    HISTORY = 240  # Frames kept for averages, percentiles and the graph
+    STATS_INTERVAL = 30  # Frames between refreshes of the text table
+    GRAPH_SIZE = (240, 100)  # One pixel column per frame
+    GRAPH_MS = 33.3  # Frame time at the top of the graph
+    BUDGET_MS = 1000.0 / FPS
+
+    def __init__(self):
+        self.enabled = False
+        self._index = {name: i for i, (name, _) in enumerate(self.PHASES)}
+        self._other = self._index['other']
+        self._current = [0.0] * len(self.PHASES)
+        self._last = 0.0
+        self._frame_start = 0.0
+
+        # Ring buffer of per-phase milliseconds, one row per frame
+        self.history = np.zeros((self.HISTORY, len(self.PHASES)), dtype=np.float64)
+        self.frames = 0
+        self.mean_ms = np.zeros(len(self.PHASES))
+        self.p99_ms = np.zeros(len(self.PHASES))
+        self.frame_mean_ms = 0.0
+        self.frame_p99_ms = 0.0
+
+        # Overlay surfaces, built on first draw
+        self._graph = None
+        self._table = None
+        self._font = None
+
+    def toggle(self):
+        """Turn profiling and the overlay on or off (history restarts when turned on)"""
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.history[:] = 0
+            self.frames = 0
+            self._graph = None
+            self._table = None
+        return self.enabled
+
+    def begin_frame(self):
+        """Start timing a frame (call after the frame-rate sleep)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._frame_start = now
+        self._last = now
+        current = self._current
+        for i in range(len(current)):
+            current[i] = 0.0
+
+    def start(self):
+        """Start the first lap of a sequence of phases"""
+        if self.enabled:
+            self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap to phase"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[self._index[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """Store the finished frame and refresh the statistics when due"""
+        if not self.enabled:
+            return
+        current = self._current
+        total = time.perf_counter() - self._frame_start
+        current[self._other] += max(0.0, total - sum(current))
+        row = self.frames % self.HISTORY
+        self.history[row] = current
+        self.history[row] *= 1000.0
+        self.frames += 1
+        self._add_graph_column(self.history[row])
+        if self.frames % self.STATS_INTERVAL == 0:
+            self._update_stats()
+
+    def _update_stats(self):
+        history = self.history[:min(self.frames, self.HISTORY)]
+        totals = history.sum(axis=1)
+        self.mean_ms = history.mean(axis=0)
+        self.p99_ms = np.percentile(history, 99, axis=0)
+        self.frame_mean_ms = float(totals.mean())
+        self.frame_p99_ms = float(np.percentile(totals, 99))
+        self._table = None  # Re-rendered on next draw
+
+    def _new_graph(self):
+        width, height = self.GRAPH_SIZE
+        graph = track_surface(pygame.Surface((width, height)), 'profiler')
+        graph.fill((0, 0, 0))
+        return graph
+
+    def _add_graph_column(self, row_ms):
+        """Scroll the graph one pixel left and draw the new frame as a stacked column"""
+        if self._graph is None:
+            self._graph = self._new_graph()
+        graph = self._graph
+        width, height = self.GRAPH_SIZE
+        graph.scroll(-1, 0)
+        x = width - 1
+        pygame.draw.line(graph, (0, 0, 0), (x, 0), (x, height - 1))
+        scale = height / self.GRAPH_MS
+        bottom = height
+        for (name, colour), ms in zip(self.PHASES, row_ms.tolist()):
+            top = bottom - ms * scale
+            if int(top) < int(bottom):
+                pygame.draw.line(graph, colour, (x, max(0, int(top))), (x, int(bottom) - 1))
+            bottom = top
+            if bottom <= 0:
+                break
+
+    def _render_table(self):
+        """Render the per-phase average / p99 table (only when the stats change)"""
+        if self._font is None:
+            self._font = pygame.font.SysFont('monospace', 12)
+        font = self._font
+        lines = [(f"frame  avg {self.frame_mean_ms:5.2f}  p99 {self.frame_p99_ms:5.2f} ms",
+                  (255, 80, 80) if self.frame_p99_ms > self.BUDGET_MS else (255, 255, 255)),
+                 (f"{'phase':<12}{'avg':>6}{'p99':>7}", (255, 255, 255))]
+        for (name, colour), mean, p99 in zip(self.PHASES, self.mean_ms.tolist(), self.p99_ms.tolist()):
+            lines.append((f"{name:<12}{mean:6.2f}{p99:7.2f}", colour))
+        lines.extend((text, (180, 220, 255)) for text in overlay_lines())
+        line_height = font.get_linesize()
+        width = max(font.size(text)[0] for text, _ in lines)
+        table = pygame.Surface((width + 8, line_height * len(lines) + 8), pygame.SRCALPHA)
+        track_surface(table, 'profiler')
+        table.fill((0, 0, 0, 170))
+        for i, (text, colour) in enumerate(lines):
+            table.blit(font.render(text, True, colour), (4, 4 + i * line_height))
+        self._table = table
+
+    def draw(self, screen, x=10, y=110):
+        """Draw the stacked frame-time graph and the phase table"""
+        if not self.enabled:
+            return
+        if self._graph is None:
+            self._graph = self._new_graph()
+        if self._table is None:
+            self._render_table()
+        width, height = self.GRAPH_SIZE
+        screen.blit(self._graph, (x, y))
+        # Frame budget line (16.6 ms at 60 FPS)
+        budget_y = y + height - int(self.BUDGET_MS * height / self.GRAPH_MS)
+        pygame.draw.line(screen, (255, 0, 0), (x, budget_y), (x + width - 1, budget_y))
+        screen.blit(self._table, (x, y + height + 4))
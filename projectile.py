@@ -2,8 +2,10 @@ import pygame
 import math
 import os
 import random
-from settings import PROJECTILE_IMG_PATH, PROJECTILE_SPEED, DEBUG_MODE, ICEBALL_IMG_PATH
-from effects import ExplosionEffect, IceExplosionEffect
+from settings import PROJECTILE_IMG_PATH, PROJECTILE_SPEED, ICEBALL_IMG_PATH
+from tracing import traced
+from memory_stats import track_surface
+from asset_loader import load_image
 
 
 
@@ -14,12 +16,17 @@ class Projectile:
     # Keep original size but use high-quality source
     _projectile_size = (32, 32)  # Size of the projectile in the game
     
+    __slots__ = (
+        'speed', 'image', 'rect', 'x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'active',
+        'gravity', 'lifetime', 'rotation', 'rotated_image', 'radius',
+    )
+    
     @classmethod
     def load_projectile_image(cls):
         """Load the projectile image from file"""
         try:
             if os.path.exists(PROJECTILE_IMG_PATH):
-                img = pygame.image.load(PROJECTILE_IMG_PATH).convert_alpha()
+                img = load_image(PROJECTILE_IMG_PATH).convert_alpha()
                 # Scale to desired size while maintaining aspect ratio
                 img = pygame.transform.scale(img, cls._projectile_size)
                 # print("Loaded projectile image from file")
@@ -48,41 +55,75 @@ class Projectile:
         
         return surf
     
+    # Rotated (and pulse-scaled) frames, keyed by whole degrees and pulse step
+    _rotation_cache = {}
+    
+    # Flight parameters; the ice projectile only overrides these
+    GRAVITY = 0.1  # Reduced gravity for flatter arc
+    damage = 10
+    is_ice = False
+    
+    @classmethod
+    def get_image(cls):
+        """Load the projectile image for this class once"""
+        if cls.__dict__.get('_projectile_img') is None:
+            cls._projectile_img = track_surface(cls.load_projectile_image(), 'projectiles')
+        return cls._projectile_img
+    
+    @classmethod
+    def get_rotated_image(cls, rotation, pulse_step=0):
+        """Return the image rotated to the nearest degree, scaled up by pulse_step * 2%"""
+        key = (int(round(rotation)) % 360, pulse_step)
+        cache = cls.__dict__.get('_rotation_cache')
+        if cache is None:
+            cache = cls._rotation_cache = {}
+        img = cache.get(key)
+        if img is None:
+            if pulse_step:
+                base = cls.get_rotated_image(rotation)
+                scale = 1.0 + pulse_step * 0.02
+                img = pygame.transform.scale_by(base, (scale, scale))
+            else:
+                img = pygame.transform.rotate(cls.get_image(), -key[0])  # Negative for correct rotation direction
+            cache[key] = track_surface(img, 'projectiles')
+        return img
+    
     def __init__(self, x, y, vx, vy):
+        self.speed = PROJECTILE_SPEED
+        self.image = self.get_image()  # Shared; frames are never modified in place
+        self.rect = self.image.get_rect()
         self.x = x
         self.y = y
+        self.prev_x = x  # Position at the previous simulation step (for render interpolation)
+        self.prev_y = y
         self.vx = vx
         self.vy = vy
-        self.speed = PROJECTILE_SPEED
         self.active = True
-        self.gravity = 0.1  # Reduced gravity for flatter arc
+        self.gravity = self.GRAVITY
         self.lifetime = 240  # Increased lifetime to 4 seconds at 60 FPS
         
-        # Load the projectile image if not already done
-        if Projectile._projectile_img is None:
-            Projectile._projectile_img = Projectile.load_projectile_image()
-            
-        self.image = Projectile._projectile_img.copy()  # Create a copy for each projectile
-        self.rect = self.image.get_rect(center=(x, y))
-        
         # Calculate rotation based on velocity
         angle_rad = math.atan2(vy, vx)
         self.rotation = math.degrees(angle_rad) - 90  # Subtract 90 to make it point forward
         
         # Rotate the image to point in the direction of movement
-        self.rotated_image = pygame.transform.rotate(self.image, -self.rotation)  # Negative for correct rotation direction
-        self.rect = self.rotated_image.get_rect(center=(x, y))
+        self.rotated_image = self.get_rotated_image(self.rotation)
+        self.rect.size = self.rotated_image.get_size()
+        self.rect.center = (x, y)
         
         # For collision detection
         self.radius = max(self.rect.width, self.rect.height) // 2 * 0.7  # Slightly smaller than visual for better feel
-        
-        if DEBUG_MODE:
-            # print(f"Created projectile at x={x}, y={y} with velocity=({vx:.2f}, {vy:.2f})")
-            pass
 
+    @traced('Projectile.update', 'projectiles')
     def update(self, terrain=None, dt=1.0/60.0):
+        """
+        Advance the projectile one step.
+        
+        Returns:
+            The (x, y) point where it burst (hit the ground or timed out), or None
+        """
         if not self.active:
-            return False  # Indicates this projectile should be removed
+            return None
             
         # Apply gravity with delta time
         self.vy += self.gravity * dt * 60  # Scale by 60 to match original behavior at 60 FPS
@@ -99,18 +140,13 @@ class Projectile:
             ground_height = terrain.get_ground_height(self.x)
             if self.y + self.rect.height/2 >= ground_height:
                 self.active = False
-                # Create appropriate explosion effect based on projectile type
-                if isinstance(self, IceProjectile):
-                    return IceExplosionEffect(self.x, ground_height - self.rect.height/2)
-                return ExplosionEffect(self.x, ground_height - self.rect.height/2)
+                return (self.x, ground_height - self.rect.height/2)
         
         # Decrease lifetime with delta time
         self.lifetime -= dt * 60  # Scale by 60 to match original behavior at 60 FPS
         if self.lifetime <= 0:
             self.active = False
-            if isinstance(self, IceProjectile):
-                return IceExplosionEffect(self.x, self.y)
-            return ExplosionEffect(self.x, self.y)  # Small explosion when timing out
+            return (self.x, self.y)  # Small explosion when timing out
             
         return None
 
@@ -123,32 +159,21 @@ class Projectile:
         
         # Update rotation based on current velocity
         angle_rad = math.atan2(self.vy, self.vx)
-        current_rotation = math.degrees(angle_rad) - 90  # Same calculation as in __init__
+        current_rotation = math.degrees(angle_rad) - 90  # Same calculation as in reset
         
         if abs(current_rotation - self.rotation) > 1:  # Only update if rotation changed significantly
             self.rotation = current_rotation
-            # Create a new surface with per-pixel alpha for smooth rotation
-            self.rotated_image = pygame.transform.rotate(self.image, -self.rotation)  # Negative for correct direction
-            # Create a clean surface to handle the rotation artifacts
-            rotated_clean = pygame.Surface(self.rotated_image.get_size(), pygame.SRCALPHA)
-            rotated_clean.blit(self.rotated_image, (0, 0))
-            self.rotated_image = rotated_clean
-            self.rect = self.rotated_image.get_rect(center=(self.x, self.y))
-        
-        # Calculate the top-left position for drawing
-        draw_x = screen_x - self.rotated_image.get_width() // 2
-        draw_y = self.y - self.rotated_image.get_height() // 2
-        
-        # Add subtle pulsing effect
+            self.rotated_image = self.get_rotated_image(self.rotation)
+            self.rect.size = self.rotated_image.get_size()
+            self.rect.center = (self.x, self.y)
+        
+        # Add subtle pulsing effect, quantised to 2% steps so the scaled frames can be cached
         pulse = math.sin(pygame.time.get_ticks() * 0.02) * 0.1 + 1.0
-        if pulse > 1.0:  # Only scale up, not down
-            scaled_img = pygame.transform.scale_by(self.rotated_image, (pulse, pulse))
-            # Adjust position to keep centered
-            offset_x = (scaled_img.get_width() - self.rotated_image.get_width()) // 2
-            offset_y = (scaled_img.get_height() - self.rotated_image.get_height()) // 2
-            screen.blit(scaled_img, (draw_x - offset_x, draw_y - offset_y))
-        else:
-            screen.blit(self.rotated_image, (draw_x, draw_y))
+        pulse_step = int((pulse - 1.0) * 50)  # Only scale up, not down
+        img = self.get_rotated_image(self.rotation, pulse_step) if pulse_step > 0 else self.rotated_image
+        
+        # Draw centered on the projectile
+        screen.blit(img, (screen_x - img.get_width() // 2, self.y - img.get_height() // 2))
 
 
 # Ice Projectile class that inherits from Projectile
@@ -156,15 +181,22 @@ class IceProjectile(Projectile):
     """Ice projectile that freezes enemies on impact"""
     # Class variable to store the generated projectile image
     _projectile_img = None
+    _rotation_cache = {}
     is_ice = True  # Mark as ice projectile for effect handling
     
+    # Ice-themed flight parameters
+    damage = 15  # Slightly more damage than fireball
+    GRAVITY = 0.08  # Slightly less gravity for flatter arc
+    
+    __slots__ = ()
+    
     @classmethod
     def load_projectile_image(cls):
         """Load the ice projectile image from file"""
         if cls._projectile_img is None:
             try:
                 if os.path.exists(ICEBALL_IMG_PATH):
-                    img = pygame.image.load(ICEBALL_IMG_PATH).convert_alpha()
+                    img = load_image(ICEBALL_IMG_PATH).convert_alpha()
                     # Scale to desired size while maintaining aspect ratio
                     img = pygame.transform.scale(img, cls._projectile_size)
                     cls._projectile_img = img
@@ -193,30 +225,3 @@ class IceProjectile(Projectile):
         surf.blit(glow, (-2, -2), special_flags=pygame.BLEND_ALPHA_SDL2)
         
         return surf
-    
-    def __init__(self, x, y, vx, vy):
-        # Initialize the base Projectile class first
-        super().__init__(x, y, vx, vy)
-        
-        # Override with ice-themed properties
-        self.damage = 15  # Slightly more damage than fireball
-        self.gravity = 0.08  # Slightly less gravity for flatter arc
-        
-        # Load ice projectile image
-        if IceProjectile._projectile_img is None:
-            IceProjectile._projectile_img = IceProjectile.load_projectile_image()
-        
-        # Update the image and rect for ice projectile
-        self.image = IceProjectile._projectile_img.copy()
-        self.rect = self.image.get_rect(center=(x, y))
-        self.rotated_image = pygame.transform.rotate(self.image, -self.rotation)
-        
-        if DEBUG_MODE:
-            print(f"Created ice projectile at ({x}, {y}) with velocity ({vx:.1f}, {vy:.1f})")
-    
-    def update(self, terrain=None, dt=1.0/60.0):
-        # Call the parent class's update method with delta time
-        result = super().update(terrain, dt)
-        
-        # Additional ice-specific behavior can be added here
-        return result
\ No newline at end of file
@@ -0,0 +1,226 @@
+import math
+import numpy as np
+import pygame
+from settings import WINDOW_WIDTH
+from projectile import Projectile, IceProjectile
+from tracing import traced
+
+# Projectile kinds stored per projectile (index into ProjectileBatch.KINDS)
+KIND_FIRE = 0
+KIND_ICE = 1
+KIND_BY_STAFF = {'fire': KIND_FIRE, 'ice': KIND_ICE}
+
+
+class ProjectileBatch:
+    """
+    Struct-of-arrays store for every projectile in flight.
+
+    Like GoblinHorde, each projectile is a row index into a set of NumPy
+    arrays and rows [0, count) are live. update_all() integrates every
+    projectile in one vectorised step and sweeps all of their paths against
+    the ground polyline in one pass. Fire and ice differ only by the per-kind
+    parameters below (taken from the Projectile / IceProjectile classes,
+    which also provide the sprites).
+    """
+    KINDS = (Projectile, IceProjectile)
+    GRAVITY = np.array([cls.GRAVITY for cls in KINDS], dtype=np.float64)
+    DAMAGE = np.array([cls.damage for cls in KINDS], dtype=np.int32)
+    LIFETIME = 240  # 60 FPS frames (4 seconds)
+    HALF_SIZE = Projectile._projectile_size[0] / 2  # Half the unrotated sprite
+
+    # Per-projectile arrays: name -> dtype
+    FIELDS = {
+        'x': np.float64,
+        'y': np.float64,
+        'prev_x': np.float64,
+        'prev_y': np.float64,
+        'vx': np.float64,
+        'vy': np.float64,
+        'gravity': np.float64,
+        'lifetime': np.float64,
+        'kind': np.int8,
+    }
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.capacity = max(1, capacity)
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+        # Load the sprites up front
+        for cls in self.KINDS:
+            cls.get_image()
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        """Double the capacity of every array"""
+        self.capacity *= 2
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, kind, x, y, vx, vy):
+        """Launch a projectile of the given kind and return its row index"""
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        self.count += 1
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.gravity[i] = self.GRAVITY[kind]
+        self.lifetime[i] = self.LIFETIME
+        self.kind[i] = kind
+        return i
+
+    def clear(self):
+        self.count = 0
+
+    def _compact(self, keep):
+        """Drop every row where keep is False in one pass"""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return
+        for name in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:kept] = arr[:n][keep]
+        self.count = kept
+
+    def _take(self, mask, xs, ys, ts=None):
+        """Remove the rows in mask, returning (x, y, kind, t) impact events for them"""
+        kinds = self.kind[:self.count][mask]
+        events = (xs[mask], ys[mask], kinds,
+                  ts[mask] if ts is not None else np.ones(kinds.shape, dtype=np.float64))
+        self._compact(~mask)
+        return events
+
+    def store_previous_positions(self):
+        """Remember positions before a simulation step (for render interpolation)"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def half_extents(self):
+        """Half the size of each projectile's rotated sprite box (rotated squares stay square)"""
+        n = self.count
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        speed = np.hypot(vx, vy)
+        speed[speed == 0] = 1.0
+        return self.HALF_SIZE * np.maximum(1.0, (np.abs(vx) + np.abs(vy)) / speed)
+
+    @traced('ProjectileBatch.update_all', 'projectiles')
+    def update_all(self, dt, terrain=None):
+        """
+        Advance every projectile by one step of dt seconds.
+
+        The ground test is swept along each projectile's path for the step
+        (Terrain.sweep_ground), so fast projectiles and long steps cannot
+        tunnel through thin peaks.
+
+        Returns:
+            (xs, ys, kinds, ts) arrays of the projectiles that burst this step
+            (hit the ground or timed out) and the fraction of the step at which
+            they did; they have already been removed
+        """
+        n = self.count
+        step = dt * 60  # Scale by 60 to match original behavior at 60 FPS
+        x = self.x[:n]
+        y = self.y[:n]
+        start_x = x.copy()
+        start_y = y.copy()
+        vy = self.vy[:n]
+        vy += self.gravity[:n] * step
+        x += self.vx[:n] * step
+        y += vy * step
+        lifetime = self.lifetime[:n]
+        lifetime -= step
+
+        impact_x = x.copy()
+        impact_y = y.copy()
+        impact_t = np.ones(n, dtype=np.float64)
+        burst = lifetime <= 0  # Small explosion when timing out
+        if terrain is not None and n:
+            # Sweep the bottom of each sprite box from where it started the step
+            half = self.half_extents()
+            grounded, t, hx, hy = terrain.sweep_ground(start_x, start_y + half, x, y + half)
+            impact_x[grounded] = hx[grounded]
+            impact_y[grounded] = (hy - half)[grounded]
+            impact_t[grounded] = t[grounded]
+            burst |= grounded
+        return self._take(burst, impact_x, impact_y, impact_t)
+
+    @traced('ProjectileBatch.hit_goblins', 'projectiles')
+    def hit_goblins(self, goblins):
+        """
+        Damage the first goblin each projectile overlaps (goblins.build_broadphase()
+        must be current).
+
+        Returns:
+            (xs, ys, kinds, ts) arrays of the projectiles that hit (ts is always 1,
+            the end of the step); they have been removed
+        """
+        n = self.count
+        hit = np.zeros(n, dtype=np.bool_)
+        if n == 0 or len(goblins) == 0:
+            return self._take(hit, self.x[:n], self.y[:n])
+
+        # The boxes pygame.Rect(size=(int(2 * half),) * 2, center=(x, y)) would give;
+        # Rect rounds the centre half away from zero
+        size = (self.half_extents() * 2).astype(np.int64)
+        left = (np.copysign(np.floor(np.abs(self.x[:n]) + 0.5), self.x[:n])).astype(np.int64) - size // 2
+        top = (np.copysign(np.floor(np.abs(self.y[:n]) + 0.5), self.y[:n])).astype(np.int64) - size // 2
+        boxes, rows = goblins.overlapping(left, top, size, size)
+
+        # Apply hits in projectile order: each one damages the lowest overlapping row
+        # still alive, so a goblin killed by an earlier projectile is passed over
+        damage = self.DAMAGE[self.kind[:n]].tolist()
+        health = goblins.health
+        for i, row in zip(boxes.tolist(), rows.tolist()):
+            if not hit[i] and health[row] > 0:
+                # Goblins at 0 health are removed by the caller
+                goblins.damage(row, damage[i])
+                hit[i] = True
+        return self._take(hit, self.x[:n], self.y[:n])
+
+    def cull(self, left, right, top, bottom):
+        """Drop projectiles whose centre has left the given world-space box"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        self._compact((x >= left) & (x <= right) & (y >= top) & (y <= bottom))
+
+    @traced('ProjectileBatch.draw', 'projectiles')
+    def draw(self, screen, camera_x, alpha=1.0):
+        """Draw every on-screen projectile, interpolated alpha of the way into the last step"""
+        n = self.count
+        if n == 0:
+            return
+        xs = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        ys = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+
+        # Same padding as Game.is_visible
+        padding = 100
+        visible = np.flatnonzero((xs > camera_x - padding) &
+                                 (xs < camera_x + WINDOW_WIDTH + padding))
+        if not visible.size:
+            return
+
+        # Point along the direction of travel (subtract 90 to make it point forward)
+        rotations = np.degrees(np.arctan2(self.vy[:n], self.vx[:n])) - 90
+
+        # Subtle pulsing shared by all projectiles, quantised like Projectile.draw
+        pulse = math.sin(pygame.time.get_ticks() * 0.02) * 0.1 + 1.0
+        pulse_step = max(0, int((pulse - 1.0) * 50))
+
+        kinds = self.KINDS
+        for i in visible.tolist():
+            img = kinds[self.kind[i]].get_rotated_image(rotations[i], pulse_step)
+            screen.blit(img, (xs[i] - camera_x - img.get_width() // 2,
+                              ys[i] - img.get_height() // 2))
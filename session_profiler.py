@@ -0,0 +1,144 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from settings import DEBUG_MODE
+from tracing import traced
+
+# Code object of the tracing.traced wrapper, left out of sampled stacks
+_TRACED_WRAPPER = traced()(lambda: None).__code__
+
+
+class FrameRangeProfiler:
+    """
+    cProfile over a window of frames: frames [start_frame, start_frame + frames).
+
+    Game.run calls on_frame() at the top of every frame. Profiling switches on
+    at start_frame and off frames later, then the stats are written to a
+    .prof file (for pstats / snakeviz) and the top entries are printed.
+    """
+
+    def __init__(self, start_frame, frames, path, top=25, sort='cumulative'):
+        self.start_frame = start_frame
+        self.end_frame = start_frame + frames
+        self.path = path
+        self.top = top
+        self.sort = sort
+        self.profile = cProfile.Profile()
+        self.running = False
+        self.finished = False
+
+    def on_frame(self, index):
+        if self.finished:
+            return
+        if index == self.start_frame and not self.running:
+            self.running = True
+            self.profile.enable()
+        elif index >= self.end_frame and self.running:
+            self.finish()
+
+    def finish(self):
+        """Stop profiling, write the .prof file and print the summary (partial if cut short)"""
+        if self.finished or not self.running:
+            return
+        self.profile.disable()
+        self.running = False
+        self.finished = True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.profile.dump_stats(self.path)
+
+        out = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=out)
+        stats.strip_dirs().sort_stats(self.sort).print_stats(self.top)
+        print(f"cProfile of frames {self.start_frame}-{self.end_frame - 1} written to {self.path}")
+        print(out.getvalue())
+
+
+class SamplingProfiler:
+    """
+    Low-overhead statistical profiler for real play sessions.
+
+    A daemon thread wakes every `interval` seconds and snapshots the main
+    thread's Python stack (sys._current_frames). Nothing is hooked into the
+    interpreter, so the game runs at full speed apart from those brief
+    snapshots. Results are the share of samples in which each function was
+    on top of the stack (self) or anywhere on it (total), plus the full
+    stacks in collapsed "a;b;c count" form for flame graph tools.
+    """
+    MAX_DEPTH = 64
+
+    def __init__(self, interval=0.005, path=None, top=25):
+        self.interval = interval
+        self.path = path
+        self.top = top
+        self.samples = 0
+        self.stacks = Counter()
+        self._target = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        target = self._target
+        stacks = self.stacks
+        max_depth = self.MAX_DEPTH
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None and len(stack) < max_depth:
+                code = frame.f_code
+                if code is not _TRACED_WRAPPER:
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                stack.reverse()  # Root first
+                stacks[tuple(stack)] += 1
+                self.samples += 1
+
+    def stop(self):
+        """Stop sampling, print the summary and write the collapsed stacks"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if not self.samples:
+            return
+
+        own = Counter()
+        total = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for name in set(stack):
+                total[name] += count
+
+        print(f"Sampling profile: {self.samples} samples every {self.interval * 1000:.1f} ms")
+        for title, counts in (('self', own), ('total', total)):
+            print(f"  top {self.top} by {title}:")
+            for name, count in counts.most_common(self.top):
+                print(f"    {count / self.samples * 100:6.2f}%  {name}")
+
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'w') as f:
+                for stack, count in self.stacks.most_common():
+                    f.write(f"{';'.join(stack)} {count}\n")
+            if DEBUG_MODE:
+                print(f"Collapsed stacks written to {self.path}")
+
+
+def profile_paths(directory, stem=None):
+    """Timestamped (.prof, .folded) output paths in directory"""
+    stem = stem or time.strftime('profile_%Y%m%d_%H%M%S')
+    return os.path.join(directory, stem + '.prof'), os.path.join(directory, stem + '.folded')
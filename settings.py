@@ -4,12 +4,6 @@ import os
 import sys
 from pathlib import Path
 
-# Initialize pygame for font loading
-try:
-    import pygame
-except ImportError:
-    print("Warning: pygame not found. Font loading will be limited.")
-
 # Get the root directory of the project
 ROOT_DIR = Path(__file__).parent.resolve()
 ASSETS_DIR = ROOT_DIR / 'assets'
@@ -17,6 +11,11 @@ ASSETS_DIR = ROOT_DIR / 'assets'
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 FPS = 60
+
+# Fixed-timestep simulation: the world always advances in 1/SIMULATION_HZ steps
+# regardless of display rate; rendering interpolates between the last two steps.
+SIMULATION_HZ = 120
+MAX_FRAME_TIME = 0.25  # Clamp for long hitches so we never spiral trying to catch up
 DEBUG_MODE = True
 
 # Character dimensions
@@ -44,6 +43,38 @@ PROJECTILE_COLOR = BLACK  # Black color for projectiles
 PROJECTILE_SIZE = 20  # Size of the projectile box
 PROJECTILE_SPEED = 8  # Reduced speed from 15 to 8
 PROJECTILE_COOLDOWN = 15  # Cooldown between shots
+PROJECTILE_POOL_SIZE = 32  # Initial projectile batch capacity (grows as needed)
+EFFECT_POOL_SIZE = 32  # Per explosion type
+
+# Goblin spawning (see spawn_director.py). Times are in seconds, distances in pixels.
+SPAWN_PRESETS = {
+    # The original game: 3 goblins ahead of the hero, topped up to 5 every
+    # 3 seconds, and goblins off screen for 10 seconds wander away
+    'normal': {
+        'initial_count': 3,
+        'initial_x': WINDOW_WIDTH * 2,
+        'initial_spacing': 300,
+        'max_goblins': 5,
+        'interval': 3.0,
+        'batch': 1,
+        'min_hero_distance': 400,
+        'despawn_after': 10.0,
+        'budget_ms': 0.5,  # CPU time per tick the director may spend spawning
+    },
+    # Keeps adding goblins everywhere to find out how far the engine scales
+    'stress': {
+        'initial_count': 3,
+        'initial_x': WINDOW_WIDTH * 2,
+        'initial_spacing': 300,
+        'max_goblins': 50000,
+        'interval': 0.25,
+        'batch': 250,
+        'min_hero_distance': 400,
+        'despawn_after': None,
+        'budget_ms': 2.0,
+    },
+}
+SPAWN_PRESET = 'normal'
 
 # Colors
 # Removed duplicate color constants. Consolidated into the first set.
@@ -51,61 +82,75 @@ PROJECTILE_COOLDOWN = 15  # Cooldown between shots
 # Debug mode
 DEBUG_MODE = True
 
-# Default font settings - will be updated after pygame is initialized
-FONT_NAME = None
-
-def init_fonts():
-    """Initialize font settings after pygame is available"""
-    global FONT_NAME
-    try:
-        # Try to load a built-in font first
-        FONT_NAME = pygame.font.get_default_font()
-        if not FONT_NAME:
-            # Fall back to a common system font
-            FONT_NAME = 'Arial'
-        # Initialize a font to verify it works
-        pygame.font.SysFont(FONT_NAME, 16)
-    except Exception as e:
-        print(f"Warning: Could not load font: {e}")
-        try:
-            # Try a different approach to get a system font
-            FONT_NAME = pygame.font.match_font('arial')
-            if not FONT_NAME:
-                FONT_NAME = None
-        except:
-            FONT_NAME = None
-    
-    if not FONT_NAME:
-        print("Warning: Could not load any fonts, text rendering will fail")
-    else:
-        print(f"Using font: {FONT_NAME}")
+# Store pixel-art sprites as 8-bit palette-indexed surfaces where they fit
+# (at most 255 colours, no partial alpha). Saves ~4x surface memory at the
+# cost of a palette lookup per blitted pixel.
+PALETTE_SURFACES = False
+
+# Lossy opt-ins that let more sprites qualify for PALETTE_SURFACES. Most of
+# the shipped sprites have anti-aliased edges and more than 255 colours, so
+# without these the exact mode saves well under 1%.
+# PALETTE_ALPHA_THRESHOLD: pixels with alpha at or above it become opaque,
+# the rest transparent (e.g. 128; None keeps partial alpha out of the mode).
+# PALETTE_QUANTIZE: drop low colour bits (down to 4 per channel) until the
+# sprite has at most 255 colours.
+PALETTE_ALPHA_THRESHOLD = None
+PALETTE_QUANTIZE = False
+
+# Threads decoding images at start-up (asset_loader.py); 0 for one per CPU core
+ASSET_LOADER_THREADS = 0
+
+# Frame-time recorder: per-frame update/draw/total times kept in a ring
+# buffer and written to FRAME_LOG_DIR on exit or with F9 (F9 also starts
+# recording when it is off)
+FRAME_RECORDER = False
+FRAME_RECORDER_FRAMES = 60 * 60 * 10  # Last 10 minutes at 60 FPS
+FRAME_RECORDER_FORMAT = 'json'  # 'json' or 'csv'
+
+# Span tracing (tracing.py): start a Chrome trace at launch; F10 starts and
+# stops one at any time. Traces are written to TRACE_DIR
+TRACE_SPANS = False
+
+# Memory accounting (memory_stats.py): tagged surfaces are always counted;
+# this also traces Python allocations with tracemalloc (slows the game down
+# a little). F8 writes a memory report to MEMORY_DIR
+MEMORY_TRACEMALLOC = False
+
+# Allocation guard (alloc_guard.py): count Surface creations and
+# pygame.transform calls per frame and report steady-state frames making
+# more than ALLOC_GUARD_BUDGET of them, with their call sites
+ALLOC_GUARD = False
+ALLOC_GUARD_BUDGET = 0
+
+# Garbage collection pauses are always timed (gc_monitor.py). Scheduled mode
+# freezes the loaded world, turns automatic collection off and collects in
+# the idle time at the end of frames instead
+GC_SCHEDULED = False
+
+# Open the audio device and start the music on a worker thread so start-up
+# does not wait for it. Only enabled where that has been tested (Linux);
+# elsewhere SDL audio may need the main thread, so the music starts there
+MUSIC_THREAD = sys.platform.startswith('linux')
 
 # Get the base directory for the application
 if getattr(sys, 'frozen', False):
     # Running in a bundle (PyInstaller)
     BASE_DIR = os.path.dirname(sys.executable)
-    # Use user's appdata directory for fonts
-    if os.name == 'nt':  # Windows
-        FONTS_DIR = os.path.join(os.getenv('LOCALAPPDATA'), 'HeroVsGoblin', 'fonts')
-    else:  # Linux/Mac
-        FONTS_DIR = os.path.expanduser('~/.local/share/herovsgoblin/fonts')
 else:
     # Running in development
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    FONTS_DIR = os.path.join(BASE_DIR, 'assets', 'fonts')
-
-# Ensure directories exist
-try:
-    os.makedirs(FONTS_DIR, exist_ok=True)
-    if DEBUG_MODE:
-        print(f"Using font directory: {FONTS_DIR}")
-except Exception as e:
-    print(f"Warning: Could not create fonts directory at {FONTS_DIR}: {e}")
-    # Fallback to a temporary directory
-    import tempfile
-    FONTS_DIR = os.path.join(tempfile.gettempdir(), 'herovsgoblin', 'fonts')
-    os.makedirs(FONTS_DIR, exist_ok=True)
-    print(f"Using temporary font directory: {FONTS_DIR}")
+
+# Frame-time logs (see FRAME_RECORDER)
+FRAME_LOG_DIR = os.path.join(BASE_DIR, 'frame_logs')
+
+# Chrome trace_event files (see TRACE_SPANS)
+TRACE_DIR = os.path.join(BASE_DIR, 'traces')
+
+# cProfile (.prof) and sampled stack (.folded) output of game.py --profile-frames / --sample
+PROFILE_DIR = os.path.join(BASE_DIR, 'profiles')
+
+# Memory reports (see MEMORY_TRACEMALLOC)
+MEMORY_DIR = os.path.join(BASE_DIR, 'memory')
 
 # Assets directory (for bundled resources)
 ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
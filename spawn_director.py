@@ -0,0 +1,146 @@
+import time
+import numpy as np
+from settings import WINDOW_WIDTH, DEBUG_MODE
+from tracing import tracer, instant
+
+
+class SpawnDirector:
+    """
+    Decides when and where goblins enter and leave the world.
+
+    Driven by a preset from settings.SPAWN_PRESETS: every `interval` seconds
+    up to `batch` goblins are queued (never beyond `max_goblins`), then
+    spawned over the following ticks within `budget_ms` of CPU time per
+    tick. Spawn points are precomputed once per terrain from the heightmap,
+    so picking one is a random draw rather than a search. Goblins reuse the
+    horde's existing rows, which only grow past the largest population seen.
+    """
+    SPAWN_CHUNK = 64  # Goblins spawned between budget checks
+    MAX_SLOPE = 1.5  # Steeper terrain (stone-biome cliffs) is not a spawn point
+
+    def __init__(self, goblins, preset, seed=None):
+        self.goblins = goblins
+        self.preset = preset
+        self.rng = np.random.default_rng(seed)
+        self.terrain = None
+        self._terrain_xs = None
+        self.spawn_xs = np.zeros(0, dtype=np.float64)
+        self.spawn_ys = np.zeros(0, dtype=np.float64)
+        self.timer = 0.0
+        self.pending = 0
+
+        # Stats for debug output and profiling
+        self.spawned_total = 0
+        self.despawned_total = 0
+        self.last_spawn_ms = 0.0
+
+    def reset(self, terrain):
+        """Start a new game on terrain: precompute spawn points and place the initial goblins"""
+        self.terrain = terrain
+        self._terrain_xs = None
+        self._build_spawn_points()
+        self.timer = 0.0
+        self.pending = 0
+
+        preset = self.preset
+        count = preset['initial_count']
+        if count:
+            xs = preset['initial_x'] + np.arange(count) * preset['initial_spacing']
+            ys = terrain.get_ground_heights(xs + self.goblins.WIDTH / 2) - self.goblins.HEIGHT
+            self.goblins.spawn_many(xs, ys)
+            self.spawned_total += count
+
+    def _build_spawn_points(self):
+        """Every terrain column a goblin can stand on: not in the cave, not on a cliff"""
+        terrain = self.terrain
+        goblins = self.goblins
+        xs = terrain.height_xs
+        self._terrain_xs = xs
+        if len(xs) < 2:
+            self.spawn_xs = np.zeros(0, dtype=np.float64)
+            self.spawn_ys = np.zeros(0, dtype=np.float64)
+            return
+
+        slopes = np.abs(np.diff(terrain.height_ys) / np.diff(xs))
+        # A column is only as flat as the steeper of its two neighbouring segments
+        steepness = np.maximum(np.concatenate(([0.0], slopes)), np.concatenate((slopes, [0.0])))
+        usable = (steepness <= self.MAX_SLOPE) & (xs >= 0) & (xs <= terrain.terrain_width - goblins.WIDTH)
+        if terrain.cave_floor_xs is not None:
+            usable &= (xs + goblins.WIDTH < terrain.cave_entrance) | (xs > terrain.cave_exit)
+
+        self.spawn_xs = xs[usable].copy()
+        self.spawn_ys = terrain.get_ground_heights(self.spawn_xs + goblins.WIDTH / 2) - goblins.HEIGHT
+        if DEBUG_MODE:
+            print(f"Spawn director: {len(self.spawn_xs)} spawn points")
+
+    def pick_spawn_points(self, count, hero_x):
+        """Random spawn points at least min_hero_distance from the hero.
+
+        Spawn points are sorted by x, so the excluded window around the hero
+        is a contiguous range found with two binary searches.
+        """
+        xs = self.spawn_xs
+        distance = self.preset['min_hero_distance']
+        lo = np.searchsorted(xs, hero_x - distance, side='left')
+        hi = np.searchsorted(xs, hero_x + distance, side='right')
+        available = len(xs) - (hi - lo)
+        if available <= 0:
+            return xs[:0], self.spawn_ys[:0]
+        picks = self.rng.integers(0, available, size=count)
+        picks[picks >= lo] += hi - lo  # Skip over the window around the hero
+        return xs[picks], self.spawn_ys[picks]
+
+    def update(self, dt, hero, camera_x):
+        """Queue, spawn and despawn goblins for one simulation step"""
+        if self.terrain is None:
+            return
+        # Terrain extended since the last tick: its height arrays were rebuilt
+        if self.terrain.height_xs is not self._terrain_xs:
+            self._build_spawn_points()
+
+        preset = self.preset
+        goblins = self.goblins
+        self._despawn(dt, camera_x)
+
+        # Queue a batch every interval, up to the population cap
+        self.timer += dt
+        if self.timer >= preset['interval']:
+            self.timer = 0.0
+            room = preset['max_goblins'] - len(goblins) - self.pending
+            self.pending += max(0, min(preset['batch'], room))
+
+        # Spawn what's queued in chunks until the tick's budget runs out
+        if self.pending:
+            start = time.perf_counter()
+            deadline = start + preset['budget_ms'] / 1000.0
+            while self.pending:
+                count = min(self.pending, self.SPAWN_CHUNK)
+                xs, ys = self.pick_spawn_points(count, hero.x)
+                if not len(xs):
+                    self.pending = 0  # Nowhere to put them
+                    break
+                goblins.spawn_many(xs, ys)
+                self.pending -= count
+                self.spawned_total += count
+                if time.perf_counter() >= deadline:
+                    break
+            end = time.perf_counter()
+            self.last_spawn_ms = (end - start) * 1000.0
+            tracer.complete('SpawnDirector.spawn', 'goblins', start, end)
+
+    def _despawn(self, dt, camera_x):
+        """Remove goblins that have been off screen for longer than despawn_after"""
+        despawn_after = self.preset['despawn_after']
+        goblins = self.goblins
+        n = len(goblins)
+        if despawn_after is None or n == 0:
+            return
+        offset = goblins.x[:n] - camera_x
+        on_screen = (offset >= 0) & (offset <= WINDOW_WIDTH)
+        offscreen_time = goblins.offscreen_time[:n]
+        offscreen_time[on_screen] = 0
+        offscreen_time[~on_screen] += dt
+        removed = goblins.despawn(offscreen_time > despawn_after)
+        self.despawned_total += removed
+        if removed:
+            instant('despawn', 'goblins', count=removed)
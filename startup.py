@@ -0,0 +1,59 @@
+"""
+Start-up timeline.
+
+game.py imports this module first, so the clock starts before pygame, NumPy
+and the game modules are imported. Start-up code calls timeline.lap(phase)
+at the end of each phase ('import', 'init', 'first menu frame', 'assets',
+'world', ...). Work that runs concurrently (background audio loading) is
+added with timeline.add(). report() prints the timeline and when the first
+pixels were shown against the start-up target.
+"""
+import time
+
+_ORIGIN = time.perf_counter()
+
+
+class StartupTimeline:
+    TARGET_MS = 300.0  # Goal for the first menu frame
+
+    def __init__(self, origin):
+        self.origin = origin
+        self.phases = []  # (name, start, end) in perf_counter seconds, in order of completion
+        self._last = origin
+        self.first_pixels = None
+
+    def lap(self, name):
+        """End the current phase (started at the previous lap) and name it"""
+        now = time.perf_counter()
+        self.phases.append((name, self._last, now))
+        self._last = now
+
+    def add(self, name, start, end):
+        """Record a phase that ran alongside the others (e.g. on a worker thread)"""
+        self.phases.append((name, start, end))
+
+    def shown(self):
+        """Note that the first frame has just been presented"""
+        if self.first_pixels is None:
+            self.first_pixels = time.perf_counter()
+
+    def report(self):
+        """Print each phase with its start, duration and a bar on a shared time axis"""
+        if not self.phases:
+            return
+        end = max(phase_end for _, _, phase_end in self.phases)
+        scale = 40.0 / max(end - self.origin, 1e-9)
+        print(f"Start-up timeline ({(end - self.origin) * 1000:.0f} ms):")
+        for name, start, phase_end in self.phases:
+            offset = int((start - self.origin) * scale)
+            width = max(1, int((phase_end - start) * scale))
+            print(f"  {name:<18}{(start - self.origin) * 1000:7.1f} +{(phase_end - start) * 1000:7.1f} ms  "
+                  f"{' ' * offset}{'#' * width}")
+        if self.first_pixels is not None:
+            first_ms = (self.first_pixels - self.origin) * 1000
+            verdict = 'within' if first_ms <= self.TARGET_MS else 'over'
+            print(f"  first pixels at {first_ms:.0f} ms ({verdict} the {self.TARGET_MS:.0f} ms target)")
+
+
+# The process-wide timeline
+timeline = StartupTimeline(_ORIGIN)
@@ -1,10 +1,14 @@
 import pygame
 import math
 import random
+import numpy as np
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, DEBUG_MODE
-from utils import load_sprite
+from utils import load_sprite, normalize_surface
+from tracing import traced
+from memory_stats import track_surface
 
 
+@traced('load_terrain_assets', 'terrain')
 def load_terrain_assets():
     grass_img = load_sprite('grass.png')
     dirt_img = load_sprite('dirt.png')
@@ -19,7 +23,10 @@ def load_terrain_assets():
 
 # Terrain class
 class Terrain:
-    def __init__(self, grass_img, dirt_img, stone_img, tree_img, pine_tree_img, bush_img, flower_img, yellow_flower_img):
+    SCALED_CACHE_LIMIT = 512  # Scaled sprite variants kept; the least recently used is evicted beyond this
+
+    def __init__(self, grass_img, dirt_img, stone_img, tree_img, pine_tree_img, bush_img, flower_img, yellow_flower_img,
+                 terrain_width=None):
         self.grass_img = grass_img
         self.dirt_img = dirt_img
         self.stone_img = stone_img
@@ -29,7 +36,8 @@ class Terrain:
         self.flower_img = flower_img
         self.yellow_flower_img = yellow_flower_img
         self.tile_size = 32  # Size of each tile in pixels
-        self.terrain_width = WINDOW_WIDTH * 20  # 20 screens wide
+        self._scaled_cache = {}  # (sprite name, size) -> scaled surface, see scaled()
+        self.terrain_width = terrain_width or WINDOW_WIDTH * 20  # 20 screens wide by default
         self.points = []  # Points for the terrain surface
         self.trees = set()  # Set of x-positions where trees are placed
         self.pine_trees = set()  # Set of x-positions where pine trees are placed
@@ -62,6 +70,9 @@ class Terrain:
         
         # Ensure edges are closed
         self._close_terrain_edges()
+        
+        # Array copy of the surface polyline for batched height queries
+        self._build_height_index()
     def place_trees(self):
         """Legacy method that now calls place_vegetation for backward compatibility"""
         self.place_vegetation()
@@ -493,6 +504,7 @@ class Terrain:
                 new_y = self.points[i][1] * (1 - blend) + avg_y * blend
                 self.points[i] = (x, new_y)
     
+    @traced('Terrain.extend_terrain_left', 'terrain')
     def extend_terrain_left(self):
         # Extend terrain to the left
         if self.points and self.points[0][0] > 0:
@@ -525,7 +537,9 @@ class Terrain:
             for i in range(len(self.points)):
                 x, y = self.points[i]
                 self.points[i] = (x, y)  # This forces recalculation of points
+            self._build_height_index()
     
+    @traced('Terrain.extend_terrain_right', 'terrain')
     def extend_terrain_right(self):
         # Extend terrain to the right
         if self.points:
@@ -555,7 +569,9 @@ class Terrain:
             for i in range(len(self.points)):
                 x, y = self.points[i]
                 self.points[i] = (x, y)  # This forces recalculation of points
+            self._build_height_index()
     
+    @traced('Terrain.get_ground_height', 'terrain')
     def get_ground_height(self, x):
         """Get the height of the ground at a specific x position"""
         # First check if we're in the cave
@@ -585,6 +601,154 @@ class Terrain:
         # If we get here, return the height of the last point or default height
         return self.points[-1][1] if self.points else WINDOW_HEIGHT - 100
 
+    def _build_height_index(self):
+        """Mirror the terrain and cave floor polylines into NumPy arrays.
+        
+        Must be called again whenever self.points or the cave floor change.
+        """
+        self.height_xs = np.array([p[0] for p in self.points], dtype=np.float64)
+        self.height_ys = np.array([p[1] for p in self.points], dtype=np.float64)
+        if self.cave_floor and self.cave_entrance is not None and self.cave_exit is not None:
+            self.cave_floor_xs = np.array([p[0] for p in self.cave_floor], dtype=np.float64)
+            self.cave_floor_ys = np.array([p[1] for p in self.cave_floor], dtype=np.float64)
+        else:
+            self.cave_floor_xs = None
+            self.cave_floor_ys = None
+        self._build_ground_polyline()
+    
+    def _build_ground_polyline(self):
+        """Merge the surface and cave floor into the single polyline projectiles collide with.
+        
+        Matches get_ground_height: the cave floor replaces the surface between
+        the entrance and exit, joined by (almost) vertical walls.
+        """
+        xs, ys = self.height_xs, self.height_ys
+        if self.cave_floor_xs is not None and len(xs):
+            entrance, exit_x = self.cave_entrance, self.cave_exit
+            fxs, fys = self.cave_floor_xs, self.cave_floor_ys
+            eps = 1e-6
+            inside = (fxs > entrance) & (fxs < exit_x)
+            left = xs < entrance - eps
+            right = xs > exit_x + eps
+            xs, ys = (
+                np.concatenate((xs[left], [entrance - eps, entrance], fxs[inside], [exit_x, exit_x + eps], xs[right])),
+                np.concatenate((ys[left],
+                                [np.interp(entrance - eps, self.height_xs, self.height_ys),
+                                 np.interp(entrance, fxs, fys)],
+                                fys[inside],
+                                [np.interp(exit_x, fxs, fys),
+                                 np.interp(exit_x + eps, self.height_xs, self.height_ys)],
+                                ys[right])))
+            # np.interp needs strictly increasing x
+            keep = np.concatenate(([True], np.diff(xs) > 0))
+            xs, ys = xs[keep], ys[keep]
+        if len(xs) and ys[0] != self.height_ys[-1]:
+            # Left of the first point get_ground_height falls back to the last point's
+            # height: a vertical wall, which sweeps must see as a vertex
+            xs = np.concatenate(([xs[0] - 1e-6], xs))
+            ys = np.concatenate(([self.height_ys[-1]], ys))
+        self.ground_xs = xs
+        self.ground_ys = ys
+    
+    def _ground_along(self, xs):
+        """Untruncated height of the merged ground polyline at each x"""
+        if not len(self.ground_xs):
+            return np.full(np.shape(xs), WINDOW_HEIGHT - 100, dtype=np.float64)
+        heights = np.interp(xs, self.ground_xs, self.ground_ys)
+        # Outside the polyline get_ground_height falls back to the last point
+        heights[(xs < self.ground_xs[0]) | (xs > self.ground_xs[-1])] = self.height_ys[-1]
+        return heights
+    
+    @traced('Terrain.sweep_ground', 'terrain')
+    def sweep_ground(self, x0, y0, x1, y1):
+        """
+        Continuous collision of moving points against the ground.
+        
+        Each point travels in a straight line from (x0, y0) to (x1, y1) during
+        the step. Polyline vertices crossed on the way split that segment into
+        pieces over which the ground is linear, so the first contact is solved
+        exactly. Thin peaks cannot be skipped, however long the step.
+        
+        Args:
+            x0, y0, x1, y1: Arrays of segment start and end points
+            
+        Returns:
+            (hit, t, hx, hy): hit mask, fraction of the step at first contact
+            (1 where there was none) and the contact point
+        """
+        x0 = np.asarray(x0, dtype=np.float64)
+        y0 = np.asarray(y0, dtype=np.float64)
+        x1 = np.asarray(x1, dtype=np.float64)
+        y1 = np.asarray(y1, dtype=np.float64)
+        dx = x1 - x0
+        dy = y1 - y0
+        n = x0.shape[0]
+        hit = np.zeros(n, dtype=np.bool_)
+        t_hit = np.ones(n, dtype=np.float64)
+        
+        # Polyline vertices strictly inside each segment's x span (binary search in the index)
+        gxs = self.ground_xs
+        lo = np.searchsorted(gxs, np.minimum(x0, x1), side='right')
+        hi = np.searchsorted(gxs, np.maximum(x0, x1), side='left')
+        crossed = np.maximum(hi - lo, 0)
+        rightward = dx >= 0
+        safe_dx = np.where(dx != 0, dx, 1.0)
+        
+        def boundary(j):
+            """Segment parameter of the j-th crossed vertex (1 past the last one)"""
+            t = np.ones(n, dtype=np.float64)
+            inner = crossed >= j
+            if inner.any():
+                k = np.where(rightward, lo + j - 1, hi - j)[inner]
+                t[inner] = (gxs[k] - x0[inner]) / safe_dx[inner]
+            return t
+        
+        # Signed depth below the ground at t (>= 0 means touching); linear within a piece
+        def depth(t):
+            return (y0 + dy * t) - self._ground_along(x0 + dx * t)
+        
+        t_start = np.zeros(n, dtype=np.float64)
+        d_start = depth(t_start)
+        started_inside = d_start >= 0
+        hit |= started_inside
+        t_hit[started_inside] = 0.0
+        
+        for j in range(1, int(crossed.max(initial=0)) + 2):
+            t_end = boundary(j)
+            d_end = depth(t_end)
+            enters = ~hit & (d_end >= 0)
+            if enters.any():
+                # d_start < 0 <= d_end: interpolate the crossing within the piece
+                frac = d_start[enters] / (d_start[enters] - d_end[enters])
+                t_hit[enters] = t_start[enters] + (t_end[enters] - t_start[enters]) * frac
+                hit |= enters
+            if hit.all():
+                break
+            t_start, d_start = t_end, d_end
+        
+        hx = x0 + dx * t_hit
+        hy = y0 + dy * t_hit
+        return hit, t_hit, hx, hy
+    
+    def get_ground_heights(self, xs):
+        """Vectorised get_ground_height: ground height for every x in an array"""
+        xs = np.asarray(xs, dtype=np.float64)
+        if not len(self.height_xs):
+            return np.full(xs.shape, WINDOW_HEIGHT - 100, dtype=np.float64)
+        
+        heights = np.interp(xs, self.height_xs, self.height_ys)
+        # Outside the polyline get_ground_height falls back to the last point
+        outside = (xs < self.height_xs[0]) | (xs > self.height_xs[-1])
+        heights[outside] = self.height_ys[-1]
+        
+        # The cave floor replaces the surface between the entrance and exit
+        if self.cave_floor_xs is not None:
+            in_cave = (xs >= self.cave_entrance) & (xs <= self.cave_exit)
+            heights[in_cave] = np.interp(xs[in_cave], self.cave_floor_xs, self.cave_floor_ys)
+        
+        # get_ground_height truncates to whole pixels
+        return np.trunc(heights)
+
     def get_biome_at(self, x):
         """Get the biome at a specific x coordinate"""
         if not self.biome_points:
@@ -693,6 +857,20 @@ class Terrain:
                            (x1 - camera_x, y1), 
                            (x2 - camera_x, y2), 4)  # Slightly thicker line
 
+    def scaled(self, name, img, size):
+        """img scaled to size, made once per (name, size) and stored in the cheapest display format"""
+        key = (name, size)
+        surface = self._scaled_cache.pop(key, None)
+        if surface is None:
+            # Full: evict the least recently used variant (dicts keep insertion order)
+            if len(self._scaled_cache) >= self.SCALED_CACHE_LIMIT:
+                del self._scaled_cache[next(iter(self._scaled_cache))]
+            surface = normalize_surface(pygame.transform.scale(img, size), f'terrain_{name}_{size[0]}x{size[1]}')
+            track_surface(surface, 'terrain.scaled')
+        self._scaled_cache[key] = surface  # Re-inserted as the most recently used
+        return surface
+
+    @traced('Terrain.draw', 'terrain')
     def draw(self, screen, camera_x):
         """Draw the terrain"""
         # Only draw terrain that's visible on screen
@@ -775,7 +953,7 @@ class Terrain:
                 
                 # Draw the tree with scaled size
                 if tree_width > 0 and tree_height > 0:
-                    scaled_tree = pygame.transform.scale(self.tree_img, (tree_width, tree_height))
+                    scaled_tree = self.scaled('tree', self.tree_img, (tree_width, tree_height))
                     screen.blit(scaled_tree, (tree_x, tree_y))
             
             # Check for pine trees (not in an elif, so both types can be checked)
@@ -795,7 +973,7 @@ class Terrain:
                 
                 # Draw the pine tree with scaled size
                 if tree_width > 0 and tree_height > 0:
-                    scaled_tree = pygame.transform.scale(self.pine_tree_img, (tree_width, tree_height))
+                    scaled_tree = self.scaled('pine_tree', self.pine_tree_img, (tree_width, tree_height))
                     screen.blit(scaled_tree, (tree_x, tree_y))
 
         # Draw bushes (on top of terrain but behind player)
@@ -814,7 +992,7 @@ class Terrain:
                 # Only draw if in grass biome and image is loaded
                 if self.get_biome_at(x) < 0.2 and self.bush_img and bush_size > 0:
                     screen.blit(
-                        pygame.transform.scale(self.bush_img, (bush_size, bush_size)),
+                        self.scaled('bush', self.bush_img, (bush_size, bush_size)),
                         (screen_x - (bush_size // 2) + (tile_size // 2), bush_y)
                     )
 
@@ -835,15 +1013,15 @@ class Terrain:
                 # Only draw if in grass biome and image is loaded
                 if self.get_biome_at(x) < 0.2 and self.flower_img and flower_size > 0:
                     # Choose the appropriate flower image
-                    flower_img = self.flower_img  # Default to regular flower
+                    flower_name, flower_img = 'flower', self.flower_img  # Default to regular flower
                     if flower_data.get('type') == 'yellow' and self.yellow_flower_img:
-                        flower_img = self.yellow_flower_img
+                        flower_name, flower_img = 'yellow_flower', self.yellow_flower_img
                         # Yellow flowers are slightly smaller
                         flower_size = int(flower_size * 0.9)
                     
                     # Draw the flower
                     screen.blit(
-                        pygame.transform.scale(flower_img, (flower_size, flower_size)),
+                        self.scaled(flower_name, flower_img, (flower_size, flower_size)),
                         (screen_x - (flower_size // 2) + (tile_size // 2), flower_y)
                     )
 
@@ -861,15 +1039,15 @@ class Terrain:
             
             # Choose the appropriate tile image based on biome
             if biome < 0.5:  # Grass biome
-                tile_img = self.grass_img
+                tile_name, tile_img = 'grass', self.grass_img
             else:  # Stone biome
-                tile_img = self.stone_img
+                tile_name, tile_img = 'stone', self.stone_img
                 
             # Draw the terrain segment
             segment_width = x2 - x1
             if segment_width > 0 and tile_img:
                 # Scale the tile to fit the segment width
-                scaled_tile = pygame.transform.scale(tile_img, (segment_width, self.tile_size))
+                scaled_tile = self.scaled(tile_name, tile_img, (segment_width, self.tile_size))
                 screen.blit(scaled_tile, (x1 - camera_x, y1 - self.tile_size))
 
         # Draw the cave ceiling and floor if visible
@@ -905,9 +1083,12 @@ class Terrain:
                     if 'variant' in flower_data and flower_data['variant'] == 1:
                         # Create a slightly different colored variant once
                         if 'tinted_img' not in flower_data:
-                            flower_data['tinted_img'] = flower_img.copy()
+                            # convert_alpha() copies with per-pixel alpha so colour-keyed sprites tint correctly
+                            tinted = flower_img.convert_alpha()
                             # Tint the flower (adjust RGB values as needed)
-                            flower_data['tinted_img'].fill((255, 200, 200, 255), special_flags=pygame.BLEND_RGB_MULT)
+                            tinted.fill((255, 200, 200, 255), special_flags=pygame.BLEND_RGB_MULT)
+                            flower_data['tinted_img'] = track_surface(normalize_surface(tinted, 'terrain_flower_tinted'),
+                                                                      'terrain.flowers')
                         flower_img = flower_data['tinted_img']
                 
                     # Draw the flower with consistent rotation
@@ -920,7 +1101,9 @@ class Terrain:
                         # Create a rotated version of the flower
                         if 'rotated_flower' not in flower_data or 'last_size' not in flower_data or flower_data['last_size'] != flower_size:
                             scaled_flower = pygame.transform.scale(flower_img, (flower_size, flower_size))
-                            flower_data['rotated_flower'] = pygame.transform.rotate(scaled_flower, angle)
+                            flower_data['rotated_flower'] = track_surface(
+                                normalize_surface(pygame.transform.rotate(scaled_flower, angle), 'terrain_flower_rotated'),
+                                'terrain.flowers')
                             flower_data['last_size'] = flower_size
                         
                         rotated_flower = flower_data['rotated_flower']
@@ -942,7 +1125,7 @@ class Terrain:
             if biome < 0.1:  # Full grass biome
                 # Draw grass with dirt underneath
                 if self.grass_img:
-                    screen.blit(pygame.transform.scale(self.grass_img, (tile_size, tile_size)), 
+                    screen.blit(self.scaled('grass', self.grass_img, (tile_size, tile_size)), 
                               (screen_x, y))
                 else:
                     pygame.draw.rect(screen, (34, 139, 34), (screen_x, y, tile_size, tile_size))
@@ -950,7 +1133,7 @@ class Terrain:
                 # Dirt layer below grass
                 if self.dirt_img:
                     for dy in range(tile_size, tile_size*3, tile_size):
-                        screen.blit(pygame.transform.scale(self.dirt_img, (tile_size, tile_size)), 
+                        screen.blit(self.scaled('dirt', self.dirt_img, (tile_size, tile_size)), 
                                   (screen_x, y + dy))
                 else:
                     for dy in range(tile_size, tile_size*3, tile_size):
@@ -960,7 +1143,7 @@ class Terrain:
             elif biome > 0.9:  # Full stone biome
                 # Cobblestone top layer
                 if self.stone_img:
-                    screen.blit(pygame.transform.scale(self.stone_img, (tile_size, tile_size)), 
+                    screen.blit(self.scaled('stone', self.stone_img, (tile_size, tile_size)), 
                               (screen_x, y))
                 else:
                     pygame.draw.rect(screen, (128, 128, 128), 
@@ -974,8 +1157,8 @@ class Terrain:
                     stone_surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
                     
                     # Scale and draw the grass and stone
-                    grass_img = pygame.transform.scale(self.grass_img, (tile_size, tile_size))
-                    stone_img = pygame.transform.scale(self.stone_img, (tile_size, tile_size))
+                    grass_img = self.scaled('grass', self.grass_img, (tile_size, tile_size))
+                    stone_img = self.scaled('stone', self.stone_img, (tile_size, tile_size))
                     
                     grass_surf.blit(grass_img, (0, 0))
                     stone_surf.blit(stone_img, (0, 0))
@@ -992,8 +1175,8 @@ class Terrain:
                     if self.dirt_img and self.stone_img:
                         for dy in range(tile_size, tile_size*3, tile_size):
                             dirt_surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-                            dirt_img = pygame.transform.scale(self.dirt_img, (tile_size, tile_size))
-                            stone_img = pygame.transform.scale(self.stone_img, (tile_size, tile_size))
+                            dirt_img = self.scaled('dirt', self.dirt_img, (tile_size, tile_size))
+                            stone_img = self.scaled('stone', self.stone_img, (tile_size, tile_size))
                             
                             dirt_surf.blit(dirt_img, (0, 0))
                             stone_surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
@@ -1021,7 +1204,7 @@ class Terrain:
                 # Start stone layer higher in stone biome
                 start_dy = tile_size if biome > 0.5 else tile_size*3
                 for dy in range(start_dy, tile_size*5, tile_size):
-                    screen.blit(pygame.transform.scale(self.stone_img, (tile_size, tile_size)), 
+                    screen.blit(self.scaled('stone', self.stone_img, (tile_size, tile_size)), 
                               (screen_x, y + dy))
             else:
                 # Fallback to colored rectangles
@@ -0,0 +1,29 @@
+import os
+import random
+import sys
+
+# Headless: no window or audio device is needed
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+
+
+@pytest.fixture(scope='session')
+def display():
+    """A dummy display, needed by convert() / convert_alpha() and sprite loading"""
+    pygame.display.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    yield screen
+    pygame.display.quit()
+
+
+@pytest.fixture
+def terrain():
+    """A small seeded world (with its cave); no sprites are needed to build one"""
+    from terrain import Terrain
+    random.seed(1)
+    return Terrain(*[None] * 8, terrain_width=WINDOW_WIDTH * 8)
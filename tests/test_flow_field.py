@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+import numpy as np
+from flow_field import FlowField
+from goblin_horde import GoblinHorde
+
+W = FlowField.COLUMN_WIDTH
+
+
+def heightmap(heights):
+    """Terrain stand-in: one point per column centre, no cave"""
+    xs = np.arange(len(heights)) * W + W / 2
+    ys = np.asarray(heights, dtype=np.float64)
+    return SimpleNamespace(height_xs=xs, terrain_width=len(heights) * W, cave_floor_xs=None,
+                           get_ground_heights=lambda q: np.interp(q, xs, ys))
+
+
+def walk(field, col):
+    """Path cost from col to the hero column one step at a time (inf if a step is blocked)"""
+    hero = field.hero_col
+    cost = 0.0
+    while col != hero:
+        if col < hero:
+            if not field.right_ok[col]:
+                return np.inf
+            cost += field.right_cost[col]
+            col += 1
+        else:
+            if not field.left_ok[col - 1]:
+                return np.inf
+            cost += field.left_cost[col - 1]
+            col -= 1
+    return cost
+
+
+def test_flat_ground_points_at_the_hero():
+    field = FlowField(GoblinHorde.HEIGHT)
+    field.update(heightmap([500] * 10), 4 * W + 3)
+    np.testing.assert_array_equal(field.distance, np.abs(np.arange(10) - 4) * W)
+    np.testing.assert_array_equal(field.direction, [1, 1, 1, 1, 0, -1, -1, -1, -1, -1])
+
+
+def test_cliffs_can_be_dropped_but_not_climbed():
+    # A 100 px step up at column 5 (screen y grows downwards)
+    field = FlowField(GoblinHorde.HEIGHT)
+    terrain = heightmap([500] * 5 + [400] * 5)
+    field.update(terrain, 8 * W)  # Hero on the high side
+    assert np.isinf(field.distance[:5]).all()
+    assert (field.direction[:5] == 1).all()  # Still closing in as far as the cliff
+    field.update(terrain, 1 * W)  # Hero on the low side: dropping down is fine
+    assert np.isfinite(field.distance).all()
+    assert field.passable(np.array([4 * W + 5.0, 5 * W + 5.0]), np.array([5 * W + 5.0, 4 * W + 5.0])).tolist() == \
+        [False, True]
+
+
+def test_matches_step_by_step_walk_on_real_terrain(terrain):
+    field = FlowField(GoblinHorde.HEIGHT)
+    for hero_x in (0.0, terrain.terrain_width * 0.3, terrain.cave_entrance + 50, terrain.terrain_width - 1):
+        field.update(terrain, hero_x)
+        expected = np.array([walk(field, c) for c in range(len(field.heights))])
+        np.testing.assert_allclose(field.distance, expected)
+
+
+def test_rebuilds_when_the_terrain_changes():
+    field = FlowField(GoblinHorde.HEIGHT)
+    field.update(heightmap([500] * 10), 4 * W)
+    assert len(field.heights) == 10
+    field.update(heightmap([500] * 20), 4 * W)  # Same hero column, new terrain arrays
+    assert len(field.heights) == 20
+    assert len(field.distance) == 20
@@ -0,0 +1,68 @@
+import csv
+import json
+import numpy as np
+from frame_recorder import FrameRecorder
+
+BUDGET = FrameRecorder.BUDGET_MS
+
+
+def record(recorder, frame_ms, state='playing', gc_gen=-1):
+    recorder.record(frame_ms, 1.0, 2.0, 1, 3, 4, 5, state, gc_ms=0.5, gc_gen=gc_gen)
+
+
+def test_nothing_is_recorded_until_started(tmp_path):
+    recorder = FrameRecorder(8, str(tmp_path))
+    record(recorder, 16.0)
+    assert recorder.count == 0
+    assert recorder.dump() is None
+
+
+def test_ring_buffer_keeps_the_latest_frames_in_order(tmp_path):
+    recorder = FrameRecorder(4, str(tmp_path))
+    recorder.start()
+    for i in range(10):
+        record(recorder, float(i))
+    frames = recorder.frames()
+    np.testing.assert_array_equal(frames['frame_ms'], [6, 7, 8, 9])
+    assert (np.diff(frames['time']) >= 0).all()
+    summary = recorder.summary()
+    assert summary['frames'] == 4
+    assert summary['frames_dropped'] == 6
+
+
+def test_summary_counts_hitches_and_gc_frames(tmp_path):
+    recorder = FrameRecorder(100, str(tmp_path))
+    recorder.start()
+    for _ in range(90):
+        record(recorder, BUDGET)
+    record(recorder, BUDGET * 3, gc_gen=0)
+    record(recorder, BUDGET * 5, gc_gen=2)
+    record(recorder, BUDGET * 9, state='menu')
+    summary = recorder.summary()
+    assert summary['hitches'] == {'over_2x': 3, 'over_4x': 2, 'over_8x': 1}
+    assert summary['gc_frames'] == {'gen_0': 1, 'gen_1': 0, 'gen_2': 1}
+    assert summary['frame_ms']['p50'] == round(BUDGET, 3)
+    assert summary['frame_ms']['max'] == round(float(np.float32(BUDGET * 9)), 3)
+    worst = summary['worst_hitches']
+    assert [hitch['state'] for hitch in worst] == ['playing', 'playing', 'menu']  # Chronological
+
+
+def test_dump_json_and_csv(tmp_path):
+    recorder = FrameRecorder(16, str(tmp_path))
+    recorder.start()
+    for i in range(5):
+        record(recorder, 10.0 + i, state='menu' if i == 0 else 'playing')
+
+    assert recorder.dump(str(tmp_path / 'frames.json')) == str(tmp_path / 'frames.json')
+    report = json.loads((tmp_path / 'frames.json').read_text())
+    assert report['summary']['frames'] == 5
+    assert report['frames']['frame_ms'] == [10.0, 11.0, 12.0, 13.0, 14.0]
+    assert report['states'] == list(FrameRecorder.STATES)
+
+    path = recorder.dump(str(tmp_path / 'frames.csv'))
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(FrameRecorder.FIELDS)
+    assert len(rows) == 6
+    assert rows[1][-1] == 'menu'
+    assert json.loads((tmp_path / 'frames.summary.json').read_text())['frames'] == 5
@@ -0,0 +1,110 @@
+import numpy as np
+import pygame
+import pytest
+from goblin_horde import GoblinHorde, NeighbourIndex, LOD_FULL, LOD_NEAR
+
+
+@pytest.fixture
+def horde(display):
+    return GoblinHorde(capacity=2, seed=1)
+
+
+def crowd(horde, rng, count):
+    """count goblins scattered over a small area, some already dead"""
+    horde.spawn_many(rng.uniform(-200, 600, count), rng.uniform(-100, 300, count))
+    horde.health[:count] = rng.integers(-5, 40, count)
+
+
+def brute_force_first_hit(horde, rect):
+    rows = [i for i in range(len(horde))
+            if horde.lod[i] == LOD_FULL and horde.health[i] > 0 and rect.colliderect(horde.get_rect(i))]
+    return min(rows, default=-1)
+
+
+def test_spawn_grows_and_keeps_rows(horde):
+    for i in range(5):
+        assert horde.spawn(i * 10.0, 100.0 + i) == i
+    assert len(horde) == 5
+    assert horde.capacity >= 5
+    np.testing.assert_array_equal(horde.x[:5], [0, 10, 20, 30, 40])
+    np.testing.assert_array_equal(horde.y[:5], [100, 101, 102, 103, 104])
+    assert (horde.health[:5] == GoblinHorde.MAX_HEALTH).all()
+
+
+def test_remove_moves_the_last_row_into_the_gap(horde):
+    horde.spawn_many(np.array([0.0, 10.0, 20.0]), np.zeros(3))
+    horde.remove(0)
+    assert len(horde) == 2
+    np.testing.assert_array_equal(horde.x[:2], [20, 10])
+
+
+def test_spawn_many_resets_reused_rows(horde):
+    horde.spawn_many(np.array([0.0, 10.0, 20.0]), np.zeros(3))
+    horde.is_attacking[:3] = True
+    horde.health[:3] = 1
+    horde.clear()
+    assert horde.spawn_many(np.array([5.0, 6.0]), np.ones(2)) == 0
+    assert not horde.is_attacking[:2].any()
+    assert (horde.health[:2] == GoblinHorde.MAX_HEALTH).all()
+
+
+def test_damage_defers_removal_until_remove_dead(horde):
+    horde.spawn_many(np.array([0.0, 10.0, 20.0, 30.0]), np.zeros(4))
+    assert horde.damage(1, GoblinHorde.MAX_HEALTH)
+    assert not horde.damage(2, 1)
+    assert horde.damage(3, GoblinHorde.MAX_HEALTH + 5)
+    assert len(horde) == 4  # Rows stay valid until compacted
+    assert horde.remove_dead() == 2
+    np.testing.assert_array_equal(horde.x[:2], [0, 20])
+    assert horde.health[1] == GoblinHorde.MAX_HEALTH - 1
+
+
+def test_despawn_keeps_order_of_the_rest(horde):
+    horde.spawn_many(np.arange(6, dtype=np.float64), np.zeros(6))
+    assert horde.despawn(np.array([True, False, True, False, False, True])) == 3
+    np.testing.assert_array_equal(horde.x[:3], [1, 3, 4])
+
+
+def test_first_hit_matches_brute_force(horde):
+    rng = np.random.default_rng(7)
+    crowd(horde, rng, 80)
+    horde.build_broadphase()
+    for _ in range(3000):
+        w, h = rng.integers(1, 60, 2)
+        rect = pygame.Rect(int(rng.integers(-300, 700)), int(rng.integers(-200, 400)), int(w), int(h))
+        assert horde.first_hit(rect) == brute_force_first_hit(horde, rect)
+
+
+def test_broadphase_only_indexes_full_detail_goblins(horde):
+    horde.spawn_many(np.array([0.0, 0.0]), np.zeros(2))
+    horde.lod[0] = LOD_NEAR
+    horde.build_broadphase()
+    assert horde.first_hit(pygame.Rect(0, 0, 10, 10)) == 1
+
+
+def test_neighbour_index_matches_pairwise_sums():
+    rng = np.random.default_rng(5)
+    xs = np.round(rng.uniform(0, 2000, 300))  # Whole pixels, so some goblins share an x
+    values = rng.uniform(-1, 1, 300)
+    count, sums = NeighbourIndex(xs).neighbour_sums(values, 120)
+    near = np.abs(xs[:, None] - xs[None, :]) <= 120
+    np.fill_diagonal(near, False)
+    np.testing.assert_array_equal(count, near.sum(axis=1))
+    np.testing.assert_allclose(sums, (near * values[None, :]).sum(axis=1))
+
+
+def test_neighbour_separation_matches_pairwise_pushes():
+    rng = np.random.default_rng(6)
+    xs = np.round(rng.uniform(0, 500, 200))
+    radius = 20
+    index = NeighbourIndex(xs)
+    rank = np.empty(len(xs), dtype=np.int64)
+    rank[index.order] = np.arange(len(xs))
+    expected = np.zeros(len(xs))
+    for i in range(len(xs)):
+        for j in range(len(xs)):
+            if i != j and abs(xs[i] - xs[j]) <= radius:
+                # Pushed away from j; goblins at the same x split by their order in the index
+                push = radius - abs(xs[i] - xs[j])
+                expected[i] += push if rank[j] < rank[i] else -push
+    np.testing.assert_allclose(index.separation(radius), expected, atol=1e-9)
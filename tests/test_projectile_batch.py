@@ -0,0 +1,91 @@
+import numpy as np
+import pygame
+import pytest
+from goblin_horde import GoblinHorde
+from projectile_batch import ProjectileBatch, KIND_FIRE, KIND_ICE
+
+
+@pytest.fixture
+def batch(display):
+    return ProjectileBatch(capacity=2)
+
+
+def world(seed):
+    """A goblin crowd (some dead) and a batch of projectiles over the same area"""
+    rng = np.random.default_rng(seed)
+    goblins = GoblinHorde(seed=seed)
+    count = int(rng.integers(0, 60))
+    goblins.spawn_many(rng.uniform(-200, 600, count), rng.uniform(-100, 300, count))
+    goblins.health[:count] = rng.integers(-5, 40, count)
+    batch = ProjectileBatch()
+    for _ in range(int(rng.integers(0, 80))):
+        # Some centres on exact halves, where Rect's rounding matters
+        x = np.round(rng.uniform(-250, 650) * 2) / 2
+        y = np.round(rng.uniform(-200, 350) * 2) / 2
+        batch.spawn(int(rng.integers(0, 2)), float(x), float(y), *rng.uniform(-9, 9, 2))
+    goblins.build_broadphase()
+    return goblins, batch
+
+
+def hit_one_by_one(batch, goblins):
+    """Reference hit test: one Rect and one first_hit() per projectile"""
+    n = batch.count
+    hit = np.zeros(n, dtype=np.bool_)
+    rect = pygame.Rect(0, 0, 0, 0)
+    for i, half in enumerate(batch.half_extents().tolist()):
+        rect.size = (int(half * 2), int(half * 2))
+        rect.center = (float(batch.x[i]), float(batch.y[i]))
+        row = goblins.first_hit(rect)
+        if row >= 0:
+            goblins.damage(row, batch.DAMAGE[batch.kind[i]])
+            hit[i] = True
+    return batch._take(hit, batch.x[:n], batch.y[:n])
+
+
+def test_spawn_grows_and_cull_compacts(batch):
+    for i in range(5):
+        batch.spawn(KIND_FIRE if i % 2 else KIND_ICE, i * 100.0, 50.0, 1.0, 0.0)
+    assert len(batch) == 5
+    batch.cull(50, 350, 0, 100)
+    np.testing.assert_array_equal(batch.x[:len(batch)], [100, 200, 300])
+    np.testing.assert_array_equal(batch.kind[:len(batch)], [KIND_FIRE, KIND_ICE, KIND_FIRE])
+
+
+def test_update_all_integrates_and_times_out(batch):
+    batch.spawn(KIND_FIRE, 0.0, 0.0, 2.0, -1.0)
+    batch.spawn(KIND_ICE, 0.0, 0.0, 2.0, -1.0)
+    batch.lifetime[1] = 0.5
+    xs, ys, kinds, ts = batch.update_all(1 / 60)
+    # The ice projectile ran out of lifetime and burst where it was
+    assert kinds.tolist() == [KIND_ICE]
+    assert len(batch) == 1
+    gravity = ProjectileBatch.GRAVITY[KIND_FIRE]
+    assert batch.vy[0] == pytest.approx(-1.0 + gravity)
+    assert batch.x[0] == pytest.approx(2.0)
+    assert batch.y[0] == pytest.approx(-1.0 + gravity)
+    assert batch.prev_x[0] == 0.0  # Only store_previous_positions() moves these
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_hit_goblins_matches_one_by_one(display, seed):
+    goblins, batch = world(seed)
+    expected = hit_one_by_one(batch, goblins)
+    goblins_batched, batch_batched = world(seed)
+    result = batch_batched.hit_goblins(goblins_batched)
+    for a, b in zip(expected, result):
+        np.testing.assert_array_equal(a, b)
+    np.testing.assert_array_equal(goblins.health[:len(goblins)], goblins_batched.health[:len(goblins_batched)])
+    assert len(batch) == len(batch_batched)
+
+
+def test_a_goblin_killed_earlier_in_the_batch_is_passed_over(batch):
+    goblins = GoblinHorde(seed=1)
+    goblins.spawn_many(np.array([100.0, 100.0]), np.array([100.0, 100.0]))
+    goblins.health[0] = 5  # The first projectile kills row 0
+    goblins.build_broadphase()
+    for _ in range(3):
+        batch.spawn(KIND_FIRE, 110.0, 120.0, 1.0, 0.0)
+    xs, ys, kinds, ts = batch.hit_goblins(goblins)
+    assert len(xs) == 3
+    assert goblins.health[0] <= 0
+    assert goblins.health[1] == GoblinHorde.MAX_HEALTH - 2 * ProjectileBatch.DAMAGE[KIND_FIRE]
@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from goblin_horde import GoblinHorde
+from spawn_director import SpawnDirector
+from settings import SPAWN_PRESETS
+
+
+@pytest.fixture
+def goblins(display):
+    return GoblinHorde(seed=1)
+
+
+def director(goblins, terrain, **overrides):
+    spawner = SpawnDirector(goblins, dict(SPAWN_PRESETS['normal'], **overrides), seed=1)
+    spawner.reset(terrain)
+    return spawner
+
+
+def test_reset_places_the_initial_goblins_on_the_ground(goblins, terrain):
+    preset = SPAWN_PRESETS['normal']
+    director(goblins, terrain)
+    n = preset['initial_count']
+    assert len(goblins) == n
+    np.testing.assert_array_equal(goblins.x[:n], preset['initial_x'] + np.arange(n) * preset['initial_spacing'])
+    feet = goblins.y[:n] + GoblinHorde.HEIGHT
+    np.testing.assert_array_equal(feet, terrain.get_ground_heights(goblins.x[:n] + GoblinHorde.WIDTH / 2))
+
+
+def test_spawn_points_avoid_the_cave_and_cliffs(goblins, terrain):
+    spawner = director(goblins, terrain)
+    xs = spawner.spawn_xs
+    assert len(xs)
+    assert not ((xs + GoblinHorde.WIDTH >= terrain.cave_entrance) & (xs <= terrain.cave_exit)).any()
+    slopes = np.abs(np.diff(terrain.height_ys) / np.diff(terrain.height_xs))
+    cols = np.searchsorted(terrain.height_xs, xs)
+    # Both segments next to a spawn point are walkable
+    assert (slopes[np.maximum(cols - 1, 0)] <= SpawnDirector.MAX_SLOPE).all()
+    assert (slopes[np.minimum(cols, len(slopes) - 1)] <= SpawnDirector.MAX_SLOPE).all()
+
+
+def test_picks_keep_away_from_the_hero(goblins, terrain):
+    spawner = director(goblins, terrain, min_hero_distance=500)
+    hero_x = terrain.terrain_width / 2
+    xs, ys = spawner.pick_spawn_points(2000, hero_x)
+    assert len(xs) == 2000
+    assert (np.abs(xs - hero_x) > 500).all()
+
+
+def test_population_cap_and_interval(goblins, terrain):
+    spawner = director(goblins, terrain, initial_count=0, interval=1.0, batch=4, max_goblins=6,
+                       despawn_after=None)
+    hero = SimpleNamespace(x=0.0)
+    spawner.update(0.5, hero, 0)
+    assert len(goblins) == 0  # Not due yet
+    spawner.update(0.5, hero, 0)
+    assert len(goblins) == 4
+    spawner.update(1.0, hero, 0)
+    assert len(goblins) == 6  # Capped
+    spawner.update(1.0, hero, 0)
+    assert len(goblins) == 6
+    assert spawner.spawned_total == 6
+
+
+def test_spawning_stops_at_the_tick_budget(goblins, terrain):
+    chunk = SpawnDirector.SPAWN_CHUNK
+    spawner = director(goblins, terrain, initial_count=0, interval=1.0, batch=chunk * 3,
+                       max_goblins=chunk * 3, budget_ms=0.0, despawn_after=None)
+    hero = SimpleNamespace(x=0.0)
+    # No budget: one chunk per tick, the rest stays queued for later ticks
+    spawner.update(1.0, hero, 0)
+    assert len(goblins) == chunk
+    assert spawner.pending == chunk * 2
+    spawner.update(0.0, hero, 0)
+    spawner.update(0.0, hero, 0)
+    assert len(goblins) == chunk * 3
+    assert spawner.pending == 0
+
+
+def test_goblins_off_screen_too_long_despawn(goblins, terrain):
+    spawner = director(goblins, terrain, initial_count=0, interval=1e9, despawn_after=2.0)
+    goblins.spawn_many(np.array([100.0, 5000.0]), np.zeros(2))
+    hero = SimpleNamespace(x=0.0)
+    spawner.update(1.5, hero, 0)
+    assert len(goblins) == 2
+    spawner.update(1.0, hero, 0)
+    assert len(goblins) == 1
+    assert goblins.x[0] == 100.0
+    assert spawner.despawned_total == 1
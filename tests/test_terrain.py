@@ -0,0 +1,61 @@
+import numpy as np
+import pygame
+import pytest
+
+
+def test_scaled_variants_are_cached_and_evicted_least_recently_used(display, terrain, monkeypatch):
+    monkeypatch.setattr(terrain, 'SCALED_CACHE_LIMIT', 2)
+    img = pygame.Surface((8, 8)).convert()
+    img.fill((40, 90, 20))
+    tree = terrain.scaled('tree', img, (4, 4))
+    assert terrain.scaled('tree', img, (4, 4)) is tree
+    bush = terrain.scaled('bush', img, (5, 5))
+    terrain.scaled('tree', img, (4, 4))  # Now the most recently used
+    terrain.scaled('flower', img, (6, 6))  # Full: evicts the bush, not the tree
+    assert terrain.scaled('tree', img, (4, 4)) is tree
+    assert terrain.scaled('bush', img, (5, 5)) is not bush
+    assert len(terrain._scaled_cache) == 2
+
+
+def test_sweep_ground_misses_no_contact(terrain):
+    rng = np.random.default_rng(3)
+    n = 3000
+    x0 = rng.uniform(0, terrain.terrain_width, n)
+    x1 = x0 + rng.uniform(-400, 400, n)
+    y0 = terrain._ground_along(x0) - rng.uniform(1, 150, n)  # Every point starts above ground
+    y1 = terrain._ground_along(x1) + rng.uniform(-150, 150, n)
+    hit, t, hx, hy = terrain.sweep_ground(x0, y0, x1, y1)
+
+    # Densely sampled path: touching the ground anywhere must be a hit
+    samples = np.linspace(0.0, 1.0, 801)[:, None]
+    xs = x0 + (x1 - x0) * samples
+    ys = y0 + (y1 - y0) * samples
+    below = ys >= terrain._ground_along(xs.ravel()).reshape(xs.shape)
+    touched = below.any(axis=0)
+    assert not (touched & ~hit).any()
+
+    # Contacts lie on the ground, at the parameter reported, before any sampled contact
+    assert np.allclose(hy[hit], terrain._ground_along(hx[hit]), atol=1e-3)
+    assert np.allclose(hx, x0 + (x1 - x0) * t)
+    first_sampled = np.where(touched, samples[np.argmax(below, axis=0), 0], 1.0)
+    assert (t[touched] <= first_sampled[touched] + 1e-9).all()
+    assert (t[~hit] == 1.0).all()
+
+
+def test_sweep_ground_cannot_tunnel_through_a_thin_peak(terrain):
+    terrain.points = [(0, 500), (100, 500), (101, 300), (102, 500), (400, 500)]
+    terrain.cave_floor = []
+    terrain._build_height_index()
+    # One long step straight through the 2 px wide spike, well above the flat ground
+    hit, t, hx, hy = terrain.sweep_ground([0.0], [400.0], [400.0], [400.0])
+    assert hit[0]
+    assert 100 < hx[0] < 101
+    assert hy[0] == pytest.approx(400.0)
+
+
+def test_sweep_ground_starting_below_ground_hits_at_once(terrain):
+    x = terrain.terrain_width / 3
+    y = terrain._ground_along(np.array([x]))[0] + 5
+    hit, t, hx, hy = terrain.sweep_ground([x], [y], [x + 50], [y - 200])
+    assert hit[0]
+    assert t[0] == 0.0
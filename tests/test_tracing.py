@@ -0,0 +1,78 @@
+import json
+import threading
+import pytest
+from tracing import Tracer, tracer, traced, span, instant, counter
+
+
+@pytest.fixture
+def trace(tmp_path):
+    """Trace the test body; yields a function that stops the tracer and returns the parsed file"""
+    path = tmp_path / 'trace.json'
+    tracer.start(str(path))
+
+    def finish():
+        tracer.stop()
+        return json.loads(path.read_text())
+    yield finish
+    tracer.enabled = False
+
+
+def test_nothing_is_recorded_while_disabled():
+    assert not tracer.enabled
+    with span('idle') as first, span('idle') as second:
+        pass
+    assert first is second  # The shared no-op span
+    instant('ignored')
+    assert tracer.events == []
+
+
+def test_trace_event_format(trace):
+    @traced('outer', 'test')
+    def outer():
+        with span('inner', 'test', size=3):
+            pass
+        instant('burst', 'test', count=2)
+        counter('entities', goblins=5, projectiles=1)
+
+    def work():
+        with span('worker span'):
+            pass
+
+    outer()
+    worker = threading.Thread(target=work, name='worker')
+    worker.start()
+    worker.join()
+    data = trace()
+
+    events = data['traceEvents']
+    assert data['displayTimeUnit'] == 'ms'
+    assert data['otherData'] == {'dropped_events': 0}
+    meta = {(e['name'], e['tid']): e['args']['name'] for e in events if e['ph'] == 'M'}
+    assert meta[('thread_name', threading.main_thread().ident)] == 'main'
+    assert ('process_name', 0) in meta
+
+    by_name = {e['name']: e for e in events if e['ph'] != 'M'}
+    outer_event, inner_event = by_name['outer'], by_name['inner']
+    assert outer_event['ph'] == inner_event['ph'] == 'X'
+    assert outer_event['cat'] == 'test'
+    assert inner_event['args'] == {'size': 3}
+    # Timestamps are microseconds from the start of the trace; spans nest
+    assert 0 <= outer_event['ts'] <= inner_event['ts']
+    assert inner_event['ts'] + inner_event['dur'] <= outer_event['ts'] + outer_event['dur'] + 0.002
+    assert by_name['burst']['ph'] == 'i' and by_name['burst']['s'] == 't'
+    assert by_name['burst']['args'] == {'count': 2}
+    assert by_name['entities']['ph'] == 'C'
+    assert by_name['entities']['args'] == {'goblins': 5, 'projectiles': 1}
+    assert by_name['worker span']['tid'] == worker.ident != outer_event['tid']
+
+
+def test_events_past_the_limit_are_counted_as_dropped(tmp_path, monkeypatch):
+    monkeypatch.setattr(Tracer, 'MAX_EVENTS', 2)
+    local = Tracer()
+    local.start(str(tmp_path / 'small.json'))
+    for i in range(5):
+        local.instant(f'event {i}')
+    local.stop()
+    data = json.loads((tmp_path / 'small.json').read_text())
+    assert [e['name'] for e in data['traceEvents'] if e['ph'] == 'i'] == ['event 0', 'event 1']
+    assert data['otherData'] == {'dropped_events': 3}
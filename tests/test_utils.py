@@ -0,0 +1,111 @@
+import pygame
+import pytest
+import utils
+from utils import classify_alpha, normalize_surface, palettize_surface, thisdir
+
+ASSETS = ('tree.png', 'pine_tree.png', 'bush.png', 'flower.png', 'grass.png', 'dirt.png', 'stone.png',
+          'cloud.png', 'goblin.png', 'base_sheet_character.png')
+BACKGROUND = (10, 200, 30)
+
+
+def composite(surface):
+    """Pixels of surface blitted over a plain background, as bytes"""
+    background = pygame.Surface(surface.get_size()).convert()
+    background.fill(BACKGROUND)
+    background.blit(surface, (0, 0))
+    return pygame.image.tobytes(background, 'RGB')
+
+
+def sprite(pixels):
+    """A per-pixel alpha surface from rows of RGBA tuples"""
+    surface = pygame.Surface((len(pixels[0]), len(pixels)), pygame.SRCALPHA)
+    for y, row in enumerate(pixels):
+        for x, rgba in enumerate(row):
+            surface.set_at((x, y), rgba)
+    return surface
+
+
+def load(name):
+    return pygame.image.load(thisdir / 'assets' / name).convert_alpha()
+
+
+def test_classify_alpha(display):
+    assert classify_alpha(sprite([[(1, 2, 3, 255), (4, 5, 6, 255)]])) == 'opaque'
+    assert classify_alpha(sprite([[(1, 2, 3, 255), (4, 5, 6, 0)]])) == 'binary'
+    assert classify_alpha(sprite([[(1, 2, 3, 255), (4, 5, 6, 128)]])) == 'alpha'
+
+
+def test_normalize_picks_the_cheapest_format(display):
+    opaque = normalize_surface(sprite([[(1, 2, 3, 255), (4, 5, 6, 255)]]))
+    assert not opaque.get_flags() & pygame.SRCALPHA
+    assert opaque.get_colorkey() is None
+
+    binary = normalize_surface(sprite([[(1, 2, 3, 255), (4, 5, 6, 0)]]))
+    assert not binary.get_flags() & pygame.SRCALPHA
+    assert binary.get_colorkey() is not None
+
+    partial = normalize_surface(sprite([[(1, 2, 3, 255), (4, 5, 6, 128)]]))
+    assert partial.get_flags() & pygame.SRCALPHA
+
+
+def test_normalize_skips_colour_keys_the_sprite_uses(display):
+    # Magenta is the first candidate, but it is a visible colour here
+    surface = sprite([[(255, 0, 255, 255), (4, 5, 6, 0)]])
+    normalized = normalize_surface(surface)
+    assert normalized.get_colorkey()[:3] != (255, 0, 255)
+    assert composite(normalized) == composite(surface)
+
+
+@pytest.mark.parametrize('name', ASSETS)
+def test_normalize_draws_assets_identically(display, name):
+    surface = load(name)
+    assert composite(normalize_surface(surface, name)) == composite(surface)
+
+
+@pytest.mark.parametrize('name', ASSETS)
+def test_exact_palettize_draws_assets_identically(display, monkeypatch, name):
+    monkeypatch.setattr(utils, 'PALETTE_ALPHA_THRESHOLD', None)
+    monkeypatch.setattr(utils, 'PALETTE_QUANTIZE', False)
+    surface = load(name)
+    compact = palettize_surface(surface, name)
+    if compact is None:
+        assert utils._palette_stats[name]['reason']
+    else:
+        assert compact.get_bitsize() == 8
+        assert composite(compact) == composite(surface)
+
+
+def test_palettize_keeps_partial_alpha_and_many_colours(display, monkeypatch):
+    monkeypatch.setattr(utils, 'PALETTE_ALPHA_THRESHOLD', None)
+    monkeypatch.setattr(utils, 'PALETTE_QUANTIZE', False)
+    assert palettize_surface(sprite([[(1, 2, 3, 255), (4, 5, 6, 128)]]), 'partial') is None
+    assert utils._palette_stats['partial']['reason'] == 'partial alpha'
+
+    colourful = sprite([[(x, y, 7, 255) for x in range(20)] for y in range(20)])
+    assert palettize_surface(colourful, 'colourful') is None
+    assert utils._palette_stats['colourful']['reason'] == '400 colours'
+
+
+def test_palettize_alpha_threshold(display, monkeypatch):
+    monkeypatch.setattr(utils, 'PALETTE_ALPHA_THRESHOLD', 128)
+    surface = sprite([[(200, 10, 10, 255), (10, 200, 10, 200), (10, 10, 200, 100)]])
+    compact = palettize_surface(surface)
+    assert compact is not None
+    # At or above the threshold: drawn fully opaque; below it: not drawn at all
+    expected = sprite([[(200, 10, 10, 255), (10, 200, 10, 255), (10, 10, 200, 0)]])
+    assert composite(compact) == composite(expected)
+
+
+def test_palettize_quantize(display, monkeypatch):
+    monkeypatch.setattr(utils, 'PALETTE_ALPHA_THRESHOLD', None)
+    monkeypatch.setattr(utils, 'PALETTE_QUANTIZE', True)
+    surface = sprite([[(x * 12, y * 12, 7, 255) for x in range(20)] for y in range(20)])
+    compact = palettize_surface(surface)
+    assert compact is not None
+    assert len({tuple(compact.get_at((x, y))) for x in range(20) for y in range(20)}) <= 255
+    # Dropping low bits only ever rounds a channel down, by less than 2 ** (8 - 4)
+    for x in range(20):
+        for y in range(20):
+            original = surface.get_at((x, y))
+            quantized = compact.get_at((x, y))
+            assert all(0 <= a - b < 16 for a, b in zip(original[:3], quantized[:3]))
@@ -0,0 +1,181 @@
+"""
+Span instrumentation exported as Chrome trace_event JSON.
+
+Wrap hot code in spans, either as a decorator or a context manager:
+
+    @traced('Terrain.draw')
+    def draw(self, screen, camera_x): ...
+
+    with span('spawn goblins', count=n):
+        ...
+
+Also available: instant events (explosion bursts, respawns) and counters
+(entity counts). Nothing is recorded until tracer.start() is called (F10
+in game, or settings.TRACE_SPANS at launch). Until then a span costs one
+flag check. tracer.stop() writes a file that chrome://tracing or
+https://ui.perfetto.dev can open.
+"""
+import json
+import os
+import threading
+import time
+from functools import wraps
+from settings import DEBUG_MODE
+
+
+class Tracer:
+    """Collects trace events in memory while enabled and writes them as trace_event JSON"""
+    MAX_EVENTS = 2000000  # Stop collecting (and count drops) past this many events
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.dropped = 0
+        self.path = None
+        self._origin = 0.0
+        self._pid = os.getpid()
+
+    def start(self, path):
+        """Start collecting events for a trace to be written to path"""
+        self.events = []
+        self.dropped = 0
+        self.path = path
+        self._origin = time.perf_counter()
+        self.enabled = True
+        if DEBUG_MODE:
+            print(f"Tracing to {path}")
+
+    def stop(self):
+        """Stop collecting and write the trace; returns the path written (or None)"""
+        if not self.enabled:
+            return None
+        self.enabled = False
+        path = self.path
+        self.write(path)
+        self.events = []
+        return path
+
+    def _add(self, event):
+        if len(self.events) < self.MAX_EVENTS:
+            self.events.append(event)
+        else:
+            self.dropped += 1
+
+    def complete(self, name, cat, start, end, args=None):
+        """Record a span that ran from start to end (time.perf_counter seconds)"""
+        if self.enabled:
+            self._add(('X', name, cat, start, end - start, threading.get_ident(), args))
+
+    def instant(self, name, cat='game', **args):
+        """Record a point-in-time event (shown as a marker across the thread)"""
+        if self.enabled:
+            self._add(('i', name, cat, time.perf_counter(), 0.0, threading.get_ident(), args or None))
+
+    def counter(self, name, **values):
+        """Record counter values (each keyword becomes a stacked series)"""
+        if self.enabled:
+            self._add(('C', name, 'counter', time.perf_counter(), 0.0, threading.get_ident(), values))
+
+    def write(self, path):
+        """Write the collected events as a Chrome trace_event JSON file"""
+        origin = self._origin
+        pid = self._pid
+        trace_events = [{'ph': 'M', 'name': 'process_name', 'pid': pid, 'tid': 0,
+                         'args': {'name': 'Mystic Realm'}}]
+        thread_names = {threading.main_thread().ident: 'main'}
+        for thread in threading.enumerate():
+            thread_names.setdefault(thread.ident, thread.name)
+        for ident, name in thread_names.items():
+            trace_events.append({'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': ident,
+                                 'args': {'name': name}})
+
+        for ph, name, cat, start, duration, tid, args in self.events:
+            event = {'ph': ph, 'name': name, 'cat': cat, 'pid': pid, 'tid': tid,
+                     'ts': round((start - origin) * 1e6, 3)}
+            if ph == 'X':
+                event['dur'] = round(duration * 1e6, 3)
+            elif ph == 'i':
+                event['s'] = 't'
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms',
+                       'otherData': {'dropped_events': self.dropped}}, f)
+        if DEBUG_MODE:
+            print(f"Trace written to {path}: {len(self.events)} events"
+                  f"{f', {self.dropped} dropped' if self.dropped else ''}")
+
+
+# The process-wide tracer
+tracer = Tracer()
+
+
+class _Span:
+    """Context manager recording one complete event"""
+    __slots__ = ('name', 'cat', 'args', 'start')
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        tracer.complete(self.name, self.cat, self.start, time.perf_counter(), self.args)
+        return False
+
+
+class _NullSpan:
+    """Shared do-nothing span handed out while tracing is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, cat='game', **args):
+    """Context manager timing its body as a span (a shared no-op while tracing is off)"""
+    if not tracer.enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args or None)
+
+
+def traced(name=None, cat='game'):
+    """Decorator timing every call of a function as a span"""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.complete(span_name, cat, start, time.perf_counter())
+        return wrapper
+    return decorate
+
+
+def instant(name, cat='game', **args):
+    tracer.instant(name, cat, **args)
+
+
+def counter(name, **values):
+    tracer.counter(name, **values)
@@ -1,19 +1,181 @@
+import sys
 import pygame
-from settings import DEBUG_MODE
+from settings import DEBUG_MODE, PALETTE_SURFACES, PALETTE_ALPHA_THRESHOLD, PALETTE_QUANTIZE
+from tracing import traced
+from memory_stats import track_surface
+from asset_loader import load_image
 import pathlib
 
 thisdir = pathlib.Path(__file__).parent.resolve()   
 
+# Colour keys tried (in order) for sprites with binary transparency.
+# The first one that no visible pixel of the sprite uses is picked.
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (1, 2, 3), (254, 1, 253))
+
+
+def classify_alpha(surface):
+    """
+    Work out how much of the alpha channel a surface actually needs.
+    
+    Returns:
+        'opaque' if every pixel is fully opaque, 'binary' if every pixel is
+        either fully opaque or fully transparent, otherwise 'alpha'
+    """
+    width, height = surface.get_size()
+    opaque = pygame.mask.from_surface(surface, 254).count()
+    if opaque == width * height:
+        return 'opaque'
+    visible = pygame.mask.from_surface(surface, 0).count()
+    return 'binary' if opaque == visible else 'alpha'
+
+
+# Per-asset results of palettize_surface(): name -> dict(before, after, reason)
+_palette_stats = {}
+
+
+def palettize_surface(surface, name=None):
+    """
+    Store a sprite as an 8-bit palette-indexed surface with a colour key.
+    
+    Only sprites with at most 255 opaque colours and no partially transparent
+    pixels qualify, since an 8-bit surface cannot hold per-pixel alpha.
+    PALETTE_ALPHA_THRESHOLD and PALETTE_QUANTIZE relax both limits at the
+    cost of hard edges and fewer colours.
+    
+    Args:
+        surface: Source surface (per-pixel alpha or opaque)
+        name: Optional name used in palette_report()
+        
+    Returns:
+        The 8-bit surface, or None if the sprite does not qualify
+    """
+    width, height = surface.get_size()
+    before = width * height * 4
+    if name is None:
+        name = f"<surface {width}x{height}>"
+    
+    if PALETTE_ALPHA_THRESHOLD is None and classify_alpha(surface) == 'alpha':
+        _palette_stats[name] = {'before': before, 'after': before, 'reason': 'partial alpha'}
+        return None
+    opaque_alpha = 255 if PALETTE_ALPHA_THRESHOLD is None else PALETTE_ALPHA_THRESHOLD
+    
+    # Collect the distinct RGBA values in one pass over the raw pixel data
+    pixels = memoryview(pygame.image.tobytes(surface, 'RGBA')).cast('I')
+    colours = {}
+    for pixel in set(pixels):
+        r, g, b, a = pixel.to_bytes(4, sys.byteorder)
+        if a >= opaque_alpha:
+            colours[pixel] = (r, g, b)
+    count = len(set(colours.values()))
+    if count > 255 and PALETTE_QUANTIZE:
+        for bits in (7, 6, 5, 4):
+            mask = (0xff << (8 - bits)) & 0xff
+            quantized = {pixel: (r & mask, g & mask, b & mask) for pixel, (r, g, b) in colours.items()}
+            if len(set(quantized.values())) <= 255:
+                colours = quantized
+                count = len(set(colours.values()))
+                break
+    if count > 255:
+        _palette_stats[name] = {'before': before, 'after': before, 'reason': f'{count} colours'}
+        return None
+    
+    key = next((c for c in COLORKEY_CANDIDATES if c not in colours.values()), None)
+    if key is None:
+        _palette_stats[name] = {'before': before, 'after': before, 'reason': 'no free colour key'}
+        return None
+    
+    # Build the index buffer ourselves: SDL's 32 -> 8 bit blit quantises through
+    # a 3-3-2 table and would not hit the exact palette entries.
+    # Index 0 is the colour key, every transparent pixel maps to it.
+    palette = [key] + sorted(set(colours.values()))
+    index_of = {rgb: i for i, rgb in enumerate(palette)}
+    lookup = {pixel: index_of[rgb] for pixel, rgb in colours.items()}
+    indices = bytes(lookup.get(pixel, 0) for pixel in pixels)
+    compact = pygame.image.frombytes(indices, (width, height), 'P')
+    compact.set_palette(palette)
+    compact.set_colorkey(key, pygame.RLEACCEL)
+    
+    _palette_stats[name] = {'before': before, 'after': compact.get_pitch() * height + 256 * 4, 'reason': None}
+    return compact
+
+
+def palette_report():
+    """
+    Summarise palettize_surface() results, largest saving first.
+    
+    Returns:
+        List of (name, bytes_before, bytes_after, bytes_saved, reason_kept_true_colour)
+    """
+    rows = [(name, s['before'], s['after'], s['before'] - s['after'], s['reason'])
+            for name, s in _palette_stats.items()]
+    rows.sort(key=lambda row: row[3], reverse=True)
+    return rows
+
+
+def print_palette_report():
+    """Print palette_report() as a table"""
+    rows = palette_report()
+    print(f"{'asset':40s} {'before':>10s} {'after':>10s} {'saved':>10s}  kept true colour because")
+    for name, before, after, saved, reason in rows:
+        print(f"{name:40s} {before:10d} {after:10d} {saved:10d}  {reason or ''}")
+    print(f"{'total':40s} {sum(r[1] for r in rows):10d} {sum(r[2] for r in rows):10d} {sum(r[3] for r in rows):10d}")
+
+
+def normalize_surface(surface, name=None):
+    """
+    Convert a surface to the cheapest display format that still draws it identically.
+    
+    Fully opaque surfaces are converted with convert() so blits take the plain
+    copy path. Surfaces with only binary transparency are flattened onto an
+    unused colour key with RLEACCEL. Anything with partial alpha keeps its
+    per-pixel alpha. With PALETTE_SURFACES enabled, qualifying sprites are
+    stored 8-bit palette-indexed instead (see palettize_surface).
+    
+    Args:
+        surface: Surface to normalize (the display mode must already be set)
+        name: Optional asset name used in the palette report
+        
+    Returns:
+        A new pygame.Surface, or the original one if it needs per-pixel alpha
+    """
+    if PALETTE_SURFACES:
+        compact = palettize_surface(surface, name)
+        if compact is not None:
+            return compact
+    
+    kind = classify_alpha(surface)
+    if kind == 'opaque':
+        return surface.convert()
+    
+    if kind == 'binary':
+        width, height = surface.get_size()
+        transparent = width * height - pygame.mask.from_surface(surface, 0).count()
+        for key in COLORKEY_CANDIDATES:
+            keyed = pygame.Surface((width, height)).convert()
+            keyed.fill(key)
+            keyed.blit(surface, (0, 0))
+            # The key is only usable if it shows up exactly where the sprite is transparent
+            if pygame.mask.from_threshold(keyed, key, (1, 1, 1, 255)).count() == transparent:
+                keyed.set_colorkey(key, pygame.RLEACCEL)
+                return keyed
+    
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface
+    return surface.convert_alpha()
+
+
+@traced('load_sprite', 'assets')
 def load_sprite(filename):
     try:
-        img = pygame.image.load(thisdir / 'assets' / filename).convert_alpha()
-        return img
+        img = load_image(thisdir / 'assets' / filename).convert_alpha()
+        return track_surface(normalize_surface(img, filename), 'assets')
     except Exception as e:
         if DEBUG_MODE:
             raise e
             print(f"Failed to load {filename}: {e}")
         raise e
 
+@traced('load_spritesheet', 'assets')
 def load_spritesheet(filename, frame_width, frame_height, num_frames, rows=1, scale=1.0, row_offset=0):
     """
     Load a sprite sheet and split it into individual frames.
@@ -32,7 +194,7 @@ def load_spritesheet(filename, frame_width, frame_height, num_frames, rows=1, sc
     """
     try:
         # Load the sprite sheet
-        sheet = pygame.image.load(thisdir / 'assets' / filename).convert_alpha()
+        sheet = load_image(thisdir / 'assets' / filename).convert_alpha()
         
         frames = []
         frames_per_row = num_frames // rows if rows > 0 else num_frames
@@ -58,7 +220,7 @@ def load_spritesheet(filename, frame_width, frame_height, num_frames, rows=1, sc
                     if new_width > 0 and new_height > 0:  # Ensure valid dimensions
                         frame = pygame.transform.scale(frame, (new_width, new_height))
                 
-                frames.append(frame)
+                frames.append(track_surface(frame, 'assets'))
                 
         return frames
     except Exception as e: